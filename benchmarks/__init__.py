@@ -0,0 +1,14 @@
+"""Benchmarks for relaton_bib.
+
+Run a benchmark from the repository root, e.g.::
+
+    python -m benchmarks.bench_xml_parser --items 100000
+"""
+import os
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        os.pardir, "tests", "examples")
+
+
+def example(name: str) -> str:
+    return os.path.join(EXAMPLES, name)
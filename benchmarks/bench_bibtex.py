@@ -0,0 +1,91 @@
+"""Compare BibTeX output with `bibtexparser` writer and native emitter
+
+`tests/examples/bib_item.xml` is written `--items` times to /dev/null:
+
+- writer -- `to_bibtex_entry` rendered with `BibTexWriter`
+- native -- `to_bibtex` of every item
+- many -- `to_bibtex_many`
+
+Then the same prebuilt entry is rendered `--items` times by the writer and
+by `entry_to_bibtex` to compare the serializers alone. Time per item and
+peak of traced memory are printed.
+"""
+import argparse
+import logging
+import os
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import bibtexparser
+from bibtexparser.bibdatabase import BibDatabase
+
+from relaton_bib import from_xml, to_bibtex_many
+from relaton_bib.bibtex_writer import entry_to_bibtex, make_bibtex_writer
+
+from . import example
+
+WRITER = make_bibtex_writer()
+
+
+def _dumps(entry):
+    bibtex = BibDatabase()
+    bibtex.entries.append(entry)
+    return bibtexparser.dumps(bibtex, WRITER)
+
+
+def writer(items, f):
+    for item in items:
+        f.write(_dumps(item.to_bibtex_entry()))
+
+
+def native(items, f):
+    for item in items:
+        f.write(item.to_bibtex())
+
+
+def many(items, f):
+    to_bibtex_many(items, f)
+
+
+def writer_entry(entries, f):
+    for entry in entries:
+        f.write(_dumps(entry))
+
+
+def native_entry(entries, f):
+    for entry in entries:
+        f.write(entry_to_bibtex(entry))
+
+
+def _run(func, data, count):
+    with open(os.devnull, "w") as f:
+        start = time.perf_counter()
+        func(data, f)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        func(data[:1000], f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    print(f"{func.__name__:12}: {elapsed / count * 1e6:.1f} us/item, "
+          f"peak {peak / 2 ** 10:.1f} KiB writing 1000 items")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    item = from_xml(ET.parse(example("bib_item.xml")))
+    items = [item] * args.items
+    entries = [item.to_bibtex_entry()] * args.items
+
+    for func in (writer, native, many):
+        _run(func, items, args.items)
+    for func in (writer_entry, native_entry):
+        _run(func, entries, args.items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare `from_bibtex` with streaming `iter_from_bibtex` and workers
+
+`tests/examples/misc.bib` is repeated `--items` times with distinct ids
+into a temporary file. The entries are read with `bibtexparser` and with
+`iter_bibtex_entries`, then converted to bibitems with `from_bibtex` and
+`iter_from_bibtex` and with `from_bibtex` in `--workers` processes
+(`os.cpu_count()` if not given). Time per entry and peak of traced memory
+(of a separate run) are printed.
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+import bibtexparser
+from bibtexparser.bparser import BibTexParser
+
+from relaton_bib import from_bibtex, iter_from_bibtex
+from relaton_bib.bibtex_parser import iter_bibtex_entries
+
+from . import example
+
+
+def bibtexparser_entries(path):
+    with open(path, encoding="utf-8") as f:
+        for _ in bibtexparser.loads(f.read(),
+                                    BibTexParser(common_strings=True)).entries:
+            pass
+
+
+def stream_entries(path):
+    for _ in iter_bibtex_entries(path):
+        pass
+
+
+def from_bibtex_items(path):
+    with open(path, encoding="utf-8") as f:
+        for _ in from_bibtex(f.read()).values():
+            pass
+
+
+def stream_items(path):
+    for _ in iter_from_bibtex(path):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    def workers_items(path):
+        with open(path, encoding="utf-8") as f:
+            for _ in from_bibtex(f.read(), workers=args.workers).values():
+                pass
+
+    with open(example("misc.bib"), encoding="utf-8") as f:
+        entry = f.read()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "items.bib")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.items):
+                f.write(entry.replace("{ISOTC211,", f"{{ISOTC211-{i},", 1))
+
+        for func in (bibtexparser_entries, stream_entries, from_bibtex_items,
+                     stream_items, workers_items):
+            start = time.perf_counter()
+            func(path)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            func(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{func.__name__:20}: "
+                  f"{elapsed / args.items * 1e6:.1f} us/entry, "
+                  f"peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare binary, JSON and XML encodings of bibitems
+
+`tests/examples/bib_item.xml` and `tests/examples/bibdata_item.xml` are
+encoded and decoded `--items` times with each encoding. The `raw` decode
+columns only turn bytes into Python values or elements, without building
+`BibliographicItem`.
+"""
+import argparse
+import logging
+import time
+
+from relaton_bib import binary, from_json, from_xml
+from relaton_bib import relaton_bib
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _time(func, items):
+    start = time.perf_counter()
+    for _ in range(items):
+        func()
+    return (time.perf_counter() - start) / items * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(f"{'':24}{'size':>8}{'encode':>10}{'decode':>10}{'raw':>10}")
+    for name in ["bib_item.xml", "bibdata_item.xml"]:
+        with open(example(name), "rb") as f:
+            item = from_xml(xml_backend.fromstring(f.read()))
+        xml = xml_backend.tostring(item.to_xml())
+        data = item.to_json()
+        bin = binary.dumps(item)
+        cases = [
+            ("xml", xml,
+             lambda: xml_backend.tostring(item.to_xml()),
+             lambda: from_xml(xml_backend.fromstring(xml)),
+             lambda: xml_backend.fromstring(xml)),
+            ("json", data.encode("utf-8"),
+             item.to_json,
+             lambda: from_json(data),
+             lambda: relaton_bib.json_loads(data)),
+            ("binary", bin,
+             lambda: binary.dumps(item),
+             lambda: binary.loads(bin),
+             lambda: binary.decode(bin)),
+        ]
+        for codec, encoded, enc, dec, raw in cases:
+            print(f"{name + ' ' + codec:24}{len(encoded):8}"
+                  f"{_time(enc, args.items):10.1f}"
+                  f"{_time(dec, args.items):10.1f}"
+                  f"{_time(raw, args.items):10.1f}")
+    print("size in bytes, time in us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Microbenchmarks of date parsing
+
+Times `parse_date` and `BibliographicDate.part` for typical inputs, with
+and without results cached.
+"""
+import argparse
+import logging
+import timeit
+
+from relaton_bib import BibliographicDate
+from relaton_bib import bibliographic_date, relaton_bib
+
+INPUTS = ["2012-02-11", "2012-02", "2012", "February 11, 2012",
+          "February 2012"]
+
+
+def _report(name, func, number, clear=None):
+    def uncached():
+        clear()
+        func()
+
+    cached = timeit.timeit(func, number=number) / number * 1e6
+    result = f"{name:32}{cached:10.2f}"
+    if clear:
+        uncached = timeit.timeit(uncached, number=number) / number * 1e6
+        result += f"{uncached:10.2f}"
+    print(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(f"{'':32}{'cached':>10}{'uncached':>10}")
+    for value in INPUTS:
+        _report(f"parse_date({value!r})",
+                lambda: relaton_bib.parse_date(value), args.number,
+                relaton_bib._parse_date.cache_clear)
+    date = BibliographicDate(type="published", on="2012-02-11")
+
+    def clear():
+        bibliographic_date._date_components.cache_clear()
+        date._components = None
+
+    _report("BibliographicDate.part()", date.part, args.number, clear)
+    _report("BibliographicDate.sort_key()", date.sort_key, args.number,
+            clear)
+    _report("BibliographicDate()",
+            lambda: BibliographicDate(type="published", on="2012-02-11"),
+            args.number)
+    print("time in us/call")
+
+
+if __name__ == "__main__":
+    main()
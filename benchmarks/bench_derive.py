@@ -0,0 +1,58 @@
+"""Time derived views of item with relations, with and without cache
+
+`tests/examples/bibdata_item.xml` gets `--relations` more relations to
+copies of itself, then `to_all_parts` and `to_most_recent_reference` are
+called `--number` times each, without and with
+`BibliographicItem.derived_cache`. `copy.deepcopy` of the item is timed
+too, it's what the first two cost when they copy the whole item.
+"""
+import argparse
+import copy
+import logging
+import time
+
+from relaton_bib import BibliographicItem, DerivedCache, DocumentRelation, \
+    from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _time(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--relations", type=int, default=60)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bibdata_item.xml"), "rb") as f:
+        xml = xml_backend.fromstring(f.read())
+    item = from_xml(xml)
+    for _ in range(args.relations):
+        item.relation.append(DocumentRelation(type="updates",
+                                              bibitem=from_xml(xml)))
+
+    cases = [("to_all_parts", item.to_all_parts),
+             ("to_most_recent_reference", item.to_most_recent_reference)]
+
+    print(f"relations: {len(item.relation)}")
+    elapsed = _time(lambda: copy.deepcopy(item), args.number)
+    print(f"{'deepcopy':24}: {elapsed:10.1f} us/call")
+    for name, func in cases:
+        uncached = _time(func, args.number)
+        BibliographicItem.derived_cache = DerivedCache()
+        cached = _time(func, args.number)
+        BibliographicItem.derived_cache = None
+        print(f"{name:24}: {uncached:10.1f} us/call, cached {cached:8.2f} "
+              "us/call")
+
+
+if __name__ == "__main__":
+    main()
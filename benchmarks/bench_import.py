@@ -0,0 +1,50 @@
+"""Import time of the package and of its entry points
+
+Every statement is run `--number` times in a fresh interpreter with
+`-X importtime`, the best cumulative time of the top level import is
+printed without the time of interpreter start up (imports of `pass`).
+"""
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import relaton_bib",
+    "from relaton_bib import from_xml",
+    "from relaton_bib import from_dict",
+    "from relaton_bib import to_bibtex_many",
+    "from relaton_bib import from_bibtex; from_bibtex('')",
+]
+
+
+def import_time(statement):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             statement], capture_output=True, text=True,
+                            check=True).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith(" ") or name.startswith("  "):
+            continue  # not a top level import
+        if cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    def best(statement):
+        return min(import_time(statement) for _ in range(args.number))
+
+    startup = best("pass")
+    for statement in STATEMENTS:
+        print(f"{statement:52}: {(best(statement) - startup) / 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
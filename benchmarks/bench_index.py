@@ -0,0 +1,101 @@
+"""Compare lookups of BibliographyIndex with scans of a list of items
+
+A corpus of `--items` copies of `tests/examples/bib_item.xml` with
+distinct identifiers, docnumbers, structured identifiers, ICS codes and
+technical committees is made. Then `--lookups` random values of every key
+are looked up by scanning the list and with `BibliographyIndex`.
+"""
+import argparse
+import copy
+import logging
+import random
+import time
+
+from relaton_bib import BibliographyIndex, DocumentIdentifier, \
+    EditorialGroup, ICS, StructuredIdentifier, \
+    StructuredIdentifierCollection, TechnicalCommittee, WorkGroup, from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _corpus(item, size):
+    items = []
+    for i in range(size):
+        copied = copy.copy(item)
+        copied.id = f"ID{i}"
+        copied.docidentifier = [DocumentIdentifier(id=f"DOC {i}",
+                                                   type="ISO")]
+        copied.docnumber = str(i)
+        copied.structuredidentifier = StructuredIdentifierCollection([
+            StructuredIdentifier(docnumber=str(i // 10), agency=["ISO"],
+                                 partnumber=str(i % 10))])
+        copied.ics = [ICS(code=f"{i % 100:02}.{i % 7:03}", text="ICS")]
+        copied.editorialgroup = EditorialGroup([TechnicalCommittee(
+            WorkGroup(name=f"TC {i % 300}", number=i % 300))])
+        items.append(copied)
+    return items
+
+
+def _time(func, values):
+    start = time.perf_counter()
+    results = [func(*value) for value in values]
+    return (time.perf_counter() - start) / len(values) * 1e6, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bib_item.xml"), "rb") as f:
+        item = from_xml(xml_backend.fromstring(f.read()))
+    items = _corpus(item, args.items)
+
+    start = time.perf_counter()
+    index = BibliographyIndex(items)
+    build = (time.perf_counter() - start) * 1e3
+    print(f"items: {len(index)}, index built in {build:.1f} ms")
+
+    sample = random.sample(items, args.lookups)
+    cases = [
+        ("docidentifier",
+         [(i.docidentifier[0].id, "ISO") for i in sample],
+         lambda id, type: [i for i in items if any(
+             d.id == id and d.type == type for d in i.docidentifier)],
+         index.by_docidentifier),
+        ("docnumber", [(i.docnumber,) for i in sample],
+         lambda n: [i for i in items if i.docnumber == n],
+         index.by_docnumber),
+        ("structuredidentifier",
+         [(i.structuredidentifier[0].docnumber,
+           i.structuredidentifier[0].partnumber) for i in sample],
+         lambda n, part: [i for i in items if any(
+             s.docnumber == n and s.partnumber == part
+             for s in i.structuredidentifier or ())],
+         lambda n, part: index.by_structuredidentifier(docnumber=n,
+                                                       partnumber=part)),
+        ("ics", [(i.ics[0].code,) for i in sample],
+         lambda code: [i for i in items
+                       if any(c.code == code for c in i.ics)],
+         index.by_ics),
+        ("technical committee",
+         [(i.editorialgroup.technical_committee[0].workgroup.name,)
+          for i in sample],
+         lambda name: [i for i in items if i.editorialgroup and any(
+             tc.workgroup.name == name
+             for tc in i.editorialgroup.technical_committee)],
+         index.by_technical_committee),
+    ]
+    for name, values, scan, lookup in cases:
+        scanned, expected = _time(scan, values)
+        looked_up, results = _time(lookup, values)
+        assert results == expected
+        print(f"{name:20}: scan {scanned:10.1f} us/lookup, index "
+              f"{looked_up:6.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare XML and JSON as a cache encoding of bibitems
+
+`tests/examples/bib_item.xml` is encoded and decoded `--items` times with
+XML (`to_xml` + `tostring`, `fromstring` + `from_xml`) and with JSON
+(`to_json`, `from_json`). JSON uses `orjson` if it's installed.
+"""
+import argparse
+import logging
+import time
+
+from relaton_bib import from_json, from_xml
+from relaton_bib import relaton_bib
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _time(func, items):
+    start = time.perf_counter()
+    for _ in range(items):
+        func()
+    return (time.perf_counter() - start) / items * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bib_item.xml"), "rb") as f:
+        item = from_xml(xml_backend.fromstring(f.read()))
+    xml = xml_backend.tostring(item.to_xml())
+    data = item.to_json()
+
+    print(f"XML  size: {len(xml)} bytes, JSON size: {len(data)} bytes")
+    cases = [
+        ("xml encode", lambda: xml_backend.tostring(item.to_xml())),
+        ("xml decode", lambda: from_xml(xml_backend.fromstring(xml))),
+        ("to_dict", item.to_dict),
+        ("json encode", item.to_json),
+        ("json decode", lambda: from_json(data)),
+    ]
+    for name, func in cases:
+        print(f"{name:12}: {_time(func, args.items):8.1f} us/item")
+
+    if relaton_bib.orjson:
+        relaton_bib.orjson = None
+        elapsed = _time(lambda: from_json(data), args.items)
+        print(f"{'json decode':12}: {elapsed:8.1f} us/item (stdlib json)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compare `language_code` with looking names up in `iso639` every time
+
+Ten language names are resolved `--number` times each. Time of the first
+call of `language_code`, which imports `iso639` and builds the table, is
+printed separately.
+"""
+import argparse
+import time
+
+from relaton_bib.languages import language_code
+
+NAMES = ["english", "french", "german", "russian", "spanish", "italian",
+         "japanese", "chinese", "arabic", "portuguese"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    language_code("english")
+    print(f"first call: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    import iso639
+
+    def iso639_lookup(name):
+        return iso639.languages.get(name=name.capitalize()).alpha2
+
+    count = args.number * len(NAMES)
+    for func in (iso639_lookup, language_code):
+        start = time.perf_counter()
+        for _ in range(args.number):
+            for name in NAMES:
+                func(name)
+        elapsed = time.perf_counter() - start
+        print(f"{func.__name__:14}: {elapsed / count * 1e9:.0f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare eager and lazy `from_xml` for items only listed by id and title
+
+`tests/examples/bib_item.xml` is decoded `--items` times, then `id`,
+`docidentifier`, `title` and `date` of every item are read. Memory is
+traced with `tracemalloc`, use the default stdlib ElementTree `--backend`
+to trace elements too, lxml allocates them outside of Python heap.
+"""
+import argparse
+import logging
+import time
+import tracemalloc
+
+from relaton_bib import from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _run(data, items, lazy):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = []
+    for _ in range(items):
+        item = from_xml(xml_backend.fromstring(data), lazy=lazy)
+        item.id, item.docidentifier, item.title, item.date
+        result.append(item)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--backend", default=xml_backend.ETREE)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    xml_backend.use_backend(args.backend)
+    with open(example("bib_item.xml"), "rb") as f:
+        data = f.read()
+
+    for lazy in (False, True):
+        elapsed, memory = _run(data, args.items, lazy)
+        print(f"{'lazy' if lazy else 'eager':5}: "
+              f"{elapsed / args.items * 1e6:8.1f} us/item "
+              f"{memory / args.items / 1024:8.1f} KiB/item")
+
+
+if __name__ == "__main__":
+    main()
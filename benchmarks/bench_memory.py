@@ -0,0 +1,75 @@
+"""Measure memory held by decoded bibitems
+
+`tests/examples/bib_item.xml`, `bibdata_item.xml` and `bibdata_item_fr.xml`
+are decoded `--items` times each with `from_xml` and kept in a list. Memory
+is traced with `tracemalloc` and reported in bytes per item and projected
+to a corpus of `--corpus` items, together with the number of model objects
+with per-instance `__dict__`.
+"""
+import argparse
+import dataclasses
+import gc
+import logging
+import tracemalloc
+
+from relaton_bib import from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+EXAMPLES = ["bib_item.xml", "bibdata_item.xml", "bibdata_item_fr.xml"]
+
+
+def _objects(obj, seen):
+    """Count dataclass instances and ones with `__dict__` in object graph"""
+    if id(obj) in seen:
+        return 0, 0
+    seen.add(id(obj))
+    if isinstance(obj, (list, tuple)):
+        children = obj
+        total = with_dict = 0
+    elif dataclasses.is_dataclass(obj):
+        children = [getattr(obj, f.name) for f in dataclasses.fields(obj)]
+        total, with_dict = 1, int(hasattr(obj, "__dict__"))
+    elif hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes)):
+        children = list(obj)
+        total = with_dict = 0
+    else:
+        return 0, 0
+    for child in children:
+        t, d = _objects(child, seen)
+        total += t
+        with_dict += d
+    return total, with_dict
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--corpus", type=int, default=1000000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sources = []
+    for name in EXAMPLES:
+        with open(example(name), "rb") as f:
+            sources.append(f.read())
+
+    gc.collect()
+    tracemalloc.start()
+    items = [from_xml(xml_backend.fromstring(s))
+             for _ in range(args.items) for s in sources]
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    total, with_dict = _objects(items[:len(sources)], set())
+    print(f"{len(items)} items: {memory / len(items):10.0f} bytes/item, "
+          f"{total / len(sources):.0f} objects/item, "
+          f"{with_dict / len(sources):.0f} with __dict__")
+    print(f"{args.corpus} items: "
+          f"{memory / len(items) * args.corpus / 2 ** 20:10.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
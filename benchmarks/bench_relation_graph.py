@@ -0,0 +1,93 @@
+"""Compare relation queries over a corpus with and without RelationGraph
+
+A corpus of `--items` bibitems is made, each obsoletes the previous one
+and is part of one of `--items // 100` series items. Then `--queries`
+random items are asked for items obsoleting them and for the transitive
+`partOf` closure, and series items for their parts, by scanning relations
+of items and with `RelationGraph`.
+"""
+import argparse
+import logging
+import random
+import time
+
+from relaton_bib import BibliographicItem, DocumentRelation, RelationGraph
+
+
+def _corpus(size):
+    series = [BibliographicItem(id=f"S{i}") for i in range(size // 100)]
+    items = list(series)
+    for i in range(size - len(series)):
+        relation = [DocumentRelation(type="partOf",
+                                     bibitem=series[i % len(series)])]
+        if i:
+            relation.append(DocumentRelation(
+                type="obsoletes", bibitem=BibliographicItem(id=f"I{i - 1}")))
+        items.append(BibliographicItem(id=f"I{i}", relation=relation))
+    return items
+
+
+def _obsoleted_by_scan(items, id):
+    return [item.id for item in items for rel in item.relation
+            if rel.type == "obsoletes" and rel.bibitem.id == id]
+
+
+def _part_of_scan(by_id, id):
+    seen = {id: None}
+    queue = [id]
+    for node in queue:
+        item = by_id.get(node)
+        for rel in item.relation if item else ():
+            if rel.type == "partOf" and rel.bibitem.id not in seen:
+                seen[rel.bibitem.id] = None
+                queue.append(rel.bibitem.id)
+    del seen[id]
+    return list(seen)
+
+
+def _parts_scan(items, id):
+    return [item.id for item in items for rel in item.relation
+            if rel.type == "partOf" and rel.bibitem.id == id]
+
+
+def _time(func, ids):
+    start = time.perf_counter()
+    results = [func(id) for id in ids]
+    return (time.perf_counter() - start) / len(ids) * 1e6, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    items = _corpus(args.items)
+    ids = random.sample([item.id for item in items], args.queries)
+    series = [item.id for item in items[:args.items // 100]]
+    by_id = {item.id: item for item in items}
+
+    start = time.perf_counter()
+    graph = RelationGraph(items)
+    build = (time.perf_counter() - start) * 1e3
+    print(f"items: {len(graph)}, graph built in {build:.1f} ms")
+
+    cases = [
+        ("obsoletedBy", ids, lambda id: _obsoleted_by_scan(items, id),
+         lambda id: graph.related(id, "obsoletedBy")),
+        ("partOf closure", ids, lambda id: _part_of_scan(by_id, id),
+         lambda id: graph.closure(id, "partOf")),
+        ("hasPart", series, lambda id: _parts_scan(items, id),
+         lambda id: graph.related(id, "hasPart")),
+    ]
+    for name, case_ids, scan, query in cases:
+        scanned, expected = _time(scan, case_ids)
+        queried, results = _time(query, case_ids)
+        assert results == expected
+        print(f"{name:16}: scan {scanned:10.1f} us/query, graph "
+              f"{queried:6.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
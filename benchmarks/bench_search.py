@@ -0,0 +1,106 @@
+"""Compare full-text search of SearchIndex with scans of items
+
+A corpus of `--items` bibitems is made with English and French titles,
+English abstracts and keywords of random words. Then `--queries` random
+two-word queries are run by scanning `title_for_lang` and
+`abstract_for_lang` of every item, and with `SearchIndex` as words,
+phrases and prefixes. Build time, size of `dumps` and time of `loads`
+are printed too.
+"""
+import argparse
+import logging
+import random
+import re
+import time
+
+from relaton_bib import BibliographicItem, FormattedString, \
+    LocalizedString, SearchIndex, TypedTitleString, \
+    TypedTitleStringCollection
+
+_WORD = re.compile(r"\w+")
+
+
+def _corpus(size, words, rnd):
+    def text(count):
+        return " ".join(rnd.choices(words, k=count))
+
+    items = []
+    for i in range(size):
+        items.append(BibliographicItem(
+            id=f"ID{i}",
+            title=TypedTitleStringCollection([
+                TypedTitleString(type="main", content=text(6),
+                                 language=["en"]),
+                TypedTitleString(type="main", content=text(6),
+                                 language=["fr"])]),
+            abstract=[FormattedString(content=text(60), language=["en"])],
+            keyword=[LocalizedString(content=text(1)) for _ in range(3)]))
+    return items
+
+
+def _scan(items, query):
+    """Items with all the words of query in English title or abstract"""
+    words = query.lower().split()
+    result = []
+    for item in items:
+        abstract = item.abstract_for_lang("en")
+        texts = [str(t) for t in item.title_for_lang("en")] + \
+            ([str(abstract)] if abstract else [])
+        found = set(_WORD.findall(" ".join(texts).lower()))
+        if all(w in found for w in words):
+            result.append(item.id)
+    return result
+
+
+def _time(func, queries):
+    start = time.perf_counter()
+    results = [func(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries) * 1e6, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--words", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rnd = random.Random(1)
+    words = [f"w{i}x" for i in range(args.words)]
+    items = _corpus(args.items, words, rnd)
+
+    start = time.perf_counter()
+    index = SearchIndex(items)
+    build = time.perf_counter() - start
+    print(f"items: {len(index)}, index built in {build:.1f} s")
+
+    start = time.perf_counter()
+    data = index.dumps()
+    dumped = time.perf_counter() - start
+    start = time.perf_counter()
+    loaded = SearchIndex.loads(data)
+    load = time.perf_counter() - start
+    print(f"dumps: {len(data) / 1e6:.1f} MB in {dumped:.1f} s, loads in "
+          f"{load:.2f} s")
+
+    queries = [" ".join(rnd.sample(words, 2)) for _ in range(args.queries)]
+    scanned, expected = _time(lambda q: _scan(items, q), queries)
+    queried, results = _time(
+        lambda q: sorted(id for id, _ in loaded.search(q, lang="en",
+                                                       fields=["title",
+                                                               "abstract"])),
+        queries)
+    assert results == [sorted(ids) for ids in expected]
+    print(f"{'words':8}: scan {scanned:10.1f} us/query, index "
+          f"{queried:8.1f} us/query")
+
+    for name, make in [("phrase", lambda q: f'"{q}"'),
+                       ("prefix", lambda q: f"{q[:3]}*")]:
+        elapsed, _ = _time(lambda q: loaded.search(make(q), limit=10),
+                           queries)
+        print(f"{name:8}: index {elapsed:8.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
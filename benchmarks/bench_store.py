@@ -0,0 +1,69 @@
+"""Compare startup and lookup by id of store and XML corpus
+
+A corpus of `--items` copies of `tests/examples/bib_item.xml` with distinct
+ids is written as `<documents>` XML and as store. Then it is loaded with
+`iter_from_xml` into a dict by id and opened with `BibliographyStore`, and
+`--lookups` random ids are fetched from both.
+"""
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+from relaton_bib import BibliographyStore, from_xml, iter_from_xml, \
+    write_store, write_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bib_item.xml"), "rb") as f:
+        item = from_xml(xml_backend.fromstring(f.read()))
+
+    def items():
+        for i in range(args.items):
+            item.id = f"ID{i}"
+            yield item
+
+    ids = [f"ID{random.randrange(args.items)}" for _ in range(args.lookups)]
+    with tempfile.TemporaryDirectory() as tmp:
+        xml = os.path.join(tmp, "items.xml")
+        with open(xml, "wb") as f:
+            write_xml(items(), f)
+        path = os.path.join(tmp, "items.rbst")
+        start = time.perf_counter()
+        write_store(items(), path)
+        print(f"store write : {time.perf_counter() - start:8.3f} s, "
+              f"{os.path.getsize(path)} bytes, XML {os.path.getsize(xml)}")
+
+        start = time.perf_counter()
+        corpus = {i.id: i for i in iter_from_xml(xml)}
+        print(f"xml startup : {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        for id in ids:
+            corpus[id]
+        print(f"xml lookup  : "
+              f"{(time.perf_counter() - start) / len(ids) * 1e6:8.1f} us")
+
+        start = time.perf_counter()
+        store = BibliographyStore(path)
+        print(f"store open  : {time.perf_counter() - start:8.6f} s")
+        start = time.perf_counter()
+        for id in ids:
+            store[id]
+        print(f"store lookup: "
+              f"{(time.perf_counter() - start) / len(ids) * 1e6:8.1f} us")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare normal and trusted construction of bibitems
+
+`tests/examples/bib_item.xml` is built `--items` times with `from_json`,
+`from_xml` and the constructor of `BibliographicItem` from its fields,
+with and without skipping validation (`trusted=True`,
+`BibliographicItem.construct`). Runs of `--items` alternate `--repeat`
+times and the best time of each is printed, the script fails if
+`construct` isn't faster than the constructor.
+"""
+import argparse
+import dataclasses
+import logging
+import time
+
+from relaton_bib import BibliographicItem, from_json, from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _time(func, items):
+    start = time.perf_counter()
+    for _ in range(items):
+        func()
+    return (time.perf_counter() - start) / items * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bib_item.xml"), "rb") as f:
+        xml = xml_backend.fromstring(f.read())
+    item = from_xml(xml)
+    data = item.to_json()
+    fields = {f.name: getattr(item, f.name)
+              for f in dataclasses.fields(item) if f.init}
+
+    cases = [
+        ("from_json", lambda t: from_json(data, trusted=t)),
+        ("from_xml", lambda t: from_xml(xml, trusted=t)),
+        ("constructor", lambda t: BibliographicItem.construct(**fields)
+         if t else BibliographicItem(**fields)),
+    ]
+    for name, func in cases:
+        normal, trusted = float("inf"), float("inf")
+        for _ in range(args.repeat):
+            normal = min(normal, _time(lambda: func(False), args.items))
+            trusted = min(trusted, _time(lambda: func(True), args.items))
+        if name == "constructor":
+            assert trusted < normal, "construct isn't faster"
+        print(f"{name:12}: {normal:8.1f} us/item, trusted {trusted:8.1f} "
+              f"us/item ({normal / trusted:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare XML backends on `tests/examples/bib_item.xml`
+
+For each backend the example is parsed, decoded with `from_xml`, rendered
+with `to_xml` and serialized with `xml_backend.tostring` `--items` times.
+"""
+import argparse
+import logging
+import time
+
+from relaton_bib import from_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def _time(func, items):
+    start = time.perf_counter()
+    for _ in range(items):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(example("bib_item.xml"), "rb") as f:
+        data = f.read()
+
+    for name in (xml_backend.ETREE, xml_backend.LXML):
+        xml_backend.use_backend(name)
+        item = from_xml(xml_backend.fromstring(data))
+        xml = item.to_xml()
+        steps = {
+            "parse": lambda: xml_backend.fromstring(data),
+            "parse+decode": lambda: from_xml(xml_backend.fromstring(data)),
+            "render": lambda: item.to_xml(),
+            "serialize": lambda: xml_backend.tostring(xml),
+            "render+serialize": lambda: xml_backend.tostring(item.to_xml()),
+        }
+        for step, func in steps.items():
+            elapsed = _time(func, args.items)
+            print(f"{name:5} {step:16}: "
+                  f"{elapsed / args.items * 1e6:8.1f} us/item")
+
+
+if __name__ == "__main__":
+    main()
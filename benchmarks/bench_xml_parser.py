@@ -0,0 +1,35 @@
+"""Decode `tests/examples/bib_item.xml` scaled up to many items
+
+The same parsed element is decoded `--items` times, so the numbers show the
+cost of turning an `ET.Element` into a `BibliographicItem` without the cost
+of XML tokenizing.
+"""
+import argparse
+import logging
+import time
+import xml.etree.ElementTree as ET
+
+from relaton_bib import from_xml
+
+from . import example
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    bibitem = ET.parse(example("bib_item.xml")).getroot()
+
+    start = time.perf_counter()
+    for _ in range(args.items):
+        from_xml(bibitem)
+    elapsed = time.perf_counter() - start
+
+    print(f"from_xml: {args.items} items in {elapsed:.2f}s, "
+          f"{elapsed / args.items * 1e6:.1f} us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare `write_xml` with rendering a whole `<documents>` tree
+
+`tests/examples/bib_item.xml` is written `--items` times to /dev/null,
+time and peak of traced memory are printed for both ways.
+"""
+import argparse
+import logging
+import os
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from relaton_bib import from_xml, write_xml
+from relaton_bib import xml_backend
+
+from . import example
+
+
+def tree(items, f):
+    root = xml_backend.Element("documents")
+    for item in items:
+        item.to_xml(root, {})
+    f.write(xml_backend.tostring(root))
+
+
+def stream(items, f):
+    write_xml(items, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    item = from_xml(ET.parse(example("bib_item.xml")))
+    items = [item] * args.items
+
+    for func in (tree, stream):
+        with open(os.devnull, "wb") as f:
+            tracemalloc.start()
+            start = time.perf_counter()
+            func(items, f)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"{func.__name__:6}: {elapsed:.2f}s, "
+              f"peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,92 +4,226 @@ __author__ = """Aliaksandr Babrykovich"""
 __email__ = 'abobrikovich@gmail.com'
 __version__ = '0.1.0'
 
-from .address import Address
-from .affiliation import Affiliation
-from .bib_item_locality import BibItemLocality, Locality, \
-    BibItemLocalityType, SourceLocalityStack, SourceLocality, LocalityStack
-from .biblio_note import BiblioNote, BiblioNoteCollection
-from .biblio_version import BibliographicItemVersion
-from .bibliographic_date import BibliographicDate, BibliographicDateType
-from .bibliographic_item import BibliographicItem, BibliographicItemType
-from .classification import Classification
-from .contact import Contact, ContactType
-from .contributor import Contributor
-from .contribution_info import ContributionInfo, ContributorRole
-from .copyright_association import CopyrightAssociation
-from .document_identifier import DocumentIdentifier, DocumentIdType
-from .document_relation_collection import DocRelationCollection
-from .document_relation import DocumentRelation
-from .document_status import DocumentStatus
-from .editorial_group import EditorialGroup
-from .formatted_ref import FormattedRef
-from .formatted_string import FormattedString, FormattedStringFormat
-from .hit import Hit
-from .hit_collection import HitCollection
-from .ics import ICS
-from .organization import Organization, OrgIdentifier
-from .localized_string import LocalizedString
-from .medium import Medium
-from .place import Place
-from .person import Person, FullName, PersonIdentifier
-from .series import Series, SeriesType
-from .structured_identifier import StructuredIdentifier
-from .structured_identifier import StructuredIdentifierCollection
-from .typed_title_string import TypedTitleString, TypedTitleStringCollection
-from .technical_committee import TechnicalCommittee
-from .typed_uri import TypedUri
-from .validity import Validity
-from .workgroup import WorkGroup
+from typing import TYPE_CHECKING
 
-from .bibtex_parser import from_bibtex
-from .xml_parser import from_xml
-from .dict_parser import from_dict
+import importlib
+
+if TYPE_CHECKING:
+    from .address import Address
+    from .affiliation import Affiliation
+    from .bib_item_locality import BibItemLocality, Locality, \
+        BibItemLocalityType, SourceLocalityStack, SourceLocality, \
+        LocalityStack
+    from .biblio_note import BiblioNote, BiblioNoteCollection
+    from .biblio_version import BibliographicItemVersion
+    from .bibliographic_date import BibliographicDate, BibliographicDateType
+    from .bibliographic_item import BibliographicItem, BibliographicItemType
+    from .lazy_bibliographic_item import LazyBibliographicItem
+    from .classification import Classification
+    from .contact import Contact, ContactType
+    from .contributor import Contributor
+    from .contribution_info import ContributionInfo, ContributorRole
+    from .copyright_association import CopyrightAssociation
+    from .document_identifier import DocumentIdentifier, DocumentIdType
+    from .document_relation_collection import DocRelationCollection
+    from .document_relation import DocumentRelation
+    from .document_status import DocumentStatus
+    from .editorial_group import EditorialGroup
+    from .formatted_ref import FormattedRef
+    from .formatted_string import FormattedString, FormattedStringFormat
+    from .hit import Hit
+    from .hit_collection import HitCollection
+    from .ics import ICS
+    from .organization import Organization, OrgIdentifier
+    from .localized_string import LocalizedString
+    from .medium import Medium
+    from .place import Place
+    from .person import Person, FullName, PersonIdentifier
+    from .series import Series, SeriesType
+    from .structured_identifier import StructuredIdentifier
+    from .structured_identifier import StructuredIdentifierCollection
+    from .typed_title_string import TypedTitleString, \
+        TypedTitleStringCollection
+    from .technical_committee import TechnicalCommittee
+    from .typed_uri import TypedUri
+    from .validity import Validity
+    from .workgroup import WorkGroup
+
+    from .bibtex_parser import from_bibtex, iter_from_bibtex
+    from .xml_parser import from_xml, iter_from_xml
+    from .dict_parser import from_dict, from_json
+    from .batch_parser import parse_many, ParseResult
+    from .xml_writer import write_xml
+    from .bibtex_writer import to_bibtex_many
+    from .store import BibliographyStore, write_store
+    from .derived_cache import DerivedCache
+    from .relation_graph import RelationGraph
+    from .bibliography_index import BibliographyIndex
+    from .search_index import SearchIndex
+
+# attributes are imported on first access (PEP 562), so `import relaton_bib`
+# doesn't load the parsers and their dependencies until they are used
+_LAZY = {
+    "Address": "address",
+    "Affiliation": "affiliation",
+    "BibItemLocality": "bib_item_locality",
+    "Locality": "bib_item_locality",
+    "BibItemLocalityType": "bib_item_locality",
+    "SourceLocalityStack": "bib_item_locality",
+    "SourceLocality": "bib_item_locality",
+    "LocalityStack": "bib_item_locality",
+    "BiblioNote": "biblio_note",
+    "BiblioNoteCollection": "biblio_note",
+    "BibliographicItemVersion": "biblio_version",
+    "BibliographicDate": "bibliographic_date",
+    "BibliographicDateType": "bibliographic_date",
+    "BibliographicItem": "bibliographic_item",
+    "BibliographicItemType": "bibliographic_item",
+    "LazyBibliographicItem": "lazy_bibliographic_item",
+    "Classification": "classification",
+    "Contact": "contact",
+    "ContactType": "contact",
+    "Contributor": "contributor",
+    "ContributionInfo": "contribution_info",
+    "ContributorRole": "contribution_info",
+    "CopyrightAssociation": "copyright_association",
+    "DocumentIdentifier": "document_identifier",
+    "DocumentIdType": "document_identifier",
+    # relation modules import `bibliographic_item` which imports them back,
+    # so they can be loaded only through it
+    "DocRelationCollection": "bibliographic_item",
+    "DocumentRelation": "bibliographic_item",
+    "DocumentStatus": "document_status",
+    "EditorialGroup": "editorial_group",
+    "FormattedRef": "formatted_ref",
+    "FormattedString": "formatted_string",
+    "FormattedStringFormat": "formatted_string",
+    "Hit": "hit",
+    "HitCollection": "hit_collection",
+    "ICS": "ics",
+    "Organization": "organization",
+    "OrgIdentifier": "organization",
+    "LocalizedString": "localized_string",
+    "Medium": "medium",
+    "Place": "place",
+    "Person": "person",
+    "FullName": "person",
+    "PersonIdentifier": "person",
+    "Series": "series",
+    "SeriesType": "series",
+    "StructuredIdentifier": "structured_identifier",
+    "StructuredIdentifierCollection": "structured_identifier",
+    "TypedTitleString": "typed_title_string",
+    "TypedTitleStringCollection": "typed_title_string",
+    "TechnicalCommittee": "technical_committee",
+    "TypedUri": "typed_uri",
+    "Validity": "validity",
+    "WorkGroup": "workgroup",
+    "from_bibtex": "bibtex_parser",
+    "iter_from_bibtex": "bibtex_parser",
+    "from_xml": "xml_parser",
+    "iter_from_xml": "xml_parser",
+    "from_dict": "dict_parser",
+    "from_json": "dict_parser",
+    "parse_many": "batch_parser",
+    "ParseResult": "batch_parser",
+    "write_xml": "xml_writer",
+    "to_bibtex_many": "bibtex_writer",
+    "BibliographyStore": "store",
+    "write_store": "store",
+    "DerivedCache": "derived_cache",
+    "RelationGraph": "relation_graph",
+    "BibliographyIndex": "bibliography_index",
+    "SearchIndex": "search_index",
+}
 
 __all__ = [
-    from_bibtex,
-    from_xml,
-    from_dict,
-    BibliographicItem,
-    BibliographicItemType,
-    Address,
-    Contact,
-    ContactType,
-    Contributor,
-    Hit,
-    HitCollection,
-    Affiliation,
-    TypedUri,
-    DocumentIdentifier, DocumentIdType,
-    CopyrightAssociation,
-    FormattedString, FormattedStringFormat,
-    ContributionInfo, ContributorRole,
-    BibliographicDate, BibliographicDateType,
-    Series, SeriesType,
-    DocumentStatus,
-    Organization, OrgIdentifier,
-    LocalizedString,
-    TypedTitleString, TypedTitleStringCollection,
-    TechnicalCommittee,
-    FormattedRef,
-    Medium,
-    Classification,
-    Validity,
-    BibItemLocality,
-    Locality,
-    BibItemLocalityType,
-    SourceLocalityStack,
-    SourceLocality,
-    LocalityStack,
-    BiblioNote,
-    BiblioNoteCollection,
-    BibliographicItemVersion,
-    Place,
-    Person, FullName, PersonIdentifier,
-    StructuredIdentifierCollection,
-    EditorialGroup,
-    ICS,
-    DocRelationCollection,
-    DocumentRelation,
-    WorkGroup,
-    StructuredIdentifier
+    "from_bibtex",
+    "iter_from_bibtex",
+    "from_xml",
+    "iter_from_xml",
+    "from_dict",
+    "from_json",
+    "parse_many",
+    "ParseResult",
+    "write_xml",
+    "to_bibtex_many",
+    "BibliographyStore",
+    "write_store",
+    "DerivedCache",
+    "RelationGraph",
+    "BibliographyIndex",
+    "SearchIndex",
+    "BibliographicItem",
+    "BibliographicItemType",
+    "LazyBibliographicItem",
+    "Address",
+    "Contact",
+    "ContactType",
+    "Contributor",
+    "Hit",
+    "HitCollection",
+    "Affiliation",
+    "TypedUri",
+    "DocumentIdentifier",
+    "DocumentIdType",
+    "CopyrightAssociation",
+    "FormattedString",
+    "FormattedStringFormat",
+    "ContributionInfo",
+    "ContributorRole",
+    "BibliographicDate",
+    "BibliographicDateType",
+    "Series",
+    "SeriesType",
+    "DocumentStatus",
+    "Organization",
+    "OrgIdentifier",
+    "LocalizedString",
+    "TypedTitleString",
+    "TypedTitleStringCollection",
+    "TechnicalCommittee",
+    "FormattedRef",
+    "Medium",
+    "Classification",
+    "Validity",
+    "BibItemLocality",
+    "Locality",
+    "BibItemLocalityType",
+    "SourceLocalityStack",
+    "SourceLocality",
+    "LocalityStack",
+    "BiblioNote",
+    "BiblioNoteCollection",
+    "BibliographicItemVersion",
+    "Place",
+    "Person",
+    "FullName",
+    "PersonIdentifier",
+    "StructuredIdentifierCollection",
+    "EditorialGroup",
+    "ICS",
+    "DocRelationCollection",
+    "DocumentRelation",
+    "WorkGroup",
+    "StructuredIdentifier",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        # submodule not imported yet, e.g. `relaton_bib.relaton_bib`
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,9 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class Address:
     city: str
@@ -14,16 +16,26 @@ class Address:
 
     def to_xml(self, parent):
         name = "address"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         for st in self.street:
-            ET.SubElement(result, "street").text = st
-        ET.SubElement(result, "city").text = self.city
+            SubElement(result, "street").text = st
+        SubElement(result, "city").text = self.city
         if self.state:
-            ET.SubElement(result, "state").text = self.state
-        ET.SubElement(result, "country").text = self.country
+            SubElement(result, "state").text = self.state
+        SubElement(result, "country").text = self.country
         if self.postcode:
-            ET.SubElement(result, "postcode").text = self.postcode
+            SubElement(result, "postcode").text = self.postcode
+        return result
+
+    def to_dict(self):
+        result = {"street": self.street} if self.street else {}
+        result["city"] = self.city
+        if self.state:
+            result["state"] = self.state
+        result["country"] = self.country
+        if self.postcode:
+            result["postcode"] = self.postcode
         return result
 
     def to_asciibib(self, prefix="", count=1):
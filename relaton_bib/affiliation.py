@@ -2,14 +2,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List
 
-import xml.etree.ElementTree as ET
 
 from .organization import Organization
 from .localized_string import LocalizedString
 from .formatted_string import FormattedString
-from .relaton_bib import lang_filter
+from .relaton_bib import lang_filter, slotted
+from .xml_backend import Element, SubElement
 
 
+@slotted
 @dataclass
 class Affiliation:
     organization: Organization
@@ -18,18 +19,28 @@ class Affiliation:
 
     def to_xml(self, parent, opts={}):
         name = "affiliation"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         if self.name:
-            self.name.to_xml(ET.SubElement(result, "name"))
+            self.name.to_xml(SubElement(result, "name"))
 
         for d in lang_filter(self.description, opts):
-            d.to_xml(ET.SubElement(result, "description"))
+            d.to_xml(SubElement(result, "description"))
 
         self.organization.to_xml(result, opts)
 
         return result
 
+    def to_dict(self):
+        result = {}
+        if self.organization:
+            result["organization"] = self.organization.to_dict()
+        if self.name:
+            result["name"] = self.name.to_dict()
+        if self.description:
+            result["description"] = [d.to_dict() for d in self.description]
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         out = f"#{pref}affiliation::" if count > 1 else []
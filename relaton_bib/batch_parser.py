@@ -0,0 +1,225 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import codecs
+import mmap
+import os
+import xml.parsers.expat as expat
+
+from .bibliographic_item import BibliographicItem
+from .relaton_bib import pack_dataclass, unpack_dataclass
+from .xml_backend import fromstring
+from .xml_parser import from_xml, iter_from_xml
+
+# files bigger than this are split into ranges of top-level items
+SPLIT_SIZE = 8 * 1024 * 1024
+
+_ITEM_TAGS = ("bibitem", "bibdata")
+# size of data fed to the splitting parser at once
+_SCAN_SIZE = 1024 * 1024
+
+
+@dataclass
+class ParseResult:
+    path: str
+    item: BibliographicItem = None
+    error: str = None
+
+
+def parse_many(paths: Iterable[str], workers: int = None, chunksize: int = 1,
+               ordered: bool = True, split_size: int = SPLIT_SIZE) \
+        -> Iterator[ParseResult]:
+    """Parse XML files with bibitems in a pool of processes
+
+    Every file is a task, files bigger than `split_size` are split into
+    batches of top-level bibitem/bibdata elements of about `split_size`
+    bytes, so one big `<documents>` file is spread over workers too.
+    Batches are sent to workers while the file is being scanned. Files
+    which can't be split safely (with DOCTYPE, namespaces declared outside
+    of items, not ASCII compatible encoding or not well-formed) are parsed
+    whole, from the first item which isn't in a batch. Workers send items
+    back packed with `pack_dataclass`. A failed file or item is reported as
+    `ParseResult` with `error` and doesn't stop the batch.
+
+    Keyword arguments:
+    paths -- XML file names
+    workers -- number of processes, `os.cpu_count()` if None,
+               parse in the current process if 1 or less
+    chunksize -- number of tasks sent to a worker at once
+    ordered -- yield results in the input order or as they complete
+    split_size -- min size of file in bytes to split, and size of batches
+    """
+    tasks = _tasks(paths, split_size)
+    if workers is None:
+        workers = os.cpu_count()
+
+    if workers <= 1:
+        yield from _unpack_results(map(_parse_task, tasks))
+        return
+
+    with Pool(workers) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from _unpack_results(imap(_parse_task, tasks, chunksize))
+
+
+# (path, [(start, end)] or None to parse whole file, XML declaration,
+# number of items to skip in whole file)
+_Task = Tuple[str, Optional[List[Tuple[int, int]]], bytes, int]
+
+
+def _tasks(paths: Iterable[str], split_size: int) -> Iterator[_Task]:
+    for path in paths:
+        try:
+            split = os.path.getsize(path) > split_size
+        except OSError:
+            split = False  # reported by the worker
+        if split:
+            yield from _split_tasks(path, split_size)
+        else:
+            yield (path, None, b"", 0)
+
+
+def _split_tasks(path: str, split_size: int) -> Iterator[_Task]:
+    """Tasks of batches of top-level bibitem/bibdata elements of a file
+
+    The file is scanned by expat without building a tree, so comments,
+    CDATA sections and processing instructions are skipped. Items nested
+    in relations are inside of their parent's range. Adjacent items are
+    batched up to `split_size` bytes and every batch is yielded as soon as
+    it's found. If the rest of the file can't be split safely, the last
+    task parses the whole file skipping items of the yielded batches.
+    """
+    ranges = []
+    done = 0
+    declaration = [b""]
+    unsafe = []
+    # start of current top-level item, nesting of items, index of last
+    # start tag
+    state = {"start": 0, "depth": 0, "last": None}
+
+    try:
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:2] in (b"\xff\xfe", b"\xfe\xff"):
+                unsafe.append("UTF-16")  # BOM
+
+            parser = expat.ParserCreate()
+
+            def xml_decl(version, encoding, standalone):
+                if encoding:
+                    if codecs.lookup(encoding).name.startswith(("utf-16",
+                                                                "utf-32")):
+                        unsafe.append(encoding)
+                    decl = f'<?xml version="1.0" encoding="{encoding}"?>'
+                    declaration[0] = decl.encode("ascii")
+
+            def doctype(*args):
+                unsafe.append("DOCTYPE")
+
+            def start_element(name, attrs):
+                index = parser.CurrentByteIndex
+                if state["depth"]:
+                    state["depth"] += 1
+                elif name in _ITEM_TAGS:
+                    state["start"] = index
+                    state["depth"] = 1
+                elif any(a == "xmlns" or a.startswith("xmlns:")
+                         for a in attrs):
+                    unsafe.append(name)
+                state["last"] = index
+
+            def end_element(name):
+                if not state["depth"]:
+                    return
+                state["depth"] -= 1
+                if state["depth"] or unsafe:
+                    return
+                index = parser.CurrentByteIndex
+                start = state["start"]
+                if state["last"] == start and mm[index - 2:index] == b"/>":
+                    end = index  # empty element tag
+                else:
+                    end = mm.find(b">", index) + 1
+                ranges.append((start, end))
+
+            parser.XmlDeclHandler = xml_decl
+            parser.StartDoctypeDeclHandler = doctype
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+            try:
+                for pos in range(0, len(mm), _SCAN_SIZE):
+                    if unsafe:
+                        break
+                    parser.Parse(mm[pos:pos + _SCAN_SIZE], False)
+                    for batch in _take_batches(ranges, split_size):
+                        yield (path, batch, declaration[0], 0)
+                        done += len(batch)
+                else:
+                    parser.Parse(b"", True)
+            except (expat.ExpatError, LookupError):
+                unsafe.append("error")
+    except (OSError, ValueError):
+        unsafe.append("error")  # reported by the worker parsing whole file
+
+    if ranges:
+        # items before an unsafe place are still parsed apart
+        yield (path, ranges, declaration[0], 0)
+        done += len(ranges)
+    if unsafe:
+        yield (path, None, b"", done)
+
+
+def _take_batches(ranges: List[Tuple[int, int]], size: int) \
+        -> Iterator[List[Tuple[int, int]]]:
+    """Remove from `ranges` and yield leading batches of at least `size`
+    bytes
+    """
+    first = 0
+    for i, (_, end) in enumerate(ranges):
+        if end - ranges[first][0] >= size:
+            yield ranges[first:i + 1]
+            first = i + 1
+    del ranges[:first]
+
+
+def _parse_task(task: _Task) -> Tuple[str, List[Tuple]]:
+    path, ranges, declaration, skip = task
+    result = []
+    try:
+        if ranges is None:
+            for i, item in enumerate(iter_from_xml(path)):
+                if i >= skip:
+                    result.append((pack_dataclass(item), None))
+            return path, result
+
+        base = ranges[0][0]
+        with open(path, "rb") as f:
+            f.seek(base)
+            data = f.read(ranges[-1][1] - base)
+    except Exception as e:
+        result.append((None, _error(e)))
+        return path, result
+
+    for start, end in ranges:
+        try:
+            chunk = data[start - base:end - base]
+            item = from_xml(fromstring(declaration + chunk))
+            result.append((pack_dataclass(item), None))
+        except Exception as e:
+            result.append((None, _error(e)))
+    return path, result
+
+
+def _error(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _unpack_results(results: Iterable[Tuple[str, List[Tuple]]]) \
+        -> Iterator[ParseResult]:
+    for path, entries in results:
+        for packed, error in entries:
+            yield ParseResult(path=path,
+                              item=unpack_dataclass(packed),
+                              error=error)
@@ -1,12 +1,13 @@
 import re
 import logging
-import xml.etree.ElementTree as ET
 
 from dataclasses import dataclass
 from enum import Enum
 from typing import List
 
 from .localized_string import LocalizedString
+from .relaton_bib import single_element_array, slotted
+from .xml_backend import SubElement
 
 
 class BibItemLocalityType(str, Enum):
@@ -32,6 +33,7 @@ class BibItemLocalityType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass(frozen=True)
 class BibItemLocality:
     """Bibliographic item locality."""
@@ -59,11 +61,19 @@ class BibItemLocality:
 
     def to_xml(self, parent):
         parent.attrib["type"] = self.type
-        ET.SubElement(parent, "referenceFrom").text = str(self.reference_from)
+        SubElement(parent, "referenceFrom").text = str(self.reference_from)
         if self.reference_to:
-            ET.SubElement(parent, "referenceTo").text = str(self.reference_to)
+            SubElement(parent, "referenceTo").text = str(self.reference_to)
         return parent
 
+    def to_dict(self):
+        result = {"type": self.type}
+        if self.reference_from:
+            result["reference_from"] = self.reference_from.to_dict()
+        if self.reference_to:
+            result["reference_to"] = self.reference_to.to_dict()
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = prefix + "." if prefix else prefix
         out = [f"{prefix}::"] if count > 1 else []
@@ -74,51 +84,52 @@ class BibItemLocality:
         return "\n".join(out)
 
 
+@slotted
 @dataclass(frozen=True)
 class Locality(BibItemLocality):
 
     def to_xml(self, parent):
-        node = ET.SubElement(parent, "locality")
+        node = SubElement(parent, "locality")
         node.attrib["type"] = self.type
-        ET.SubElement(node, "referenceFrom").text = str(self.reference_from)
+        SubElement(node, "referenceFrom").text = str(self.reference_from)
         if self.reference_to:
-            ET.SubElement(node, "referenceTo").text = str(self.reference_to)
+            SubElement(node, "referenceTo").text = str(self.reference_to)
         return node
 
 
+@slotted
 @dataclass(frozen=True)
 class LocalityStack:
     locality: List[Locality]
 
     def to_xml(self, parent):
-        node = ET.SubElement(parent, "localityStack")
+        node = SubElement(parent, "localityStack")
         for loc in self.locality:
             loc.to_xml(node)
         return node
 
-    # TODO REVISIT and for other classes too
-    # def to_hash
-    #   { "locality_stack" => single_element_array(locality) }
-    # end
+    def to_dict(self):
+        return {"locality_stack": single_element_array(self.locality)}
 
 
+@slotted
 @dataclass(frozen=True)
 class SourceLocality(BibItemLocality):
     def to_xml(self, parent):
-        node = ET.SubElement(parent, "sourceLocality")
+        node = SubElement(parent, "sourceLocality")
         super().to_xml(node)
         return node
 
 
 class SourceLocalityStack(LocalityStack):
+    __slots__ = ()
+
     def to_xml(self, parent):
-        node = ET.SubElement(parent, "sourceLocalityStack")
+        node = SubElement(parent, "sourceLocalityStack")
         for loc in self.locality:
             loc.to_xml(node)
         return node
 
-#     # TODO REVISIT
-#     def to_hash
-#       { "source_locality_stack" => single_element_array(locality) }
-#     end
+    def to_dict(self):
+        return {"source_locality_stack": single_element_array(self.locality)}
 
@@ -1,12 +1,12 @@
-import xml.etree.ElementTree as ET
-
 from dataclasses import dataclass, InitVar
 from typing import List
 
 from .formatted_string import FormattedString
-from .relaton_bib import delegate
+from .relaton_bib import delegate, slotted
+from .xml_backend import Element, SubElement
 
 
+@slotted
 @dataclass(frozen=True)
 class BiblioNote(FormattedString):
     type: str = None
@@ -14,13 +14,23 @@ class BiblioNote(FormattedString):
 
     def to_xml(self, parent=None):
         name = "note"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         super().to_xml(node)
         if self.type:
             node.attrib["type"] = self.type
         return node
 
+    def to_dict(self):
+        result = super().to_dict()
+        if not self.type:
+            return result
+
+        if not isinstance(result, dict):
+            result = {"content": result}
+        result["type"] = self.type
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         has_attrs = self.type
@@ -31,6 +41,7 @@ class BiblioNote(FormattedString):
         return "\n".join(out)
 
 
+@slotted
 @dataclass
 @delegate("array", "append", "__getitem__", "__len__", "__iter__",
           "__reversed__", "__contains__")
@@ -53,6 +64,9 @@ class BiblioNoteCollection:
         # https://stackoverflow.com/a/2323165/902217
         return any(x for x in self.array)
 
+    def to_dict(self):
+        return [bn.to_dict() for bn in self.array]
+
     def to_xml(self, parent, opts={}):
         lang = opts.get("lang")
         bnc = list(filter(lambda bn: lang in bn.language, self.array))
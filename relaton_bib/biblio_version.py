@@ -1,9 +1,11 @@
-import xml.etree.ElementTree as ET
-
 from dataclasses import dataclass, field
 from typing import List
 
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
+
 
+@slotted
 @dataclass
 class BibliographicItemVersion:
     revision_date: str = None
@@ -11,14 +13,20 @@ class BibliographicItemVersion:
 
     def to_xml(self, parent=None):
         name = "version"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         if self.revision_date:
-            ET.SubElement(node, "revision-date").text = self.revision_date
+            SubElement(node, "revision-date").text = self.revision_date
         for d in self.draft:
-            ET.SubElement(node, "draft").text = d
+            SubElement(node, "draft").text = d
         return node
 
+    def to_dict(self):
+        result = {"revdate": self.revision_date} if self.revision_date else {}
+        if self.draft:
+            result["draft"] = self.draft
+        return result
+
     def to_asciibib(self, prefix=""):
         pref = f"{prefix}." if prefix else prefix
         out = []
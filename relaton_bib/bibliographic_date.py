@@ -1,13 +1,15 @@
 import re
 import datetime
+import functools
 import logging
-import xml.etree.ElementTree as ET
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar
+from typing import ClassVar, Optional, Tuple
 
-from .relaton_bib import parse_date
+from .interning import intern_str
+from .relaton_bib import DATE_CACHE_SIZE, parse_date, slotted
+from .xml_backend import Element, SubElement
 
 
 class BibliographicDateType(str, Enum):
@@ -32,10 +34,14 @@ class BibliographicDateType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass
 class BibliographicDate:
     NO_YEAR: ClassVar[str] = "--"
 
+    # {prop: (value, components)}, filled on demand, not a field
+    __slots__ = ("_components",)
+
     type: str
     on: datetime.date = None
     from_: datetime.date = None
@@ -48,44 +54,51 @@ class BibliographicDate:
 
         if isinstance(self.type, BibliographicDateType):
             self.type = self.type.value
+        else:
+            self.type = intern_str(self.type)
 
         if not (self.on or self.from_):
             raise ValueError("expected on or from_ argument")
 
-        if self.on and isinstance(self.on, str):
-            self.on = parse_date(self.on)
-
-        if self.from_ and isinstance(self.from_, str):
-            self.from_ = parse_date(self.from_)
-
-        if self.to and isinstance(self.to, str):
-            self.to = parse_date(self.to)
+        self.on = _date_value(self.on)
+        self.from_ = _date_value(self.from_)
+        self.to = _date_value(self.to)
 
     def to_xml(self, parent, opts={}):
         name = "date"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         result.attrib["type"] = self.type
         date_format = opts.get("date_format")
         no_year = opts.get("no_year")
         if self.on:
-            on_node = ET.SubElement(result, "on")
+            on_node = SubElement(result, "on")
             if no_year:
                 on_node.text = self.NO_YEAR
             else:
                 on_node.text = self.date_format(self.on, date_format)
         elif self.from_:
-            form_node = ET.SubElement(result, "from")
+            form_node = SubElement(result, "from")
             if no_year:
                 form_node.text = self.NO_YEAR
             else:
                 form_node.text = self.date_format(self.from_, date_format)
                 if self.to:
-                    to_node = ET.SubElement(result, "to")
+                    to_node = SubElement(result, "to")
                     to_node.text = self.date_format(self.to, date_format)
 
         return result
 
+    def to_dict(self):
+        result = {"type": self.type}
+        if self.on:
+            result["value"] = str(self.on)
+        if self.from_:
+            result["from"] = str(self.from_)
+        if self.to:
+            result["to"] = str(self.to)
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = prefix + "." if prefix else prefix
         out = [f"{pref}date::"] if count > 1 else []
@@ -99,7 +112,84 @@ class BibliographicDate:
         return "\n".join(out)
 
     def value(self, prop="on", part=None) -> str:
-        return self._process_date(getattr(self, prop), part)
+        if prop == "from":
+            prop = "from_"
+        date = getattr(self, prop)
+        if not (date and part):
+            return date
+
+        components = self.components(prop)
+        if components is None:
+            return date
+        year, month, day, _ = components
+        if part == "year":
+            return year
+        elif part == "month":
+            return month or 1
+        elif part == "day":
+            return day or 1
+
+        date = datetime.datetime(year, month or 1, day or 1)
+        return date if part == "date" else getattr(date, part)
+
+    def components(self, prop="on") \
+            -> Optional[Tuple[int, Optional[int], Optional[int], str]]:
+        """Year, month, day and precision ("year", "month" or "day") of date
+
+        Date is parsed once and the result is cached until the property is
+        changed. Month and day are None if the date doesn't have them.
+        Returns None if the date isn't set or isn't in ISO format.
+
+        Keyword arguments:
+        prop -- "on", "from_" or "to"
+        """
+        date = getattr(self, prop)
+        try:
+            cache = self._components
+        except AttributeError:
+            cache = self._components = {}
+        cached = cache.get(prop)
+        if cached is not None and cached[0] is date:
+            return cached[1]
+
+        if isinstance(date, datetime.date):
+            components = (date.year, date.month, date.day, "day")
+        else:
+            components = _date_components(date) if date else None
+        cache[prop] = (date, components)
+        return components
+
+    def sort_key(self) -> Tuple[int, int, int]:
+        """Key to sort dates chronologically by `on` or `from_` date
+
+        A date of lower precision goes before more precise ones of the same
+        year or month, dates which can't be parsed go first.
+        """
+        components = self.components("on") or self.components("from_")
+        if components is None:
+            return (0, 0, 0)
+        year, month, day, _ = components
+        return (year, month or 0, day or 0)
+
+    def __lt__(self, other):
+        if not isinstance(other, BibliographicDate):
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
+
+    def __le__(self, other):
+        if not isinstance(other, BibliographicDate):
+            return NotImplemented
+        return self.sort_key() <= other.sort_key()
+
+    def __gt__(self, other):
+        if not isinstance(other, BibliographicDate):
+            return NotImplemented
+        return self.sort_key() > other.sort_key()
+
+    def __ge__(self, other):
+        if not isinstance(other, BibliographicDate):
+            return NotImplemented
+        return self.sort_key() >= other.sort_key()
 
     def part(self, part="year") -> str:
         return self.value("on", part) or self.value("from", part) \
@@ -117,23 +207,58 @@ class BibliographicDate:
 
         return date.strftime(fmt) if isinstance(date, datetime.date) else date
 
-    def _process_date(self, date, part=None):
-        if not (date and part):
-            return date
+    def _parse_date(self, date):
+        return _parse_date(date)
 
-        date = self._parse_date(date)
 
-        if part == "date":
-            return date
+_DATE_FORMATS = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),  # 2012-02-11
+    (re.compile(r"\d{4}-\d{2}"), "%Y-%m"),  # 2012-02
+    (re.compile(r"\d{4}"), "%Y"),  # 2012
+]
 
-        return getattr(date, part) if isinstance(date, datetime.date) else date
+_ISO_DATE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
 
-    def _parse_date(self, date):
-        if re.match(r"^\d{4}-\d{2}-\d{2}", date):
-            return datetime.datetime.strptime(date, "%Y-%m-%d")  # 2012-02-11
-        elif re.match(r"^\d{4}-\d{2}", date):
-            return datetime.datetime.strptime(date, "%Y-%m")  # 2012-02
-        elif re.match(r"^\d{4}", date):
-            return datetime.datetime.strptime(date, "%Y")  # 2012
-        else:
-            return date
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _date_components(date: str) \
+        -> Optional[Tuple[int, Optional[int], Optional[int], str]]:
+    m = _ISO_DATE.fullmatch(date)
+    if m:
+        year, month, day = (None if v is None else int(v)
+                            for v in m.groups())
+        # validate
+        datetime.date(year, 1 if month is None else month,
+                      1 if day is None else day)
+        precision = "year" if month is None else \
+            "month" if day is None else "day"
+        return (year, month, day, precision)
+
+    # strptime raises error for data after the date
+    for regexp, fmt in _DATE_FORMATS:
+        if regexp.match(date):
+            datetime.datetime.strptime(date, fmt)
+    return None
+
+
+def _date_value(date):
+    """Date as stored in `BibliographicDate`: ISO string of `date` objects
+
+    Dates made by parsers of BibTeX and XML or dict are the same this way,
+    so `to_dict` output is read back to an equal date.
+    """
+    if isinstance(date, datetime.datetime):
+        return date.date().isoformat()
+    if isinstance(date, datetime.date):
+        return date.isoformat()
+    if date and isinstance(date, str):
+        return parse_date(date)
+    return date
+
+
+def _parse_date(date):
+    components = _date_components(date)
+    if components is None:
+        return date
+    year, month, day, _ = components
+    return datetime.datetime(year, month or 1, day or 1)
@@ -1,17 +1,15 @@
 from __future__ import annotations
 import copy
+import dataclasses
 import datetime
 import logging
+import operator
 import re
 import xml.etree.ElementTree as ET
 import typing
 from dataclasses import dataclass, field, is_dataclass
 from enum import Enum
-from typing import List
-
-import bibtexparser
-from bibtexparser.bibdatabase import BibDatabase
-from bibtexparser.bwriter import BibTexWriter
+from typing import TYPE_CHECKING, List
 
 from .address import Address
 from .formatted_string import FormattedString
@@ -39,11 +37,19 @@ from .person import Person
 from .structured_identifier import StructuredIdentifierCollection
 from .editorial_group import EditorialGroup
 from .ics import ICS
+from .bibtex_writer import entry_to_bibtex, shared_bibtex_writer
+from .derived_cache import DerivedCache
 
-from .relaton_bib import to_ds_instance
+from .interning import intern_str
+from .relaton_bib import construct, is_trusted, json_dumps, to_ds_instance, \
+    slotted
 
 from .document_relation import *
 from .document_relation_collection import *
+from .xml_backend import Element, SubElement
+
+if TYPE_CHECKING:
+    from bibtexparser.bibdatabase import BibDatabase
 
 # from .bibtex_parser import BibtexPaser
 # from .xml_parser import XmlPaser
@@ -81,9 +87,12 @@ class BibliographicItemType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass
 class BibliographicItem:
     FETCHED_FORMAT: typing.ClassVar[str] = "%Y-%m-%d"
+    # cache of derived views, disabled if None, see `derived_cache` module
+    derived_cache: typing.ClassVar[typing.Optional[DerivedCache]] = None
 
     id: str = None
     type: str = None
@@ -124,13 +133,25 @@ class BibliographicItem:
     _id_attribute: bool = field(default=True, init=False, repr=False)
 
     def __post_init__(self):
+        if not is_trusted():
+            self._validate()
+        self._convert()
+
+    def _validate(self):
         if not BibliographicItemType.has_value(self.type):
             logging.warning(
                 f"[relaton-bib] invalid document type: {self.type}")
+
+    def _convert(self):
+        """Convert raw field values to model objects and collections"""
         if isinstance(self.title, str):
             self.title = TypedTitleStringCollection([self.title])
         elif isinstance(self.title, list):
             self.title = TypedTitleStringCollection(self.title)
+        if isinstance(self.biblionote, list):
+            self.biblionote = BiblioNoteCollection(self.biblionote)
+        if isinstance(self.relation, list):
+            self.relation = DocRelationCollection(self.relation)
 
         self.date = list(map(to_ds_instance(BibliographicDate), self.date))
 
@@ -146,9 +167,30 @@ class BibliographicItem:
         self.link = list(map(to_ds_instance(TypedUri), self.link))
         self.place = list(map(to_ds_instance(Place), self.place))
         self.keyword = list(map(to_ds_instance(LocalizedString), self.keyword))
+        self.language = list(map(intern_str, self.language))
+        self.script = list(map(intern_str, self.script))
         if isinstance(self.type, BibliographicItemType):
             self.type = self.type.value
 
+    @classmethod
+    def construct(cls, **fields) -> BibliographicItem:
+        """Create bibitem from trusted fields skipping `__post_init__`
+
+        Fields aren't validated or converted: dates, abstracts, links etc.
+        should be model instances and codes of languages and scripts should
+        be interned. Only plain lists of title, biblionote and relation are
+        wrapped into collections and `id` is made from docidentifiers if
+        it's missing.
+        """
+        item = construct(cls, **fields)
+        for name, collection in _COLLECTIONS:
+            value = getattr(item, name)
+            if isinstance(value, list):
+                setattr(item, name, collection(value))
+        if not item.id:
+            item.id = item.makeid(None, False)
+        return item
+
     def abstract_for_lang(self, lang=None):
         if lang:
             return next((a for a in self.abstract if lang in a.language), None)
@@ -167,9 +209,7 @@ class BibliographicItem:
         if not docid:
             return None
 
-        idstr = re.sub(r":", "-", docid.id)
-        idstr = re.sub(r"\s", "", idstr)
-        return idstr.strip()
+        return _SPACES.sub("", docid.id.replace(":", "-"))
 
     def shortref(self, identifier, opts={}):
         pubdate = next((d for d in self.date
@@ -184,7 +224,68 @@ class BibliographicItem:
     def to_xml(self, parent=None, opts={}):
         return self.render_xml(parent, opts)
 
+    def to_dict(self) -> dict:
+        """Convert to dict in the format `from_dict` takes
+
+        Values are built-in types only so the result can be dumped as JSON
+        or YAML, `from_dict(item.to_dict()) == item`.
+        """
+        result = {}
+        for attr in ["id", "type", "docnumber", "edition", "doctype",
+                     "subdoctype"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = value
+        if self.fetched:
+            result["fetched"] = self.fetched.isoformat()
+        for key, attr in [("title", "title"),
+                          ("link", "link"),
+                          ("docid", "docidentifier"),
+                          ("date", "date"),
+                          ("contributor", "contributor"),
+                          ("abstract", "abstract"),
+                          ("biblionote", "biblionote"),
+                          ("copyright", "copyright"),
+                          ("relation", "relation"),
+                          ("series", "series"),
+                          ("place", "place"),
+                          ("extent", "extent"),
+                          ("classification", "classification"),
+                          ("keyword", "keyword"),
+                          ("ics", "ics")]:
+            value = getattr(self, attr)
+            if value:
+                result[key] = [v.to_dict() for v in value]
+        if self.version:
+            result.update(self.version.to_dict())
+        for attr in ["language", "script", "accesslocation", "license"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = list(value)
+        for key, attr in [("formattedref", "formattedref"),
+                          ("docstatus", "status"),
+                          ("medium", "medium"),
+                          ("validity", "validity"),
+                          ("editorialgroup", "editorialgroup"),
+                          ("structuredidentifier", "structuredidentifier")]:
+            value = getattr(self, attr)
+            if value:
+                result[key] = value.to_dict()
+        return result
+
+    def to_json(self) -> str:
+        """Serialize to JSON, uses `orjson` if it's installed"""
+        return json_dumps(self.to_dict())
+
     def to_bibtex(self, bibtex: BibDatabase = None) -> str:
+        entry = self.to_bibtex_entry()
+        if not bibtex:
+            return entry_to_bibtex(entry)
+        bibtex.entries.append(entry)
+        return shared_bibtex_writer().write(bibtex)
+
+    def to_bibtex_entry(self) -> dict:
+        """BibTeX entry as `bibtexparser` dict of fields"""
         item = {"ENTRYTYPE": self._bibtex_type(), "ID": self.id}
         self._bibtex_title(item)
         if self.edition:
@@ -208,50 +309,7 @@ class BibliographicItem:
                 self.fetched,
                 BibliographicItem.FETCHED_FORMAT)
         self._bibtex_link(item)
-        if not bibtex:
-            bibtex = BibDatabase()
-        bibtex.entries.append(item)
-        writer = BibTexWriter()
-        writer.indent = '  '
-        writer.common_strings = True
-        writer.display_order = (
-            "tile",
-            "edition",
-            "author",
-            "publisher",
-            "school",
-            "organization",
-            "institution",
-            "address",
-            "note",
-            "annote",
-            "howpublished",
-            "comment",
-            "content",
-            "booktitle",
-            "chapter",
-            "pages",
-            "volume",
-            "year",
-            "month",
-            "urldate",
-            "journal",
-            "number",
-            "series",
-            "type",
-            "mendeley-tags",
-            "mendeley",
-            "keywords",
-            "isbn",
-            "lccn",
-            "issn",
-            "timestamp",
-            "url",
-            "doi",
-            "file2",
-            "month_numeric")
-
-        return bibtexparser.dumps(bibtex, writer)
+        return item
 
     def title_for_lang(self, lang=None):
         return self.title.lang(lang)
@@ -264,50 +322,112 @@ class BibliographicItem:
         self._id_attribute = False
 
     def to_all_parts(self):
-        """remove title part components and abstract"""
-        me = copy.deepcopy(self)
-        me.disable_id_attribute()
-        me.relation.append(DocumentRelation(
-            type=DocumentRelation.Type.instance,
-            bibitem=self))
-        for lang in me.language:
-            me.title.delete_title_part()
-            tm_en = " - ".join([t.title.content for t in me.title
-                                if t.type != TypedTitleString.Type.MAIN
-                                and lang in t.title.language])
-            t = next((t.title for t in me.title
-                      if t.type == TypedTitleString.Type.MAIN
-                      and lang in t.title.language), None)
-            if t:
-                t.content = tm_en
+        """remove title part components and abstract
+
+        The item itself isn't changed, the result shares with it all the
+        values which aren't changed, e.g. contributors and relations.
+        """
+        cache = self.derived_cache
+        if cache is None:
+            return self._to_all_parts()
+        return cache.get(self, ("to_all_parts",), self._derived_fingerprint(),
+                         self._to_all_parts)
+
+    def _to_all_parts(self):
+        me = self._derive(self)
+        if me.language:
+            titles = [t for t in self.title
+                      if t.type != TypedTitleString.Type.TPART]
+            for lang in me.language:
+                tm_en = " - ".join([t.title.content for t in titles
+                                    if t.type != TypedTitleString.Type.MAIN
+                                    and lang in t.title.language])
+                i = next((i for i, t in enumerate(titles)
+                          if t.type == TypedTitleString.Type.MAIN
+                          and lang in t.title.language), None)
+                if i is not None:
+                    titles[i] = TypedTitleString(
+                        type=titles[i].type,
+                        title=dataclasses.replace(titles[i].title,
+                                                  content=tm_en))
+            me.title = TypedTitleStringCollection(titles)
         me.abstract = []
+        me.docidentifier = [copy.copy(di) for di in self.docidentifier]
         for di in me.docidentifier:
             di.remove_part()
             di.all_parts()
             di.remove_date()
-        me.structuredidentifier.remove_part()
-        me.structuredidentifier.all_parts()
-        me.structuredidentifier.remove_date()
+        si = me.structuredidentifier = self._copy_structuredidentifier()
+        if si:
+            si.remove_part()
+            si.all_parts()
+            si.remove_date()
         me.all_parts = True
         return me
 
     def to_most_recent_reference(self):
-        me = copy.deepcopy(self)
-        self.disable_id_attribute()
-        me.relation.append(DocumentRelation(
-            type=DocumentRelation.Type.instance,
-            bibitem=self))
+        """remove dates and abstract
+
+        The item itself isn't changed, the result shares with it all the
+        values which aren't changed, e.g. contributors and relations.
+        """
+        cache = self.derived_cache
+        if cache is None:
+            return self._to_most_recent_reference()
+        return cache.get(self, ("to_most_recent_reference",),
+                         self._derived_fingerprint(),
+                         self._to_most_recent_reference)
+
+    def _to_most_recent_reference(self):
+        # the item is referred without id, as if its id attribute is disabled
+        instance = copy.copy(self)
+        instance.disable_id_attribute()
+        me = self._derive(instance)
         me.abstract = []
         me.date = []
+        me.docidentifier = [copy.copy(di) for di in self.docidentifier]
         for di in me.docidentifier:
             di.remove_date()
-        si = me.structuredidentifier
+        si = me.structuredidentifier = self._copy_structuredidentifier()
         if si:
             si.remove_date()
         if me.id:
             me.id = re.sub(r"-[12]\d\d\d", "", me.id)
         return me
 
+    def _derived_fingerprint(self) -> tuple:
+        """Values `to_all_parts` and `to_most_recent_reference` are made of
+
+        Values of all the fields are included, so reassigning any of them
+        changes the fingerprint, they compare fast as long as they are the
+        same objects. Contents of the fields derived items don't share are
+        included too, so changing them in place changes it as well.
+        """
+        si = self.structuredidentifier
+        return (_field_values(self), tuple(self.language),
+                len(self.relation), _docid_keys(self.docidentifier),
+                si and [(i.docnumber, i.partnumber, i.year, i.type)
+                        for i in si],
+                [(t.type, t.title) for t in self.title])
+
+    def _derive(self, instance: BibliographicItem) -> BibliographicItem:
+        """Shallow copy with id attribute disabled and instance relation
+
+        Lists and objects of the copy are the ones of the item, so they
+        should be replaced, not changed in place.
+        """
+        me = copy.copy(self)
+        me.disable_id_attribute()
+        me.relation = DocRelationCollection(list(self.relation) + [
+            DocumentRelation(type=DocumentRelation.Type.instance,
+                             bibitem=instance)])
+        return me
+
+    def _copy_structuredidentifier(self) -> StructuredIdentifierCollection:
+        si = self.structuredidentifier
+        return si and StructuredIdentifierCollection(
+            [copy.copy(i) for i in si])
+
     def revdate(self):
         """If revision_date exists then returns it
            else returns published date or None"""
@@ -494,10 +614,10 @@ class BibliographicItem:
         bibdata = opts.get("bibdata")
         lang = opts.get("lang")
         name = "bibdata" if opts.get("bibdata") else "bibitem"
-        root = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        root = Element(name) if parent is None \
+            else SubElement(parent, name)
         if self.fetched:
-            ET.SubElement(root, "fetched").text = self.fetched.strftime(
+            SubElement(root, "fetched").text = self.fetched.strftime(
                 BibliographicItem.FETCHED_FORMAT)
         self.title.to_xml(root, opts)
         if self.formattedref:
@@ -507,35 +627,35 @@ class BibliographicItem:
         for di in self.docidentifier:
             di.to_xml(root, opts)
         if self.docnumber:
-            ET.SubElement(root, "docnumber").text = self.docnumber
+            SubElement(root, "docnumber").text = self.docnumber
         for d in self.date:
             d.to_xml(root, opts)
         for c in self.contributor:
-            node = ET.SubElement(root, "contributor")
+            node = SubElement(root, "contributor")
             for r in c.role:
                 r.to_xml(node, opts)
             c.to_xml(node, opts)
         if self.edition:
-            ET.SubElement(root, "edition").text = self.edition
+            SubElement(root, "edition").text = self.edition
         if self.version:
             self.version.to_xml(root)
         if self.biblionote:
             self.biblionote.to_xml(root, opts)
         if hasattr(opts.get("note"), "__iter__"):
             for n in opts["note"]:
-                node = ET.SubElement(root, "note")
+                node = SubElement(root, "note")
                 node.text = n.get("text")
                 node.attrib["format"] = "text/plain"
                 node.attrib["type"] = n.get("type")
         for l in self.language:
-            ET.SubElement(root, "language").text = l
+            SubElement(root, "language").text = l
         for s in self.script:
-            ET.SubElement(root, "script").text = s
+            SubElement(root, "script").text = s
         abstr = list(filter(
             lambda ab: ab.language and lang in ab.language, self.abstract))
         abstr = abstr if any(abstr) else self.abstract
         for a in abstr:
-            a.to_xml(ET.SubElement(root, "abstract"))
+            a.to_xml(SubElement(root, "abstract"))
         if self.status:
             self.status.to_xml(root)
         for c in self.copyright:
@@ -549,18 +669,18 @@ class BibliographicItem:
         for pl in self.place:
             pl.to_xml(root)
         for e in self.extent:
-            e.to_xml(ET.SubElement(root, "extent"))
+            e.to_xml(SubElement(root, "extent"))
         for al in self.accesslocation:
-            ET.SubElement(root, "accesslocation").text = al
+            SubElement(root, "accesslocation").text = al
         for al in self.license:
-            ET.SubElement(root, "license").text = al
+            SubElement(root, "license").text = al
         for cl in self.classification:
             cl.to_xml(root)
         kwrd = list(filter(
             lambda k: k.language and lang in k.language, self.keyword))
         kwrd = kwrd if any(kwrd) else self.keyword
         for kw in kwrd:
-            kw.to_xml(ET.SubElement(root, "keyword"))
+            kw.to_xml(SubElement(root, "keyword"))
         if self.validity:
             self.validity.to_xml(root)
         if opts.get("lambda"):
@@ -569,11 +689,11 @@ class BibliographicItem:
                           or (self.ics and any(self.ics))
                           or (self.structuredIdentifier
                               and self.structuredIdentifier.presence)):
-            ext = ET.SubElement(root, "ext")
+            ext = SubElement(root, "ext")
             if self.doctype:
-                ET.SubElement(ext, "doctype").text = self.doctype
+                SubElement(ext, "doctype").text = self.doctype
             if self.subdoctype:
-                ET.SubElement(ext, "subdoctype").text = self.subdoctype
+                SubElement(ext, "subdoctype").text = self.subdoctype
             if self.editorialgroup:
                 self.editorialgroup.to_xml(ext)
             for i in self.ics:
@@ -590,14 +710,14 @@ class BibliographicItem:
         """ Render BibXML (RFC)
             parent: node where output BibXML will be built
             return root node of BibXML document"""
-        reference = ET.Element("reference") if parent is None \
-            else ET.SubElement(parent, "reference")
-        front = ET.SubElement(reference, "front")
+        reference = Element("reference") if parent is None \
+            else SubElement(parent, "reference")
+        front = SubElement(reference, "front")
 
         reference.attrib["anchor"] = self.anchor
         if any(self.title):
             first = self.title[0].title.content
-            ET.SubElement(front, "title").text = first
+            SubElement(front, "title").text = first
 
         self.render_seriesinfo(front)
         self.render_authors(front)
@@ -637,19 +757,19 @@ class BibliographicItem:
 
     def render_keyword(self, parent: ET.Element):
         for kw in self.keyword:
-            ET.SubElement(parent, "keyword").text = kw.content
+            SubElement(parent, "keyword").text = kw.content
 
     def render_workgroup(self, parent: ET.Element):
         if self.editorialgroup is not None:
             if self.editorialgroup.technical_committee is not None:
                 for tc in self.editorialgroup.technical_committee:
-                    ET.SubElement(parent, "workgroup").text = tc.workgroup.name
+                    SubElement(parent, "workgroup").text = tc.workgroup.name
 
     def render_abstract(self, parent: ET.Element):
         if not any(self.abstract):
             return
 
-        ET.SubElement(parent, "abstract").text = re.sub(
+        SubElement(parent, "abstract").text = re.sub(
             r"(<\/?)p(>)", r"\1t\2", self.abstract[0].content)
 
     def render_date(self, parent: ET.Element):
@@ -657,7 +777,7 @@ class BibliographicItem:
         if dt is None:
             return
 
-        elm = ET.SubElement(parent, "date")
+        elm = SubElement(parent, "date")
         for part in ["year", "month", "day"]:
             value = dt.part(part)
             if value:
@@ -667,7 +787,7 @@ class BibliographicItem:
     def render_seriesinfo(self, parent: ET.Element):
         for di in self.docidentifier:
             if di.type in ["DOI", "Internet-Draft"]:
-                si = ET.SubElement(parent, "seriesInfo")
+                si = SubElement(parent, "seriesInfo")
                 si.attrib["name"] = di.type
                 si.attrib["value"] = di.id
 
@@ -675,14 +795,14 @@ class BibliographicItem:
         for s in self.series:
             if s.title is None or str(s.title.title) in snames:
                 continue
-            si = ET.SubElement(parent, "seriesInfo")
+            si = SubElement(parent, "seriesInfo")
             si.attrib["name"] = str(s.title.title)
             if s.number:
                 si.attrib["value"] = s.number
 
     def render_authors(self, parent: ET.Element):
         for c in self.contributor:
-            a = ET.SubElement(parent, "author")
+            a = SubElement(parent, "author")
             is_editor = any(r for r in c.role if r.type == "editor")
             if is_editor:
                 a.attrib["role"] = "editor"
@@ -699,19 +819,19 @@ class BibliographicItem:
                 if not(isinstance(cn, Address) and cn.postcode is None)]
 
         if any(addr):
-            address = ET.SubElement(parent, "address")
+            address = SubElement(parent, "address")
             addr = next((cn for cn in addr if isinstance(cn, Address)), None)
-            postal = ET.SubElement(address, "postal")
+            postal = SubElement(address, "postal")
             if addr.city:
-                ET.SubElement(postal, "city").text = addr.city
+                SubElement(postal, "city").text = addr.city
             if addr.postcode:
-                ET.SubElement(postal, "code").text = addr.postcode
+                SubElement(postal, "code").text = addr.postcode
             if addr.country:
-                ET.SubElement(postal, "country").text = addr.country
+                SubElement(postal, "country").text = addr.country
             if addr.state:
-                ET.SubElement(postal, "region").text = addr.state
+                SubElement(postal, "region").text = addr.state
             if any(addr.street):
-                ET.SubElement(postal, "street").text = addr.street[0]
+                SubElement(postal, "street").text = addr.street[0]
 
             self.render_contact(address, contrib.entity.contact)
 
@@ -720,7 +840,7 @@ class BibliographicItem:
             cont = next((cn for cn in addr if isinstance(cn, Contact)
                          and cn.type == t), None)
             if cont:
-                ET.SubElement(parent, t).text = cont.value
+                SubElement(parent, t).text = cont.value
 
     def render_person(self, parent: ET.Element, person: Person):
         if len(person.affiliation) > 0:
@@ -737,7 +857,7 @@ class BibliographicItem:
             parent.attrib["surname"] = person.name.surname.content
 
     def render_organization(self, parent: ET.Element, org: Organization):
-        o = ET.SubElement(parent, "organization")
+        o = SubElement(parent, "organization")
         if len(org.name) > 0:
             o.text = org.name[0].content
 
@@ -745,6 +865,21 @@ class BibliographicItem:
             o.attrib["abbrev"] = org.abbreviation.content
 
 
+_SPACES = re.compile(r"\s")
+
+# fields `BibliographicItem.construct` wraps into collections
+_COLLECTIONS = [("title", TypedTitleStringCollection),
+                ("biblionote", BiblioNoteCollection),
+                ("relation", DocRelationCollection)]
+
+_field_values = operator.attrgetter(
+    *[f.name for f in dataclasses.fields(BibliographicItem)])
+
+
+def _docid_keys(docids: List[DocumentIdentifier]) -> tuple:
+    return tuple([(d.id, d.type, d.scope) for d in docids])
+
+
 def month_name(month_number) -> str:
     if isinstance(month_number, str):
         month_number = int(month_number)
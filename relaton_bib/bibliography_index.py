@@ -0,0 +1,138 @@
+"""In-memory index of bibitems by their identifying fields
+
+Lookups which otherwise scan a list of items are dict lookups::
+
+    index = BibliographyIndex(items)
+    index.by_docidentifier("ISO 19115-1", "ISO")
+    index.by_structuredidentifier(docnumber="19115", partnumber="1")
+    index.by_ics("35.240.70")
+    index.by_technical_committee("Geographic information/Geomatics")
+
+Keys of an item are taken when it's added and kept until it's removed, so
+an item changed in place should be added again to be found by new values.
+The index is a mapping of item ids to items, e.g. for `RelationGraph`.
+"""
+from collections.abc import Mapping
+from dataclasses import fields
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+
+from .bibliographic_item import BibliographicItem
+from .structured_identifier import StructuredIdentifier
+
+_SI_FIELDS = [f.name for f in fields(StructuredIdentifier)]
+
+
+class BibliographyIndex(Mapping):
+    """Mapping of ids to bibitems with hash indexes of their identifiers,
+    docnumber, structured identifiers, ICS codes and technical committees
+
+    Results of lookups are lists of items in order they were added.
+
+    Keyword arguments:
+    items -- bibitems to add
+    """
+
+    def __init__(self, items: Iterable[BibliographicItem] = ()):
+        self._items: Dict[str, BibliographicItem] = {}
+        # {key: {posting: None}}, postings are item ids, or (id, number of
+        # structured identifier) for its fields
+        self._index: Dict[Hashable, Dict[Hashable, None]] = {}
+        # keys and postings of items, {id: [(key, posting)]}
+        self._keys: Dict[str, List[Tuple[Hashable, Hashable]]] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: BibliographicItem):
+        """Add item, replacing item with the same id"""
+        if item.id in self._items:
+            self.remove(item.id)
+        self._items[item.id] = item
+        keys = self._keys[item.id] = list(dict.fromkeys(_item_keys(item)))
+        for key, posting in keys:
+            self._index.setdefault(key, {})[posting] = None
+
+    def remove(self, id: str):
+        """Remove item with id, raise KeyError if it isn't added"""
+        del self._items[id]
+        for key, posting in self._keys.pop(id):
+            postings = self._index[key]
+            del postings[posting]
+            if not postings:
+                del self._index[key]
+
+    def __getitem__(self, id: str) -> BibliographicItem:
+        return self._items[id]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __contains__(self, id) -> bool:
+        return id in self._items
+
+    def by_docidentifier(self, id: str,
+                         type: str = None) -> List[BibliographicItem]:
+        """Items with document identifier, of any type if type is None"""
+        return self._lookup(("docid", id, type))
+
+    def by_docnumber(self, docnumber: str) -> List[BibliographicItem]:
+        return self._lookup(("docnumber", docnumber))
+
+    def by_structuredidentifier(self, **values) -> List[BibliographicItem]:
+        """Items with structured identifier having all the field values
+
+        Keyword arguments are `StructuredIdentifier` fields, `agency`
+        matches any of the agencies, e.g.
+        `by_structuredidentifier(docnumber="19115", agency="ISO")`.
+        """
+        unknown = set(values) - set(_SI_FIELDS)
+        if unknown:
+            raise TypeError(
+                f"unknown structured identifier fields: {sorted(unknown)}")
+        if not values:
+            return []
+        sets = sorted((self._index.get(("si", name, value), {})
+                       for name, value in values.items()), key=len)
+        ids = dict.fromkeys(posting[0] for posting in sets[0]
+                            if all(posting in s for s in sets[1:]))
+        return [self._items[id] for id in ids]
+
+    def by_ics(self, code: str) -> List[BibliographicItem]:
+        return self._lookup(("ics", code))
+
+    def by_technical_committee(self, name: str,
+                               number: int = None) -> List[BibliographicItem]:
+        """Items of technical committee with name, and number unless it's
+        None
+        """
+        return self._lookup(("tc", name, number))
+
+    def _lookup(self, key: Hashable) -> List[BibliographicItem]:
+        return [self._items[id] for id in self._index.get(key, ())]
+
+
+def _item_keys(item: BibliographicItem
+               ) -> Iterator[Tuple[Hashable, Hashable]]:
+    id = item.id
+    for docid in item.docidentifier:
+        yield ("docid", docid.id, None), id
+        if docid.type is not None:
+            yield ("docid", docid.id, docid.type), id
+    if item.docnumber is not None:
+        yield ("docnumber", item.docnumber), id
+    for n, si in enumerate(item.structuredidentifier or ()):
+        for name in _SI_FIELDS:
+            value = getattr(si, name)
+            for v in value if isinstance(value, list) else [value]:
+                if v is not None:
+                    yield ("si", name, v), (id, n)
+    for ics in item.ics:
+        yield ("ics", ics.code), id
+    if item.editorialgroup:
+        for tc in item.editorialgroup.technical_committee:
+            wg = tc.workgroup
+            yield ("tc", wg.name, None), id
+            if wg.number is not None:
+                yield ("tc", wg.name, wg.number), id
@@ -1,9 +1,13 @@
+from __future__ import annotations
+from multiprocessing import Pool
+import codecs
 import datetime
-from typing import List
-
-import bibtexparser
-from bibtexparser.bparser import BibTexParser
-import iso639
+import io
+import logging
+import os
+import re
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple, \
+    Union
 
 from .bibliographic_date import BibliographicDate, BibliographicDateType
 from .bibliographic_item import BibliographicItem, BibliographicItemType
@@ -15,6 +19,7 @@ from .contribution_info import ContributionInfo, ContributorRole, \
 from .document_identifier import DocumentIdentifier
 from .document_relation import DocumentRelation
 from .formatted_string import FormattedString
+from .languages import language_code
 from .localized_string import LocalizedString
 from .person import Person, FullName
 from .place import Place
@@ -22,14 +27,121 @@ from .series import Series, SeriesType
 from .typed_title_string import TypedTitleString, TypedTitleStringCollection
 from .typed_uri import TypedUri
 from .organization import Organization
+from .relaton_bib import pack_dataclass, unpack_dataclass
+
+# number of entries converted by a worker at once
+SPLIT_ENTRIES = 500
+
+
+def from_bibtex(bibtex: str, workers: Optional[int] = 0,
+                split_entries: int = SPLIT_ENTRIES) -> dict:
+    """Parse BibTeX string to dict of bibitems by entry id
+
+    With `workers` of 0 the source is parsed with `bibtexparser`. Otherwise
+    it's split at entries with the reader of `iter_bibtex_entries` into
+    chunks of `split_entries`, which are converted in a pool of processes.
+    Every chunk gets `@string` macros defined before it. The result is
+    merged in the source order, so an entry replaces an earlier one with
+    the same id as without workers.
+
+    Keyword arguments:
+    bibtex -- BibTeX source
+    workers -- number of processes, `os.cpu_count()` if None, convert in
+               the current process if 1, parse with `bibtexparser` if 0
+    split_entries -- number of entries in a chunk
+    """
+    if workers != 0:
+        return _from_bibtex_chunks(bibtex, workers, split_entries)
 
+    import bibtexparser
+    from bibtexparser.bparser import BibTexParser
 
-def from_bibtex(bibtex: str) -> dict:
     # https://github.com/sciunto-org/python-bibtexparser/issues/280#issuecomment-932478235
     parser = BibTexParser(common_strings=True)
     bt = bibtexparser.loads(bibtex, parser)
 
-    return {e["ID"]: BibliographicItem(
+    return {e["ID"]: _fetch_bibliographic_item(e) for e in bt.entries}
+
+
+def _from_bibtex_chunks(bibtex: str, workers: Optional[int],
+                        split_entries: int) -> dict:
+    tasks = _bibtex_tasks(bibtex, split_entries)
+    if workers is None:
+        workers = os.cpu_count()
+
+    if workers <= 1:
+        return {id: item for task in tasks
+                for id, item in _convert_chunk(*task)}
+
+    with Pool(workers) as pool:
+        return _merge_chunks(pool.imap(_bibtex_task, tasks))
+
+
+def _merge_chunks(chunks: Iterator[List[Tuple[str, tuple]]]) -> dict:
+    result = {}
+    for chunk in chunks:
+        for id, packed in chunk:
+            result[id] = unpack_dataclass(packed)
+    return result
+
+
+def _bibtex_tasks(bibtex: str, split_entries: int) \
+        -> Iterator[Tuple[Dict[str, str], List[Tuple[str, str]]]]:
+    """Split source to chunks of blocks with macros defined before them"""
+    strings = dict(COMMON_STRINGS)
+    start = dict(strings)
+    blocks = []
+    entries = 0
+    for kind, body in _iter_blocks(io.StringIO(bibtex), BIBTEX_CHUNK_SIZE):
+        blocks.append((kind, body))
+        if kind == "string":
+            _parse_string(body, strings)
+        elif kind != "preamble":
+            entries += 1
+            if entries == split_entries:
+                yield start, blocks
+                start = dict(strings)
+                blocks = []
+                entries = 0
+    if blocks:
+        yield start, blocks
+
+
+def _bibtex_task(task: Tuple[Dict[str, str], List[Tuple[str, str]]]) \
+        -> List[Tuple[str, tuple]]:
+    return [(id, pack_dataclass(item)) for id, item in _convert_chunk(*task)]
+
+
+def _convert_chunk(strings: Dict[str, str], blocks: List[Tuple[str, str]]) \
+        -> Iterator[Tuple[str, BibliographicItem]]:
+    for kind, body in blocks:
+        if kind == "string":
+            _parse_string(body, strings)
+        elif kind != "preamble":
+            entry = _parse_entry(kind, body, strings)
+            if entry is not None:
+                yield entry["ID"], _fetch_bibliographic_item(entry)
+
+
+def iter_from_bibtex(source: Union[str, IO], common_strings: bool = True) \
+        -> Iterator[Tuple[str, BibliographicItem]]:
+    """Lazily parse BibTeX entries of a source to (id, bibitem) pairs
+
+    Source is read in chunks and an item is yielded as soon as its entry
+    is read, so memory use does not depend on the size of the source.
+    Entries are read the same way `from_bibtex` reads them, pass pairs to
+    `dict` to get its result.
+
+    Keyword arguments:
+    source -- file name or text or binary (UTF-8) file object
+    common_strings -- predefine month macros (`jan`, `feb`, ...)
+    """
+    for entry in iter_bibtex_entries(source, common_strings):
+        yield entry["ID"], _fetch_bibliographic_item(entry)
+
+
+def _fetch_bibliographic_item(e: dict) -> BibliographicItem:
+    return BibliographicItem(
         id=e["ID"],
         docidentifier=_fetch_docid(e),
         fetched=_fetch_fetched(e),
@@ -46,7 +158,7 @@ def from_bibtex(bibtex: str) -> dict:
         link=_fetch_link(e),
         language=_fetch_language(e),
         classification=_fetch_classification(e),
-        keyword=_fetch_keyword(e)) for e in bt.entries}
+        keyword=_fetch_keyword(e))
 
 
 def _fetch_docid(bibtex: dict) \
@@ -66,8 +178,10 @@ def _fetch_fetched(bibtex: dict) -> datetime.datetime:
     # https://dateutil.readthedocs.io/en/stable/index.html
     # to support more formats
     timestamp = bibtex.get("timestamp")
-    return datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S") \
-        if timestamp else None
+    if not timestamp:
+        return None
+    fmt = "%Y-%m-%d %H:%M:%S" if " " in timestamp else "%Y-%m-%d"
+    return datetime.datetime.strptime(timestamp, fmt)
 
 
 def _fetch_type(bibtex: dict) -> str:
@@ -112,13 +226,11 @@ def _fetch_contributor(bibtex: dict) -> List[ContributionInfo]:
                 ContributorRoleType.SCHOOL]:
         value = bibtex.get(key)
         if value:
-            is_publisher = key == "publisher"
-            descr = [] if is_publisher \
+            descr = [] if key == ContributorRoleType.PUBLISHER \
                 else [FormattedString(content="sponsor")]
-            entity_cls = Person if is_publisher else Organization
             contributor.append(
                 ContributionInfo(
-                    entity=entity_cls(name=value),
+                    entity=Organization(name=value),
                     role=[ContributorRole(type=key, description=descr)]))
 
     return contributor
@@ -164,15 +276,15 @@ def _fetch_note(bibtex: dict) -> List[BiblioNote]:
             for k in types if k in bibtex]
 
 
-def _fetch_relation(bibtex: dict) -> TypedTitleStringCollection:
+def _fetch_relation(bibtex: dict) -> List[DocumentRelation]:
     booktitle = bibtex.get("booktitle")
     if not booktitle:
         return []
 
     ttl = TypedTitleString(type=TypedTitleString.Type.MAIN, content=booktitle)
     title = TypedTitleStringCollection([ttl])
-    return DocumentRelation(type=DocumentRelation.Type.partOf,
-                            bibitem=BibliographicItem(title=title))
+    return [DocumentRelation(type=DocumentRelation.Type.partOf,
+                             bibitem=BibliographicItem(title=title))]
 
 
 def _fetch_extent(bibtex: dict) -> List[BibItemLocality]:
@@ -225,7 +337,11 @@ def _fetch_language(bibtex: dict) -> List[str]:
     if not lang:
         return []
 
-    return [iso639.languages.get(name=lang.capitalize()).alpha2]
+    code = language_code(lang)
+    if code is None:
+        logging.warning(f"[relaton-bib] unknown language: {lang}")
+        return []
+    return [code]
 
 
 def _fetch_classification(bibtex: dict) -> List[Classification]:
@@ -242,5 +358,336 @@ def _fetch_classification(bibtex: dict) -> List[Classification]:
 
 def _fetch_keyword(bibtex: dict) -> List[str]:
     keywords = bibtex.get("keywords")
-    return map(lambda s: LocalizedString(s), keywords.split(", ")) \
+    return [LocalizedString(s) for s in keywords.split(", ")] \
         if keywords else []
+
+
+BIBTEX_CHUNK_SIZE = 1 << 16
+
+# the same as in `bibtexparser.bibdatabase`, which imports slow `pyparsing`
+COMMON_STRINGS = {
+    "jan": "January", "feb": "February", "mar": "March", "apr": "April",
+    "may": "May", "jun": "June", "jul": "July", "aug": "August",
+    "sep": "September", "oct": "October", "nov": "November",
+    "dec": "December",
+}
+STANDARD_TYPES = {
+    "article", "book", "booklet", "conference", "inbook", "incollection",
+    "inproceedings", "manual", "mastersthesis", "misc", "phdthesis",
+    "proceedings", "techreport", "unpublished",
+}
+
+_W = "[ \t\r\n]*"
+_WS = re.compile(_W)
+# out of blocks everything up to "@" at start of a line is a comment
+_LINE_AT = re.compile(r"\n" + _W + "@")
+_HEAD = re.compile("@" + _W + "([A-Za-z]+)" + _W)
+_KEY = re.compile("([^,]*),")
+_FIELD_NAME = re.compile(_W + r"([A-Za-z0-9_\-().+]+)" + _W + "=" + _W)
+_STRING_NAME = re.compile(_W + r"([A-Za-z0-9_\-:]+)" + _W + "=" + _W)
+_INTEGER = re.compile("[0-9]+")
+_NAME = re.compile(r"[A-Za-z0-9_\-:]+")
+_CONCAT = re.compile(_W + "#" + _W)
+_FIELD_END = re.compile(_W + "(,?)" + _W)
+_BRACES = re.compile("[{}]")
+_QUOTED = re.compile('[{}"]')
+_PARENS = re.compile('[{}()"]')
+
+# value parts, macro names are (True, name) and text is (False, text)
+_Parts = List[Tuple[bool, str]]
+
+
+def iter_bibtex_entries(source: Union[str, IO], common_strings: bool = True,
+                        chunk_size: int = BIBTEX_CHUNK_SIZE) \
+        -> Iterator[Dict[str, str]]:
+    """Lazily read BibTeX entries as dicts like `bibtexparser` makes them
+
+    Field names and entry type are lowercased, `ENTRYTYPE` and `ID` keys
+    are added, macros of `@string` are expanded, lines of values are
+    stripped and entries of non-standard types are skipped, as
+    `BibTexParser(common_strings=True)` does. Source is read in chunks of
+    `chunk_size`, only current entry is kept in memory. Invalid entries are
+    skipped with a warning, undefined macros are expanded to empty string.
+
+    Keyword arguments:
+    source -- file name or text or binary (UTF-8) file object
+    common_strings -- predefine month macros (`jan`, `feb`, ...)
+    chunk_size -- number of characters or bytes to read at once
+    """
+    strings = dict(COMMON_STRINGS) if common_strings else {}
+    for kind, body in _iter_blocks(source, chunk_size):
+        if kind == "string":
+            _parse_string(body, strings)
+        elif kind != "preamble":
+            entry = _parse_entry(kind, body, strings)
+            if entry is not None:
+                yield entry
+
+
+def _iter_blocks(source: Union[str, IO], chunk_size: int) \
+        -> Iterator[Tuple[str, str]]:
+    if isinstance(source, str):
+        with open(source, encoding="utf-8-sig") as f:
+            yield from _BibtexScanner(f.read, chunk_size).blocks()
+    else:
+        yield from _BibtexScanner(source.read, chunk_size).blocks()
+
+
+class _BibtexScanner:
+    """Splits text read in chunks to `@type{...}` blocks
+
+    Blocks are found by matching braces, content of values isn't parsed
+    here. Text out of blocks and `@comment` are skipped.
+    """
+
+    def __init__(self, read: Callable[[int], Union[str, bytes]],
+                 chunk_size: int):
+        self._read = read
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._start = True
+        self.text = ""
+        self.eof = False
+
+    def fill(self, pos: int) -> int:
+        """Drop text before `pos` and append next chunk, returns new pos"""
+        chunk = self._read(self._chunk_size)
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            data = self._decoder.decode(chunk, not chunk)
+        else:
+            data = chunk[1:] if self._start and chunk[:1] == "\ufeff" \
+                else chunk
+        self._start = False
+        self.eof = not chunk
+        self.text = self.text[pos:] + data
+        return 0
+
+    def blocks(self) -> Iterator[Tuple[str, str]]:
+        """Yield lowercased type and content of every block"""
+        pos = 0
+        skipping = False
+        while True:
+            text = self.text
+            if skipping:
+                m = _LINE_AT.search(text, pos)
+                if m is None:
+                    if self.eof:
+                        return
+                    # keep the last line break, "@" may follow it
+                    nl = text.rfind("\n", pos)
+                    pos = self.fill(nl if nl >= 0 else len(text))
+                    continue
+                pos = m.end() - 1
+                skipping = False
+
+            pos = _WS.match(text, pos).end()
+            if pos == len(text):
+                if self.eof:
+                    return
+                pos = self.fill(pos)
+                continue
+            if text[pos] != "@":
+                skipping = True
+                continue
+
+            block = _block(text, pos)
+            if block is None:
+                if not self.eof:
+                    pos = self.fill(pos)
+                    continue
+                block = None, None, pos + 1
+            kind, body, pos = block
+            if kind is None:
+                skipping = True
+            else:
+                yield kind, body
+
+
+def _block(text: str, pos: int) \
+        -> Optional[Tuple[Optional[str], Optional[str], int]]:
+    """Find block at "@" in `pos`
+
+    Returns None if text ends before the end of the block, otherwise type,
+    content and position after the block. Type is None if there is no
+    block, then the position is where to skip comment from.
+    """
+    m = _HEAD.match(text, pos)
+    if m is None:
+        if _WS.match(text, pos + 1).end() == len(text):
+            return None
+        return None, None, pos + 1
+    start = m.end()
+    if start == len(text):
+        return None
+    kind = m.group(1).lower()
+    if kind == "comment":
+        return None, None, start
+    delimiter = text[start]
+    if delimiter == "{":
+        end = _closing_brace(text, start)
+    elif delimiter == "(":
+        end = _closing_paren(text, start)
+    else:
+        return None, None, pos + 1
+    if end is None:
+        return None
+    if end < 0:
+        return None, None, pos + 1
+    return kind, text[start + 1:end - 1], end
+
+
+def _closing_brace(text: str, pos: int) -> Optional[int]:
+    """Position after brace closing one in `pos`, None if text ends first"""
+    depth = 0
+    for m in _BRACES.finditer(text, pos):
+        depth += 1 if m.group() == "{" else -1
+        if not depth:
+            return m.end()
+    return None
+
+
+def _closing_paren(text: str, pos: int) -> Optional[int]:
+    """Like `_closing_brace` for parenthesis, -1 if braces are unbalanced"""
+    depth = 0
+    quoted = False
+    for m in _PARENS.finditer(text, pos + 1):
+        c = m.group()
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth < 0:
+                return -1
+        elif depth:
+            continue
+        elif c == '"':
+            quoted = not quoted
+        elif c == ")" and not quoted:
+            return m.end()
+    return None
+
+
+def _parse_entry(kind: str, body: str, strings: Dict[str, str]) \
+        -> Optional[Dict[str, str]]:
+    m = _KEY.match(body)
+    key = m.group(1).strip() if m else ""
+    if not key or any(c.isspace() for c in key):
+        logging.warning(f"[relaton-bib] invalid BibTeX entry key: @{kind}"
+                        f"{{{body[:40]}")
+        return None
+
+    entry = {}
+    pos = m.end()
+    while True:
+        m = _FIELD_NAME.match(body, pos)
+        parts, pos = _parse_value(body, m.end(), True) if m else (None, pos)
+        if parts is None:
+            logging.warning(f"[relaton-bib] invalid BibTeX entry: {key}")
+            return None
+        # the first of fields with the same name wins
+        entry.setdefault(m.group(1).lower(), _value(parts, strings, True))
+        m = _FIELD_END.match(body, pos)
+        if m.end() == len(body):
+            break
+        if not m.group(1):
+            logging.warning(f"[relaton-bib] invalid BibTeX entry: {key}")
+            return None
+        pos = m.end()
+
+    if kind not in STANDARD_TYPES:
+        logging.warning(
+            f"[relaton-bib] BibTeX entry type {kind} not standard: {key}")
+        return None
+    entry["ENTRYTYPE"] = kind
+    entry["ID"] = key
+    return entry
+
+
+def _parse_string(body: str, strings: Dict[str, str]):
+    m = _STRING_NAME.match(body)
+    parts, pos = _parse_value(body, m.end(), False) if m else (None, 0)
+    if parts is None or _WS.match(body, pos).end() != len(body):
+        logging.warning(f"[relaton-bib] invalid BibTeX @string: {body[:40]}")
+        return
+    strings[m.group(1).lower()] = _value(parts, strings, False)
+
+
+def _parse_value(body: str, pos: int, integer: bool) \
+        -> Tuple[Optional[_Parts], int]:
+    """Parse integer or parts of string joined with "#" in `pos`
+
+    Returns parts and position after them, parts are None if the value is
+    invalid.
+    """
+    if integer:
+        m = _INTEGER.match(body, pos)
+        if m:
+            return [(False, m.group())], m.end()
+
+    parts = []
+    while True:
+        c = body[pos:pos + 1]
+        if c == "{":
+            end = _closing_brace(body, pos)
+        elif c == '"':
+            end = _closing_quote(body, pos)
+        else:
+            m = _NAME.match(body, pos)
+            if m is None:
+                return None, pos
+            parts.append((True, m.group().lower()))
+            end = m.end()
+        if end is None:
+            return None, pos
+        if c in "{\"":
+            parts.append((False, body[pos + 1:end - 1]))
+        m = _CONCAT.match(body, end)
+        if m is None:
+            return parts, end
+        pos = m.end()
+
+
+def _closing_quote(text: str, pos: int) -> Optional[int]:
+    depth = 0
+    for m in _QUOTED.finditer(text, pos + 1):
+        c = m.group()
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif not depth:
+            return m.end()
+    return None
+
+
+def _value(parts: _Parts, strings: Dict[str, str], strip: bool) -> str:
+    if len(parts) == 1 and not parts[0][0]:
+        value = parts[0][1]
+        if strip:
+            value = _strip_after_new_lines(value)
+        return "" if value == "{}" else value
+
+    result = []
+    for is_name, text in parts:
+        if is_name:
+            value = strings.get(text)
+            if value is None:
+                logging.warning(
+                    f"[relaton-bib] undefined BibTeX string: {text}")
+                value = ""
+            result.append(value)
+        else:
+            result.append(_strip_after_new_lines(text) if strip else text)
+    return "".join(result)
+
+
+def _strip_after_new_lines(text: str) -> str:
+    """Strip leading whitespaces of all but the first line"""
+    lines = text.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return "\n".join(lines)
@@ -0,0 +1,144 @@
+"""BibTeX output of bibitems
+
+Entries are dicts of fields made by `BibliographicItem.to_bibtex_entry`.
+`entry_to_bibtex` renders one the same way as the configured
+`BibTexWriter` of `make_bibtex_writer` does: fields of
+`BIBTEX_DISPLAY_ORDER` go first in that order, then the rest sorted by
+name, every value is wrapped in braces as is. It doesn't sort, pad or
+expand anything, so it's much cheaper than the writer.
+"""
+from __future__ import annotations
+from typing import IO, TYPE_CHECKING, Dict, Iterable
+
+import functools
+import io
+
+if TYPE_CHECKING:
+    from bibtexparser.bwriter import BibTexWriter
+
+BIBTEX_DISPLAY_ORDER = (
+    "tile",
+    "edition",
+    "author",
+    "publisher",
+    "school",
+    "organization",
+    "institution",
+    "address",
+    "note",
+    "annote",
+    "howpublished",
+    "comment",
+    "content",
+    "booktitle",
+    "chapter",
+    "pages",
+    "volume",
+    "year",
+    "month",
+    "urldate",
+    "journal",
+    "number",
+    "series",
+    "type",
+    "mendeley-tags",
+    "mendeley",
+    "keywords",
+    "isbn",
+    "lccn",
+    "issn",
+    "timestamp",
+    "url",
+    "doi",
+    "file2",
+    "month_numeric")
+
+_RANK: Dict[str, int] = {name: i for i, name
+                         in enumerate(BIBTEX_DISPLAY_ORDER)}
+_UNRANKED = len(BIBTEX_DISPLAY_ORDER)
+_KEYS = ("ENTRYTYPE", "ID")
+
+CHUNK_SIZE = 100
+
+
+def make_bibtex_writer(order_entries_by=("ID",)) -> BibTexWriter:
+    """`BibTexWriter` configured to write bibitems
+
+    Writer isn't changed by writing, so one can be shared.
+
+    Keyword arguments:
+    order_entries_by -- fields to sort entries of database by, None to
+                        write them in the order they were added
+    """
+    from bibtexparser.bwriter import BibTexWriter
+
+    writer = BibTexWriter()
+    writer.indent = '  '
+    writer.common_strings = True
+    writer.display_order = BIBTEX_DISPLAY_ORDER
+    writer.order_entries_by = order_entries_by
+    return writer
+
+
+@functools.lru_cache(maxsize=None)
+def shared_bibtex_writer() -> BibTexWriter:
+    """Writer made by `make_bibtex_writer()` on the first call"""
+    return make_bibtex_writer()
+
+
+def _field_key(name: str):
+    return (_RANK.get(name, _UNRANKED), name)
+
+
+def entry_to_bibtex(entry: Dict[str, str]) -> str:
+    """Render BibTeX entry, output is the same as of `BibTexWriter`
+
+    Keyword arguments:
+    entry -- dict of `ENTRYTYPE`, `ID` and string values of fields
+    """
+    out = ["@", entry["ENTRYTYPE"], "{", entry["ID"]]
+    for name in sorted(entry.keys() - _KEYS, key=_field_key):
+        value = entry[name]
+        if not isinstance(value, str):
+            raise TypeError(f"The field {name} in entry {entry['ID']} "
+                            "must be a string")
+        out += (",\n  ", name, " = {", value, "}")
+    out.append("\n}\n\n")
+    return "".join(out)
+
+
+def to_bibtex_many(items: Iterable, fileobj: IO,
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    """Serialize bibitems to stream as BibTeX entries
+
+    Entries are rendered with `entry_to_bibtex` and written in chunks of
+    `chunk_size`, so memory doesn't grow with the number of items. Entries
+    keep the order of items, output is the same as of `to_bibtex` of every
+    item joined together.
+
+    Keyword arguments:
+    items -- iterable of bibitems
+    fileobj -- text or binary stream, binary one gets UTF-8 bytes
+    chunk_size -- number of entries written at once
+
+    Returns number of written items.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    text = isinstance(fileobj, io.TextIOBase)
+    chunk = []
+
+    def flush():
+        out = "".join(chunk)
+        fileobj.write(out if text else out.encode("utf-8"))
+        chunk.clear()
+
+    count = 0
+    for item in items:
+        chunk.append(entry_to_bibtex(item.to_bibtex_entry()))
+        count += 1
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    return count
@@ -0,0 +1,227 @@
+"""Compact binary encoding of bibitems
+
+Data starts with `MAGIC` and a format version byte. Version 1 continues
+with a little-endian header, a string table and a stream of tokens::
+
+    width: u8 (2 or 4) | strings count: u32 | strings size: u32
+    | length of every string in characters: u32 * count
+    | all the strings in UTF-8 | tokens: u16 or u32 each
+
+Every value is a token `(arg << 3) | kind`:
+
+- str -- `arg` is index in the string table
+- list, dict -- `arg` is the length, then go items or key, value pairs
+- None, False, True -- `arg` is 0, 1 or 2
+- int -- `arg` is the value if it fits, otherwise index of its decimal
+  representation in the string table
+- float -- `arg` is index of `repr` of the value in the string table
+
+Strings are interned: every distinct string is stored once and values
+refer to it by index. Indexes start after the strings of `STATIC_STRINGS`
+for the version (keys, role and date types, languages, scripts, formats),
+so the most frequent ones are never written at all. The string table is
+decoded with one call and tokens are loaded with `array`, so decoding
+doesn't parse data byte by byte.
+
+Bibitems are encoded in the `to_dict` form and decoded with `from_dict` so
+schema changes are backward compatible: unknown keys are ignored and
+missing ones get defaults. `STATIC_STRINGS` of a version must never change,
+a new version may only add to them.
+"""
+from array import array
+from typing import Any, Callable, Dict, List
+
+import struct
+import sys
+
+from .bibliographic_item import BibliographicItem
+from .dict_parser import from_dict
+
+MAGIC = b"RBIB"
+VERSION = 1
+
+_STR, _LIST, _DICT, _CONST, _INT, _BIGINT, _FLOAT = range(7)
+_CONSTS = (None, False, True)
+_MAX_ARG = 0xFFFFFFFF >> 3
+
+_HEADER = struct.Struct("<BII")
+_SWAP = sys.byteorder == "big"
+
+STATIC_STRINGS = {
+    1: (
+        # keys
+        "id", "type", "docnumber", "edition", "doctype", "subdoctype",
+        "fetched", "title", "link", "docid", "date", "contributor",
+        "abstract", "biblionote", "copyright", "relation", "series", "place",
+        "extent", "classification", "keyword", "ics", "revdate", "draft",
+        "language", "script", "accesslocation", "license", "formattedref",
+        "docstatus", "medium", "validity", "editorialgroup",
+        "structuredidentifier", "content", "format", "value", "from", "to",
+        "scope", "owner", "role", "description", "person", "organization",
+        "name", "abbreviation", "subdivision", "identifier", "url",
+        "contact", "surname", "completename", "forename", "initial",
+        "addition", "prefix", "affiliation", "street", "city", "state",
+        "country", "postcode", "bibitem", "locality", "source_locality",
+        "locality_stack", "source_locality_stack", "reference_from",
+        "reference_to", "stage", "substage", "iteration", "number",
+        "partnumber", "uri", "region", "code", "text", "agency", "class",
+        "begins", "ends", "revision", "form", "size", "scale",
+        # values
+        "text/plain", "text/html", "application/x-isodoc+xml", "en", "fr",
+        "Latn", "main", "title-main", "title-intro", "title-part",
+        "published", "issued", "updated", "accessed", "created", "author",
+        "editor", "publisher", "distributor", "standard", "src", "obp",
+        "rss", "pdf", "doi", "ISO", "IEC", "URN", "DOI", "section",
+        "clause", "page", "updates", "obsoletes", "instance", "partOf",
+        "hasPart", "phone", "email", "isni", "orcid",
+    ),
+}
+
+_STATIC_INDEX = {version: {s: i for i, s in enumerate(strings)}
+                 for version, strings in STATIC_STRINGS.items()}
+
+
+def dumps(item: BibliographicItem) -> bytes:
+    """Encode bibitem to bytes"""
+    return encode(item.to_dict())
+
+
+def loads(data: bytes) -> BibliographicItem:
+    """Decode bibitem from bytes made by `dumps`"""
+    return from_dict(decode(data))
+
+
+def encode(obj: Any) -> bytes:
+    """Encode value made of None, bool, int, float, str, list and dict"""
+    strings: List[str] = []
+    tokens: List[int] = []
+    _value_encoder(dict(_STATIC_INDEX[VERSION]), strings, tokens)(obj)
+    if len(_STATIC_INDEX[VERSION]) + len(strings) > _MAX_ARG:
+        raise ValueError("too many strings to encode")
+
+    width = 2 if max(tokens) <= 0xFFFF else 4
+    tokens = array("H" if width == 2 else "I", tokens)
+    lengths = array("I", [len(s) for s in strings])
+    if _SWAP:  # pragma: no cover
+        tokens.byteswap()
+        lengths.byteswap()
+    text = "".join(strings).encode("utf-8")
+
+    return b"".join([MAGIC, bytes([VERSION]),
+                     _HEADER.pack(width, len(strings), len(text)),
+                     lengths.tobytes(), text, tokens.tobytes()])
+
+
+def decode(data: bytes) -> Any:
+    """Decode value made by `encode`, `data` may be any bytes-like object"""
+    data = memoryview(data)
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a relaton-bib binary data")
+    pos = len(MAGIC)
+    version = data[pos]
+    if version not in STATIC_STRINGS:
+        raise ValueError(f"unsupported binary format version: {version}")
+    pos += 1
+
+    try:
+        width, count, size = _HEADER.unpack_from(data, pos)
+        pos += _HEADER.size
+        strings = list(STATIC_STRINGS[version])
+        if count:
+            lengths = array("I")
+            lengths.frombytes(data[pos:pos + count * 4])
+            pos += count * 4
+            if _SWAP:  # pragma: no cover
+                lengths.byteswap()
+            text = str(data[pos:pos + size], "utf-8")
+            pos += size
+            start = 0
+            for length in lengths:
+                end = start + length
+                strings.append(text[start:end])
+                start = end
+            if len(lengths) != count or start != len(text):
+                raise IndexError
+
+        tokens = array("H" if width == 2 else "I")
+        tokens.frombytes(data[pos:])
+        if _SWAP:  # pragma: no cover
+            tokens.byteswap()
+        it = iter(tokens)
+        value = _value_decoder(strings, it.__next__)()
+    except (IndexError, StopIteration, struct.error, UnicodeDecodeError,
+            ValueError):
+        raise ValueError("truncated binary data") from None
+
+    if next(it, None) is not None:
+        raise ValueError("trailing data after value")
+    return value
+
+
+def _value_encoder(index: Dict[str, int], strings: List[str],
+                   tokens: List[int]) -> Callable[[Any], None]:
+    offset = len(index)
+    add = tokens.append
+
+    def string(s: str) -> int:
+        idx = index.get(s)
+        if idx is None:
+            idx = index[s] = offset + len(strings)
+            strings.append(s)
+        return idx
+
+    def value(v):
+        t = type(v)
+        if t is str:
+            idx = index.get(v)
+            add((string(v) if idx is None else idx) << 3)
+        elif t is dict:
+            add(len(v) << 3 | _DICT)
+            for key, val in v.items():
+                idx = index.get(key)
+                add((string(key) if idx is None else idx) << 3)
+                value(val)
+        elif t is list or t is tuple:
+            add(len(v) << 3 | _LIST)
+            for val in v:
+                value(val)
+        elif v is None or t is bool:
+            add(_CONSTS.index(v) << 3 | _CONST)
+        elif t is int:
+            if 0 <= v <= _MAX_ARG:
+                add(v << 3 | _INT)
+            else:
+                add(string(str(v)) << 3 | _BIGINT)
+        elif t is float:
+            add(string(repr(v)) << 3 | _FLOAT)
+        elif isinstance(v, str):
+            # str based enums
+            add(string(str.__str__(v)) << 3)
+        else:
+            raise TypeError(f"unable to encode {t.__name__}")
+
+    return value
+
+
+def _value_decoder(strings: List[str], nxt: Callable[[], int]) \
+        -> Callable[[], Any]:
+    def value():
+        token = nxt()
+        kind = token & 7
+        if kind == _STR:
+            return strings[token >> 3]
+        elif kind == _DICT:
+            return {strings[nxt() >> 3]: value() for _ in range(token >> 3)}
+        elif kind == _LIST:
+            return [value() for _ in range(token >> 3)]
+        elif kind == _CONST:
+            return _CONSTS[token >> 3]
+        elif kind == _INT:
+            return token >> 3
+        elif kind == _BIGINT:
+            return int(strings[token >> 3])
+        elif kind == _FLOAT:
+            return float(strings[token >> 3])
+        raise ValueError(f"unknown token kind {kind}")
+
+    return value
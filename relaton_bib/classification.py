@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class Classification:
     value: str
@@ -11,8 +13,8 @@ class Classification:
 
     def to_xml(self, parent):
         name = "classification"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         node.text = self.value
 
         if self.type:
@@ -20,6 +22,12 @@ class Classification:
 
         return node
 
+    def to_dict(self):
+        result = {"value": self.value}
+        if self.type:
+            result["type"] = self.type
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}.classification" if prefix else "classification"
         out = [f"{pref}::"] if count > 1 else []
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from enum import Enum
 
 import logging
-import xml.etree.ElementTree as ET
+
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
 class ContactType(str, Enum):
@@ -16,6 +18,7 @@ class ContactType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass
 class Contact:
     type: str
@@ -27,11 +30,14 @@ class Contact:
                 f"[relaton-bib] invalid contact type: {self.type}")
 
     def to_xml(self, parent):
-        result = ET.Element(self.type) if parent is None \
-            else ET.SubElement(parent, self.type)
+        result = Element(self.type) if parent is None \
+            else SubElement(parent, self.type)
         result.text = self.value
         return result
 
+    def to_dict(self):
+        return {"type": self.type, "value": self.value}
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         out = [f"{pref}contact::"] if count > 1 else []
@@ -4,12 +4,13 @@ from enum import Enum
 from typing import List, Union
 
 import logging
-import xml.etree.ElementTree as ET
 
 from .formatted_string import FormattedString
-from .relaton_bib import lang_filter, to_ds_instance
+from .interning import intern_str
+from .relaton_bib import lang_filter, to_ds_instance, slotted
 from .person import Person
 from .organization import Organization
+from .xml_backend import Element, SubElement
 
 
 class ContributorRoleType(str, Enum):
@@ -29,12 +30,14 @@ class ContributorRoleType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass
 class ContributorRole:
     type: str
     description: list[FormattedString] = field(default_factory=list)
 
     def __post_init__(self):
+        self.type = intern_str(self.type)
         if not (ContributorRoleType.has_value(self.type)):
             logging.warning(
                 f"[relaton-bib] Contributor's type {self.type} is invalid")
@@ -46,15 +49,22 @@ class ContributorRole:
 
     def to_xml(self, parent, opts={}):
         name = "role"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         result.attrib["type"] = self.type
 
         for d in lang_filter(self.description, opts):
-            d.to_xml(ET.SubElement(result, "description"))
+            d.to_xml(SubElement(result, "description"))
 
         return result
 
+    def to_dict(self):
+        if not self.description:
+            return self.type
+
+        return {"type": self.type,
+                "description": [d.to_dict() for d in self.description]}
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         out = [f"{prefix}::"] if count > 1 else []
@@ -66,6 +76,7 @@ class ContributorRole:
         return "\n".join(out)
 
 
+@slotted
 @dataclass
 class ContributionInfo:
     entity: Union[Person, Organization]
@@ -83,6 +94,12 @@ class ContributionInfo:
     def to_xml(self, parent, opts={}):
         return self.entity.to_xml(parent, opts)
 
+    def to_dict(self):
+        name = "person" if isinstance(self.entity, Person) \
+            else "organization"
+        return {name: self.entity.to_dict(),
+                "role": [r.to_dict() for r in self.role]}
+
     def to_asciibib(self, prefix="", count=1):
         # V ported from original code but looks strange
         pref = (prefix.split(".") + [None])[0]
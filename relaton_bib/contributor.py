@@ -4,8 +4,10 @@ from typing import List, Union
 
 from .address import Address
 from .contact import Contact
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class Contributor:
     uri: str = None
@@ -20,6 +22,12 @@ class Contributor:
             c.to_xml(parent)
         return parent
 
+    def to_dict(self):
+        result = {"url": self.uri} if self.uri else {}
+        if self.contact:
+            result["contact"] = [c.to_dict() for c in self.contact]
+        return result
+
     def to_asciibib(self, prefix=""):
         pref = f"{prefix}." if prefix else prefix
         out = []
@@ -4,12 +4,14 @@ from typing import List
 
 import datetime
 import re
-import xml.etree.ElementTree as ET
 
 from .contribution_info import ContributionInfo
-from .relaton_bib import to_ds_instance
+from .organization import Organization
+from .relaton_bib import to_ds_instance, slotted
+from .xml_backend import Element, SubElement
 
 
+@slotted
 @dataclass
 class CopyrightAssociation:
     from_: datetime.date
@@ -35,19 +37,34 @@ class CopyrightAssociation:
 
     def to_xml(self, parent, opts={}):
         name = "copyright"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
-        ET.SubElement(result, "from").text = str(self.from_.year) \
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
+        SubElement(result, "from").text = str(self.from_.year) \
             if self.from_ else "unknown"
         if self.to:
-            ET.SubElement(result, "to").text = str(self.to.year)
+            SubElement(result, "to").text = str(self.to.year)
         for o in self.owner:
-            o.to_xml(ET.SubElement(result, "owner"), opts)
+            o.to_xml(SubElement(result, "owner"), opts)
         if self.scope:
-            ET.SubElement(result, "scope").text = self.scope
+            SubElement(result, "scope").text = self.scope
 
         return result
 
+    def to_dict(self):
+        def owner(o):
+            entity = o.entity.to_dict()
+            return entity if isinstance(o.entity, Organization) \
+                else {"person": entity}
+
+        result = {"owner": [owner(o) for o in self.owner]}
+        if self.from_:
+            result["from"] = str(self.from_.year)
+        if self.to:
+            result["to"] = str(self.to.year)
+        if self.scope:
+            result["scope"] = self.scope
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}.copyright" if prefix else "copyright"
         out = [f"{pref}::"] if count > 1 else []
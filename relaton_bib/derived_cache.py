@@ -0,0 +1,91 @@
+"""Cache of views derived from bibitems
+
+`BibliographicItem.to_all_parts` and `to_most_recent_reference` return the
+cached result when `BibliographicItem.derived_cache` is set::
+
+    BibliographicItem.derived_cache = DerivedCache(maxsize=1024)
+
+Results are cached per item and view, together with a fingerprint of the
+item: values of all its fields, and contents of the fields the view
+changes (identifiers, titles, languages and number of relations). A
+result is made again when the fingerprint changes, so reassigning any
+field of an item, or changing its identifying fields in place, invalidates
+its views. Other fields of derived items are shared with the source item,
+so their changes in place are seen by the views.
+
+Cached bibitems are returned to every caller, so they shouldn't be
+changed. The cache keeps references to the items, the least recently used
+entry is dropped when there are more than `maxsize` of them.
+"""
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable
+
+import threading
+
+# default max number of cached views
+DERIVED_CACHE_SIZE = 1024
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class DerivedCache:
+    """Thread-safe LRU cache of views derived from items
+
+    Keyword arguments:
+    maxsize -- max number of cached views
+    """
+
+    def __init__(self, maxsize: int = DERIVED_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, item: Any, view: Hashable, fingerprint: Any,
+            make: Callable[[], Any]) -> Any:
+        """Cached view of item, made with `make` if it's not cached yet
+
+        Keyword arguments:
+        item -- source of the view
+        view -- name and arguments of the view, views with unhashable
+                arguments are made every time
+        fingerprint -- values the view is made from, the cached view is
+                       used only if they are equal to the cached ones
+        make -- function making the view
+        """
+        key = (id(item), view)
+        try:
+            hash(key)
+        except TypeError:
+            return make()
+
+        with self._lock:
+            # the entry refers to the item, so its id isn't reused while
+            # the entry exists
+            entry = self._data.get(key)
+            if entry is not None and entry[1] == fingerprint:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = make()
+        with self._lock:
+            self._data[key] = (item, fingerprint, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Statistics like of `functools.lru_cache`"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._data))
+
+    def cache_clear(self):
+        """Drop all the views and statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
@@ -2,8 +2,6 @@ import re
 import datetime
 from typing import Union, Dict, List
 
-import dateutil.parser as DU
-
 from .address import Address
 from .affiliation import Affiliation
 from .biblio_version import BibliographicItemVersion
@@ -37,21 +35,55 @@ from .medium import Medium
 from .validity import Validity
 from .workgroup import WorkGroup
 
-from .relaton_bib import dict_replace_key
+from .interning import intern_str
+from .relaton_bib import dict_replace_key, is_trusted, json_loads, \
+    trusted_input
+
+
+def from_json(data: Union[str, bytes],
+              trusted: bool = False) -> BibliographicItem:
+    """Create bibitem from JSON made by `BibliographicItem.to_json`
+
+    Uses `orjson` if it's installed.
+
+    Keyword arguments:
+    data -- JSON
+    trusted -- see `from_dict`
+    """
+    return from_dict(json_loads(data), trusted)
+
 
+def from_dict(item: Dict, trusted: bool = False) -> BibliographicItem:
+    """Create bibitem from dict made by `BibliographicItem.to_dict`
 
-def from_dict(item: Dict) -> BibliographicItem:
+    Keyword arguments:
+    item -- dict
+    trusted -- item is made from valid bibitem (e.g. read from own cache),
+               build it with `BibliographicItem.construct` and skip
+               validation of nested values, see `trusted_input`
+    """
     if not isinstance(item, dict):
         return None
 
-    return BibliographicItem(
-        fetched=item.get("fetched", datetime.datetime.now()),
+    with trusted_input(trusted):
+        fields = _fields(item)
+        if is_trusted():
+            return BibliographicItem.construct(**fields)
+        return BibliographicItem(**fields)
+
+
+def _fields(item: Dict) -> Dict:
+    return dict(
+        fetched=_fetched(item),
         id=item.get("id"),
         type=item.get("type"),
         docidentifier=_docid(item),
         docnumber=item.get("docnumber"),
-        script=_array(item.get("script")),
-        language=_array(item.get("language")),
+        edition=item.get("edition"),
+        doctype=item.get("doctype"),
+        subdoctype=item.get("subdoctype"),
+        script=list(map(intern_str, _array(item.get("script")))),
+        language=list(map(intern_str, _array(item.get("language")))),
         version=_version(item),
         date=_dates(item),
         title=_titles(item),
@@ -60,7 +92,7 @@ def from_dict(item: Dict) -> BibliographicItem:
         copyright=_copyright(item),
         link=[TypedUri(**link) for link in _array(item.get("link"))],
         ics=[ICS(**ics) for ics in _array(item.get("ics"))],
-        keyword=_array(item.get("keyword")),
+        keyword=[_localizedstring(k) for k in _array(item.get("keyword"))],
         accesslocation=_array(item.get("accesslocation")),
         place=_places(item),
         extent=_extent(item),
@@ -81,28 +113,50 @@ def from_dict(item: Dict) -> BibliographicItem:
 def _array(arr: Union[List, Dict, None]) -> List:
     if not arr:
         return []
-    elif not isinstance(arr, List):
+    elif not isinstance(arr, list):
         return [arr]
 
     return arr
 
 
+def _fetched(dictitem: Dict) -> datetime.date:
+    fetched = dictitem.get("fetched")
+    if not isinstance(fetched, str):
+        return fetched
+
+    for parse in [datetime.date.fromisoformat,
+                  datetime.datetime.fromisoformat]:
+        try:
+            return parse(fetched)
+        except ValueError:
+            pass
+    import dateutil.parser as DU
+    return DU.parse(fetched)
+
+
 def _extent(dictitem: Dict) -> List[BibItemLocality]:
-    extent = _array(dictitem.get("extent"))
-    return [BibItemLocality(reference_from=e.get("reference_from"),
-                            reference_to=e.get("reference_to"),
-                            type=e.get("type")) for e in extent]
+    return [_locality(e, BibItemLocality)
+            for e in _array(dictitem.get("extent"))]
+
+
+def _locality(loc: Dict, klass=Locality) -> BibItemLocality:
+    ref_from = loc.get("reference_from")
+    ref_to = loc.get("reference_to")
+    return klass(
+        type=loc.get("type"),
+        reference_from=_localizedstring(ref_from) if ref_from else None,
+        reference_to=_localizedstring(ref_to) if ref_to else None)
 
 
 def _titles(dictitem: Dict) -> TypedTitleStringCollection:
     result = []
     for title in _array(dictitem.get("title")):
-        if isinstance(title, Dict):
+        if isinstance(title, dict):
             result.append(TypedTitleString(**title))
         elif isinstance(title, str):
-            result.append(TypedTitleString.from_string(title))
+            result.extend(TypedTitleString.from_string(title))
 
-    return TypedTitleStringCollection(result) if result else None
+    return TypedTitleStringCollection(result)
 
 
 def _dates(dictitem: Dict) -> List[BibliographicDate]:
@@ -116,7 +170,11 @@ def _dates(dictitem: Dict) -> List[BibliographicDate]:
 
 def _version(dictitem: Dict) -> BibliographicItemVersion:
     revdate = dictitem.get("revdate")
-    return BibliographicItemVersion(revision_date=revdate) if revdate else None
+    draft = _array(dictitem.get("draft"))
+    if not (revdate or draft):
+        return None
+
+    return BibliographicItemVersion(revision_date=revdate, draft=draft)
 
 
 def _abstract(dictitem: Dict) -> List[FormattedString]:
@@ -163,7 +221,7 @@ def _notes(dictitem: Dict) -> List[BiblioNote]:
         else:
             result.append(BiblioNote(**note))
 
-    return BiblioNoteCollection(result) if result else None
+    return BiblioNoteCollection(result)
 
 
 def _docstatus(dictitem: Dict) -> DocumentStatus:
@@ -191,10 +249,11 @@ def _contributors(dictitem: Dict) -> List[ContributionInfo]:
     for c in _array(contrib):
         roles = []
         for r in _array(c.get("role")):
-            if isinstance(r, Dict):
+            if isinstance(r, dict):
                 roles.append(ContributorRole(
                     type=r.get("type"),
-                    description=_array(r.get("description"))))
+                    description=[_role_description(d) for d
+                                 in _array(r.get("description"))]))
             else:
                 roles.append(ContributorRole(type=r))
 
@@ -209,6 +268,13 @@ def _contributors(dictitem: Dict) -> List[ContributionInfo]:
     return result
 
 
+def _role_description(descr: Union[str, Dict]) -> LocalizedString:
+    if isinstance(descr, dict) and "format" in descr:
+        return FormattedString(**descr)
+
+    return _localizedstring(descr)
+
+
 def _org(org: Dict) -> Organization:
     if not org:
         return None
@@ -218,12 +284,16 @@ def _org(org: Dict) -> Organization:
                          for idft in _array(org.get("identifier"))]
     org["subdivision"] = [_localizedstring(subd)
                           for subd in _array(org.get("subdivision"))]
+    if org.get("abbreviation"):
+        org["abbreviation"] = _localizedstring(org["abbreviation"])
+    org["contact"] = _contacts(org)
 
     return Organization(**dict_replace_key(org, {"url": "uri"}))
 
 
 def _person(person: Dict) -> Person:
     return Person(
+        uri=person.get("url"),
         name=_fullname(person),
         affiliation=_affiliation(person),
         contact=_contacts(person),
@@ -257,11 +327,12 @@ def _affiliation(person: Dict) -> List[Affiliation]:
         descr = []
         for d in _array(a.get("description")):
             cnt = d
-            if not isinstance(d, Dict):
+            if not isinstance(d, dict):
                 cnt = {"content": d}
             descr.append(FormattedString(**cnt))
         result.append(Affiliation(
             organization=_org(a.get("organization")),
+            name=_localizedstring(a["name"]) if a.get("name") else None,
             description=descr
         ))
 
@@ -276,7 +347,7 @@ def _contacts(person: Dict) -> List[Contact]:
     result = []
     for a in _array(contact):
         if a.get("city") or a.get("country"):
-            a["street"] = _array(a.pop("street"))
+            a["street"] = _array(a.pop("street", None))
             result.append(Address(**a))
         else:
             result.append(Contact(**a))
@@ -288,25 +359,28 @@ def _copyright(dictitem: Dict) -> List[CopyrightAssociation]:
     result = []
 
     for c in _array(dictitem.get("copyright")):
-        if "owner" in c:
-            owner = []
-            for o in _array(c.get("owner")):
-                entity = None
-                if "person" in c:
-                    entity = _person(c.get("person"))
-                else:
-                    entity = _org(c.get("organization"))
-                owner.append(ContributionInfo(entity=entity))
-            c["owner"] = owner
+        owner = []
+        for o in _array(c.get("owner")):
+            if "person" in o:
+                entity = _person(o["person"])
+            else:
+                entity = _org(o.get("organization", o))
+            owner.append(ContributionInfo(entity=entity))
 
         result.append(CopyrightAssociation(
-            from_=DU.parse(c.get("from")),
-            owner=c.get("owner")
+            from_=_year(c.get("from")),
+            to=_year(c.get("to")),
+            owner=owner,
+            scope=c.get("scope")
         ))
 
     return result
 
 
+def _year(value: Union[str, int, datetime.date]) -> Union[str, datetime.date]:
+    return str(value) if isinstance(value, int) else value
+
+
 def _relations(dictitem: Dict) -> List[DocumentRelation]:
     relations = dictitem.get("relation")
     if not relations:
@@ -315,7 +389,7 @@ def _relations(dictitem: Dict) -> List[DocumentRelation]:
     result = []
     for r in _array(relations):
         if r.get("description"):
-            r["description"] = FormattedString(**r.get("description"))
+            r["description"] = _formattedstring(r.get("description"))
 
         result.append(DocumentRelation(
             type=r.get("type"),
@@ -336,10 +410,10 @@ def _relation_locality(rel: Dict) -> List[LocalityStack]:
     for bl in _array(rel.get("locality")):
         locality = None
         if "locality_stack" in bl:
-            locality = [Locality(**ls)
+            locality = [_locality(ls)
                         for ls in _array(bl.get("locality_stack"))]
         else:
-            locality = [Locality(**bl)]
+            locality = [_locality(bl)]
         result.append(LocalityStack(locality=locality))
     return result
 
@@ -350,10 +424,10 @@ def _relation_source_locality(rel: Dict) -> List[SourceLocalityStack]:
     for s in _array(src_locality):
         src_locs = None
         if "source_locality_stack" in s:
-            src_locs = [SourceLocality(**loc)
-                        for loc in src_locality["source_locality_stack"]]
+            src_locs = [_locality(loc, SourceLocality)
+                        for loc in _array(s["source_locality_stack"])]
         else:
-            src_locs = [SourceLocality(**s)]
+            src_locs = [_locality(s, SourceLocality)]
         result.append(SourceLocalityStack(locality=src_locs))
     return result
 
@@ -365,7 +439,7 @@ def _series(dictitem: Dict) -> List[Series]:
             s["formattedref"] = _formattedref(s.pop("formattedref"))
 
         if "title" in s:
-            if not isinstance(s["title"], Dict):
+            if not isinstance(s["title"], dict):
                 s["title"] = {"content": s.pop("title")}
             s["title"] = _typed_string(s.pop("title"))
 
@@ -406,10 +480,15 @@ def _validity(dictitem: Dict) -> Validity:
 
 
 def _parse_validity_time(val: Dict, period: str) -> datetime.datetime:
-    if isinstance(val.get(period), datetime.datetime):
-        return val.get(period)
+    value = val.get(period)
+    if not value or isinstance(value, datetime.datetime):
+        return value
 
-    return DU.parse(val.get(period))
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        import dateutil.parser as DU
+        return DU.parse(value)
 
 
 def _editorialgroup(dictitem: Dict) -> EditorialGroup:
@@ -426,7 +505,7 @@ def _ics(dictitem: Dict) -> List[ICS]:
 def _structuredidentifiers(dictitem: Dict) -> StructuredIdentifierCollection:
     result = []
     for si in _array(dictitem.get("structuredidentifier")):
-        si["agency"] = _array(si.pop("agency"))
+        si["agency"] = _array(si.pop("agency", None))
         result.append(StructuredIdentifier(
             **dict_replace_key(si, {"class": "class_"})))
 
@@ -437,27 +516,32 @@ def _localname(name: Dict, person: Dict) -> LocalizedString:
     if not name:
         return None
 
-    result = name if isinstance(name, Dict) else {}
-    if isinstance(person.get("name"), Dict):
+    result = name if isinstance(name, dict) else {}
+    if isinstance(person.get("name"), dict):
         pname = person.get("name")
         if "language" not in result and pname.get("language"):
             result["language"] = pname.get("language")
         if "script" not in result and pname.get("script"):
             result["script"] = pname.get("script")
-        result["content"] = name.get("content") if isinstance(name, Dict) \
+        result["content"] = name.get("content") if isinstance(name, dict) \
             else name
 
     return LocalizedString(**result)
 
 
 def _localizedstring(lst: Union[str, List, Dict]) -> LocalizedString:
-    return LocalizedString(**lst) if isinstance(lst, Dict) \
+    return LocalizedString(**lst) if isinstance(lst, dict) \
         else LocalizedString(content=lst)
 
 
+def _formattedstring(fs: Union[str, Dict]) -> FormattedString:
+    return FormattedString(**fs) if isinstance(fs, dict) \
+        else FormattedString(content=fs)
+
+
 def _formattedref(frf: Union[str, Dict]) -> FormattedRef:
     if not frf:
         return None
 
-    return FormattedRef(**frf) if isinstance(frf, Dict) \
+    return FormattedRef(**frf) if isinstance(frf, dict) \
         else FormattedRef(content=frf)
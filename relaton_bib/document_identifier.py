@@ -4,7 +4,10 @@ from enum import Enum
 
 import logging
 import re
-import xml.etree.ElementTree as ET
+
+from .xml_backend import SubElement
+from .interning import intern_str
+from .relaton_bib import slotted
 
 
 class DocumentIdType(str, Enum):
@@ -14,12 +17,16 @@ class DocumentIdType(str, Enum):
     URN = "URN"
 
 
+@slotted
 @dataclass
 class DocumentIdentifier:
     id: str
     type: str = None
     scope: str = None
 
+    def __post_init__(self):
+        self.type = intern_str(self.type)
+
     def remove_part(self):
         if self.type == DocumentIdType.CN_STD:
             self.id = re.sub(r"\.\d+", "", self.id)
@@ -55,7 +62,7 @@ class DocumentIdentifier:
         lid = re.sub(lid_re, r"\1", self.id) \
             if self.type == DocumentIdType.URN and lang else self.id
 
-        result = ET.SubElement(parent, "docidentifier")
+        result = SubElement(parent, "docidentifier")
         result.text = lid
         if self.type:
             result.attrib["type"] = self.type
@@ -64,6 +71,13 @@ class DocumentIdentifier:
 
         return result
 
+    def to_dict(self):
+        # "type" is kept even if None, otherwise `from_dict` takes it from id
+        result = {"id": self.id, "type": self.type}
+        if self.scope:
+            result["scope"] = self.scope
+        return result
+
     def to_asciibib(self, prefix="", count=1) -> str:
         pref = f"{prefix}." if prefix else prefix
 
@@ -4,14 +4,16 @@ from enum import Enum
 from typing import Union
 
 import logging
-import xml.etree.ElementTree as ET
 
 from .bibliographic_item import *
 from .formatted_string import FormattedString
 from .bib_item_locality import Locality, LocalityStack, SourceLocality, \
     SourceLocalityStack
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class DocumentRelation:
     class Type(str, Enum):
@@ -101,11 +103,11 @@ class DocumentRelation:
         opts.pop("note", None)
 
         name = "relation"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         result.attrib["type"] = self.type
         if self.description:
-            self.description.to_xml(ET.SubElement(result, "description"))
+            self.description.to_xml(SubElement(result, "description"))
 
         self.bibitem.to_xml(result, {"embedded": True, **opts})
 
@@ -117,6 +119,19 @@ class DocumentRelation:
 
         return result
 
+    def to_dict(self):
+        result = {"type": self.type}
+        if self.description:
+            result["description"] = self.description.to_dict()
+        if self.bibitem:
+            result["bibitem"] = self.bibitem.to_dict()
+        if self.locality:
+            result["locality"] = [loc.to_dict() for loc in self.locality]
+        if self.source_locality:
+            result["source_locality"] = [loc.to_dict()
+                                         for loc in self.source_locality]
+        return result
+
     def to_asciibib(self, prefix="", count=1) -> str:
         pref = f"{prefix}." if prefix else prefix
         out = [f"{pref}type:: {self.type}"]
@@ -3,9 +3,10 @@ from dataclasses import dataclass
 from typing import List
 
 from .document_relation import DocumentRelation
-from .relaton_bib import delegate
+from .relaton_bib import delegate, slotted
 
 
+@slotted
 @dataclass
 @delegate("array", "append", "__getitem__", "__len__", "__iter__",
           "__reversed__", "__contains__")
@@ -33,6 +34,9 @@ class DocRelationCollection:
         # https://stackoverflow.com/a/2323165/902217
         return any(x for x in self.array)
 
+    def to_dict(self):
+        return [r.to_dict() for r in self.array]
+
     def to_xml(self, parent, opts={}):
         # NOTE original gem missing to_xml
         for r in self.array:
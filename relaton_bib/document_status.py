@@ -1,14 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
 
-from .relaton_bib import to_ds_instance
+from .relaton_bib import to_ds_instance, slotted
+from .xml_backend import Element, SubElement
 
 
+@slotted
 @dataclass
 class DocumentStatus:
 
+    @slotted
     @dataclass
     class Stage:
         value: str
@@ -20,6 +22,12 @@ class DocumentStatus:
             parent.text = self.value
             return parent
 
+        def to_dict(self):
+            if not self.abbreviation:
+                return self.value
+
+            return {"value": self.value, "abbreviation": self.abbreviation}
+
         # NOTE missing to_asciibib in original
 
     stage: Stage
@@ -32,14 +40,22 @@ class DocumentStatus:
 
     def to_xml(self, parent):
         name = "status"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
-        self.stage.to_xml(ET.SubElement(result, "stage"))
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
+        self.stage.to_xml(SubElement(result, "stage"))
         if self.substage:
-            self.substage.to_xml(ET.SubElement(result, "substage"))
+            self.substage.to_xml(SubElement(result, "substage"))
         if self.iteration:
-            ET.SubElement(result, "iteration").text = self.iteration
+            SubElement(result, "iteration").text = self.iteration
+
+        return result
 
+    def to_dict(self):
+        result = {"stage": self.stage.to_dict()}
+        if self.substage:
+            result["substage"] = self.substage.to_dict()
+        if self.iteration:
+            result["iteration"] = self.iteration
         return result
 
     def to_asciibib(self, prefix=""):
@@ -2,23 +2,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
-import xml.etree.ElementTree as ET
 
 from .technical_committee import TechnicalCommittee
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class EditorialGroup:
     technical_committee: List[TechnicalCommittee]
 
     def to_xml(self, parent):
         name = "editorialgroup"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         for tc in self.technical_committee:
             tc.to_xml(result)
         return result
 
+    def to_dict(self):
+        return [tc.to_dict() for tc in self.technical_committee]
+
     def to_asciibib(self, prefix=""):
         pref = f"{prefix}.editorialgroup" if prefix else "editorialgroup"
         return "\n".join([tc.to_asciibib(pref, len(self.technical_committee))
@@ -1,16 +1,18 @@
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
 
 from .formatted_string import FormattedString
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class FormattedRef(FormattedString):
     def to_xml(self, parent):
         name = "formattedref"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         return super().to_xml(node)
 
     def to_asciibib(self, prefix=""):
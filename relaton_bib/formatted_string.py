@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .interning import intern_str
 from .localized_string import LocalizedString
+from .relaton_bib import slotted
 
 
 class FormattedStringFormat(str, Enum):
@@ -14,6 +16,7 @@ class FormattedStringFormat(str, Enum):
     APPL_X_ISODOC_XML = "application/x-isodoc+xml"
 
 
+@slotted
 @dataclass(frozen=True)
 class FormattedString(LocalizedString):
     format: str = field(default=FormattedStringFormat.TEXT_PLAIN.value)
@@ -22,12 +25,26 @@ class FormattedString(LocalizedString):
         super().__post_init__()
         if isinstance(self.format, FormattedStringFormat):
             object.__setattr__(self, "format", self.format.value)
+        else:
+            object.__setattr__(self, "format", intern_str(self.format))
 
     def to_xml(self, parent):
         if self.format:
             parent.attrib["format"] = self.format
         return super().to_xml(parent)
 
+    def to_dict(self):
+        result = super().to_dict()
+        # keep None if the class has another default format
+        if not self.format and \
+                self.format == self.__dataclass_fields__["format"].default:
+            return result
+
+        if not isinstance(result, dict):
+            result = {"content": result}
+        result["format"] = self.format
+        return result
+
     def to_asciibib(self, prefix="", count=1, has_attrs=False):
         has_attrs = has_attrs or self.format
         pref = f"{prefix}." if prefix else prefix
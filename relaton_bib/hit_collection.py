@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from multiprocessing import Pool
-from typing import List
-
-import xml.etree.ElementTree as ET
+from typing import IO, List
 
 from .relaton_bib import delegate
+from .xml_backend import Element, SubElement
+from .xml_writer import write_xml
 
 
 def hit_fetch(hit):
@@ -35,11 +35,21 @@ class HitCollection:
     # @return [String] XML
     def to_xml(self, parent=None, opts={}):
         name = "documents"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
 
         for hit in self.array:
             hit.fetch()
             hit.to_xml(result, opts)
 
         return result
+
+    # @return [Array<Hash>] dicts of fetched items
+    def to_dict(self):
+        return [hit.fetch().to_dict() for hit in self.array]
+
+    # @param fileobj [IO] text or binary stream
+    # @param opts [Hash] same as for to_xml
+    # @return [Integer] number of written items
+    def write_xml(self, fileobj: IO, opts={}):
+        return write_xml((hit.fetch() for hit in self.array), fileobj, opts)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class ICS:
     code: str
@@ -10,12 +12,15 @@ class ICS:
 
     def to_xml(self, parent):
         name = "ics"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
-        ET.SubElement(node, "code").text = self.code
-        ET.SubElement(node, "text").text = self.text
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
+        SubElement(node, "code").text = self.code
+        SubElement(node, "text").text = self.text
         return node
 
+    def to_dict(self):
+        return {"code": self.code, "text": self.text}
+
     def to_asciibib(self, prefix="", count=1):
         suffix = "ics"
         pref = f"{prefix}.{suffix}" if prefix else suffix
@@ -0,0 +1,44 @@
+"""Shared instances of values repeated across a corpus
+
+Languages, scripts, formats and type codes take a few dozen distinct values
+but every parsed element gets a fresh copy of them. Model classes pass
+these values through `intern_str` and `intern_codes`, and
+`unpack_dataclass` passes values of `CODE_FIELDS` through `intern_field`,
+so a corpus keeps one string per value.
+"""
+from typing import Iterable, List, Union
+
+import sys
+
+# names of dataclass fields holding codes, interned by `unpack_dataclass`
+CODE_FIELDS = frozenset(["language", "script", "type", "format"])
+
+
+def intern_str(value):
+    """Interned copy of str, other values (None, enums) are returned as is"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_codes(values: Union[str, Iterable[str], None]) -> List[str]:
+    """List of interned codes, e.g. languages or scripts
+
+    The list is new for every call, so it can be changed by the caller,
+    only the strings are shared.
+
+    Keyword arguments:
+    values -- code, list or tuple of codes, or None
+    """
+    if not values:
+        return []
+    if isinstance(values, str):
+        return [intern_str(values)]
+    return list(map(intern_str, values))
+
+
+def intern_field(value):
+    """Value of field of `CODE_FIELDS` with interned codes"""
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return list(map(intern_str, value))
+    return value
@@ -0,0 +1,43 @@
+"""Resolution of language names and codes to language codes
+
+Parsers get languages as names ("english") or codes of any ISO 639 part
+("en", "eng", "ger"). `language_code` maps them to ISO 639-1 code, or
+ISO 639-3 one for languages which don't have it. The lookup table is built
+from `iso639` on the first call, so importing this module is cheap, and
+results are cached because a corpus uses only a few distinct values.
+"""
+from typing import Dict, Optional
+
+import functools
+
+LANGUAGE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _table() -> Dict[str, str]:
+    """Lowercased names and codes of every language to its code"""
+    import iso639
+
+    languages = iso639.languages
+    table = {}
+    # names go first so a code wins when a name is the same as some code
+    for name, lang in languages.name.items():
+        table[name.lower()] = lang.part1 or lang.part3
+    for part in ("part3", "part2t", "part2b", "part1"):
+        for code, lang in getattr(languages, part).items():
+            if code:
+                table[code.lower()] = lang.part1 or lang.part3
+    return table
+
+
+@functools.lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def language_code(value: str) -> Optional[str]:
+    """ISO 639-1 (or ISO 639-3) code of language name or code
+
+    Case and surrounding whitespaces are ignored. Returns None if the
+    language isn't known.
+
+    Keyword arguments:
+    value -- language name or ISO 639-1, 639-2 or 639-3 code
+    """
+    return _table().get(value.strip().lower()) if value else None
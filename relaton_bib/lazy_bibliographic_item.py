@@ -0,0 +1,97 @@
+from __future__ import annotations
+from dataclasses import fields
+from typing import Any, Callable
+
+import logging
+
+from .bibliographic_item import BibliographicItem, BibliographicItemType
+
+
+class LazyBibliographicItem(BibliographicItem):
+    """BibliographicItem which builds fields on first access
+
+    Keeps the source (e.g. XML bytes) and builds every field with `loader`
+    when it's read first time, built value is stored in the instance so
+    next reads cost as much as for `BibliographicItem`. Fields can be
+    assigned as usual. Comparison and rendering build all the remaining
+    fields at once with `load`.
+
+    Keyword arguments:
+    source -- data the item is built from
+    loader -- function of source and field name returning field value, or
+              `BibliographicItem` with all the fields if name is None
+    """
+
+    def __init__(self, source: Any, loader: Callable[[Any, str], Any]):
+        self._source = source
+        self._loader = loader
+
+    def _load(self, name: str) -> Any:
+        value = self._loader(self._source, name)
+        if name == "id" and not value:
+            # from source identifiers, loaded ones may be changed already
+            docid = next((i for i in self._loader(self._source,
+                                                  "docidentifier")
+                          if i.type != "DOI"), None)
+            value = self.makeid(docid, False)
+        elif name == "type" and not BibliographicItemType.has_value(value):
+            logging.warning(
+                f"[relaton-bib] invalid document type: {value}")
+        return value
+
+    def loaded(self) -> bool:
+        """True if all the fields are built"""
+        return all(f.name in self.__dict__ for f in _LAZY_FIELDS)
+
+    def load(self) -> LazyBibliographicItem:
+        """Build all the fields which aren't built yet"""
+        if not self.loaded():
+            item = self._loader(self._source, None)
+            for f in _LAZY_FIELDS:
+                self.__dict__.setdefault(f.name, getattr(item, f.name))
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, BibliographicItem):
+            return NotImplemented
+        self.load()
+        return all(getattr(self, f.name) == getattr(other, f.name)
+                   for f in fields(BibliographicItem) if f.compare)
+
+    def __repr__(self):
+        self.load()
+        return super().__repr__()
+
+    def to_xml(self, parent=None, opts={}):
+        self.load()
+        return super().to_xml(parent, opts)
+
+    def to_dict(self) -> dict:
+        self.load()
+        return super().to_dict()
+
+    def to_bibtex_entry(self) -> dict:
+        self.load()
+        return super().to_bibtex_entry()
+
+    def to_asciibib(self, prefix=""):
+        self.load()
+        return super().to_asciibib(prefix)
+
+
+class _LazyField:
+    """Non-data descriptor, so built value in instance shadows it"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = obj._load(self.name)
+        return value
+
+
+_LAZY_FIELDS = [f for f in fields(BibliographicItem) if f.init]
+for _field in _LAZY_FIELDS:
+    setattr(LazyBibliographicItem, _field.name, _LazyField(_field.name))
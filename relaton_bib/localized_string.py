@@ -1,13 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Union, List
+from typing import List, Union
 
-import xml.sax.saxutils as saxutils
-import xml.etree.ElementTree as ET
-
-from .relaton_bib import to_ds_instance
+from .interning import intern_codes
+from .relaton_bib import is_trusted, single_element_array, to_ds_instance, \
+    slotted
+from .xml_backend import SubElement
 
 
+@slotted
 @dataclass(frozen=True)
 class LocalizedString:
     content: Union[str, list[LocalizedString]]
@@ -15,6 +16,19 @@ class LocalizedString:
     script: List[str] = field(default_factory=list)
 
     def __post_init__(self):
+        if not is_trusted():
+            self._validate()
+
+        # modify froozen dataclass https://stackoverflow.com/a/54119384/902217
+        object.__setattr__(self, "language", intern_codes(self.language))
+        object.__setattr__(self, "script", intern_codes(self.script))
+
+        if isinstance(self.content, list):
+            object.__setattr__(self, "content",
+                               list(map(to_ds_instance(LocalizedString),
+                                        self.content)))
+
+    def _validate(self):
         inv = []
         if isinstance(self.content, list):
             def reject(x):
@@ -28,18 +42,6 @@ class LocalizedString:
             klass = klass.__name__
             raise ValueError(f"invalid LocalizedString content type: {klass}")
 
-        # modify froozen dataclass https://stackoverflow.com/a/54119384/902217
-        if isinstance(self.language, str):
-            object.__setattr__(self, "language", [self.language])
-
-        if isinstance(self.script, str):
-            object.__setattr__(self, "script", [self.script])
-
-        if isinstance(self.content, list):
-            object.__setattr__(self, "content",
-                               list(map(to_ds_instance(LocalizedString),
-                                        self.content)))
-
     def __format__(self, format_spec: str) -> str:
         return str(self)
 
@@ -59,28 +61,28 @@ class LocalizedString:
 
         if isinstance(self.content, list):
             for c in self.content:
-                c.to_xml(ET.SubElement(node, "variant"))
+                c.to_xml(SubElement(node, "variant"))
         else:
             if any(self.language):
                 node.attrib["language"] = ",".join(filter(None, self.language))
             if any(self.script):
                 node.attrib["script"] = ",".join(filter(None, self.script))
-            node.text = saxutils.escape(self.content)
+            node.text = _escape(self.content)
 
         return node
 
-    # TODO revisit
-    # def to_hash
-    #   if content.is_a? String
-    #     return content unless language || script
+    def to_dict(self):
+        content = [c.to_dict() for c in self.content] \
+            if isinstance(self.content, list) else self.content
+        if not (any(self.language) or any(self.script)):
+            return content
 
-    #     hash = { "content" => content }
-    #     hash["language"] = single_element_array(language) if language&.any?
-    #     hash["script"] = single_element_array(script) if script&.any?
-    #     hash
-    #   else content.map &:to_hash
-    #   end
-    # end
+        result = {"content": content}
+        if any(self.language):
+            result["language"] = single_element_array(self.language)
+        if any(self.script):
+            result["script"] = single_element_array(self.script)
+        return result
 
     def to_asciibib(self, prefix="", count=1, has_attrs=False):
         pref = f"{prefix}." if prefix else prefix
@@ -100,3 +102,9 @@ class LocalizedString:
             for script in self.script:
                 out.append(f"{pref}script:: {script}")
             return "\n".join(out)
+
+
+def _escape(text: str) -> str:
+    """Same as `xml.sax.saxutils.escape`, which is slow to import"""
+    return text.replace("&", "&amp;").replace(">", "&gt;") \
+        .replace("<", "&lt;")
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class Medium:
     form: str = None
@@ -11,16 +13,24 @@ class Medium:
 
     def to_xml(self, parent):
         name = "medium"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         if self.form:
-            ET.SubElement(node, "form").text = self.form
+            SubElement(node, "form").text = self.form
         if self.size:
-            ET.SubElement(node, "size").text = self.size
+            SubElement(node, "size").text = self.size
         if self.scale:
-            ET.SubElement(node, "scale").text = self.scale
+            SubElement(node, "scale").text = self.scale
         return node
 
+    def to_dict(self):
+        result = {}
+        for attr in ["form", "size", "scale"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = value
+        return result
+
     def to_asciibib(self, prefix=""):
         pref = f"{prefix}.medium." if prefix else "medium."
         out = []
@@ -4,11 +4,11 @@ from enum import Enum
 from typing import List
 import re
 import logging
-import xml.etree.ElementTree as ET
 
 from .localized_string import LocalizedString
-from .relaton_bib import lang_filter, to_ds_instance
+from .relaton_bib import lang_filter, to_ds_instance, slotted
 from .contributor import Contributor
+from .xml_backend import Element, SubElement
 
 
 class OrgIdentifierType(Enum):
@@ -20,6 +20,7 @@ class OrgIdentifierType(Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass(frozen=True)
 class OrgIdentifier:
     type: str
@@ -32,12 +33,15 @@ class OrgIdentifier:
 
     def to_xml(self, parent):
         name = "identifier"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         node.text = self.value
         node.attrib["type"] = self.type
         return node
 
+    def to_dict(self):
+        return {"type": self.type, "id": self.value}
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         out = [f"{pref}identifier::"] if count > 1 else []
@@ -46,6 +50,7 @@ class OrgIdentifier:
         return "\n".join(out)
 
 
+@slotted
 @dataclass
 class Organization(Contributor):
     name: List[LocalizedString] = field(default_factory=list)
@@ -72,21 +77,32 @@ class Organization(Contributor):
 
     def to_xml(self, parent, opts={}):
         name = "organization"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         for n in lang_filter(self.name, opts):
-            n.to_xml(ET.SubElement(result, "name"))
+            n.to_xml(SubElement(result, "name"))
         for s in lang_filter(self.subdivision, opts):
-            s.to_xml(ET.SubElement(result, "subdivision"))
+            s.to_xml(SubElement(result, "subdivision"))
         if self.abbreviation:
-            self.abbreviation.to_xml(ET.SubElement(result, "abbreviation"))
+            self.abbreviation.to_xml(SubElement(result, "abbreviation"))
         if self.uri:
-            ET.SubElement(result, "uri").text = self.uri
+            SubElement(result, "uri").text = self.uri
         for idntfr in self.identifier:
             idntfr.to_xml(result)
         super().to_xml(result)
         return result
 
+    def to_dict(self):
+        result = {"name": [n.to_dict() for n in self.name]}
+        if self.abbreviation:
+            result["abbreviation"] = self.abbreviation.to_dict()
+        if self.subdivision:
+            result["subdivision"] = [s.to_dict() for s in self.subdivision]
+        if self.identifier:
+            result["identifier"] = [i.to_dict() for i in self.identifier]
+        result.update(super().to_dict())
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         prefix = re.sub(r"\*$", "organization", prefix)
         out = [f"{prefix}::"] if count > 1 else []
@@ -4,18 +4,19 @@ from enum import Enum
 from typing import List
 
 import re
-import xml.etree.ElementTree as ET
 
-from .relaton_bib import lang_filter, to_ds_instance
+from .relaton_bib import lang_filter, to_ds_instance, slotted
 from .localized_string import LocalizedString
 from .affiliation import Affiliation
 from .contributor import Contributor
+from .xml_backend import Element, SubElement
 
 
 def localized_string():
     return to_ds_instance(LocalizedString)
 
 
+@slotted
 @dataclass
 class FullName:
     surname: LocalizedString = None
@@ -57,24 +58,36 @@ class FullName:
 
     def to_xml(self, parent, opts={}):
         name = "name"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
 
         if self.completename:
-            self.completename.to_xml(ET.SubElement(result, "completename"))
+            self.completename.to_xml(SubElement(result, "completename"))
         else:
             for p in lang_filter(self.prefix, opts):
-                p.to_xml(ET.SubElement(result, "prefix"))
+                p.to_xml(SubElement(result, "prefix"))
             for f in lang_filter(self.forename, opts):
-                f.to_xml(ET.SubElement(result, "forename"))
+                f.to_xml(SubElement(result, "forename"))
             for i in lang_filter(self.initial, opts):
-                i.to_xml(ET.SubElement(result, "initial"))
-            self.surname.to_xml(ET.SubElement(result, "surname"))
+                i.to_xml(SubElement(result, "initial"))
+            self.surname.to_xml(SubElement(result, "surname"))
             for a in lang_filter(self.addition, opts):
-                a.to_xml(ET.SubElement(result, "addition"))
+                a.to_xml(SubElement(result, "addition"))
 
         return result
 
+    def to_dict(self):
+        result = {}
+        if self.surname:
+            result["surname"] = self.surname.to_dict()
+        if self.completename:
+            result["completename"] = self.completename.to_dict()
+        for attr in ["forename", "initial", "addition", "prefix"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = [v.to_dict() for v in value]
+        return result
+
     def to_asciibib(self, prefix):
         prf = f"{prefix}.name." if prefix else "name."
         out = [fn.to_asciibib(f"{prf}forename", len(self.forename))
@@ -101,6 +114,7 @@ class PersonIdentifierType(Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass
 class PersonIdentifier:
     type: str
@@ -115,11 +129,14 @@ class PersonIdentifier:
 
     def to_xml(self, parent):
         name = "identifier"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         result.text = self.value
         result.attrib["type"] = self.type
 
+    def to_dict(self):
+        return {"type": self.type, "id": self.value}
+
     def to_asciibib(self, prefix="", count=1):
         pref = prefix + "." if prefix else prefix
         out = [f"{prefix}::"] if count > 1 else []
@@ -128,6 +145,7 @@ class PersonIdentifier:
         return "\n".join(out)
 
 
+@slotted
 @dataclass
 class Person(Contributor):
     name: FullName = None
@@ -141,8 +159,8 @@ class Person(Contributor):
 
     def to_xml(self, parent, opts={}):
         name = "person"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
         self.name.to_xml(result, opts)
         for a in self.affiliation:
             a.to_xml(result, opts)
@@ -152,6 +170,15 @@ class Person(Contributor):
             c.to_xml(result)
         return result
 
+    def to_dict(self):
+        result = {"name": self.name.to_dict()}
+        if self.affiliation:
+            result["affiliation"] = [a.to_dict() for a in self.affiliation]
+        if self.identifier:
+            result["identifier"] = [i.to_dict() for i in self.identifier]
+        result.update(super().to_dict())
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = re.sub(r"\*$", "person", prefix)
         out = [f"{pref}::"] if count > 1 else []
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class Place:
     name: str
@@ -11,8 +13,8 @@ class Place:
 
     def to_xml(self, parent):
         name = "place"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         node.text = self.name
         if self.uri:
             node.attrib["uri"] = self.uri
@@ -20,6 +22,17 @@ class Place:
             node.attrib["region"] = self.region
         return node
 
+    def to_dict(self):
+        if not (self.uri or self.region):
+            return self.name
+
+        result = {"name": self.name}
+        if self.uri:
+            result["uri"] = self.uri
+        if self.region:
+            result["region"] = self.region
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}.place" if prefix else "place"
         out = [f"{pref}::"] if count > 1 else []
@@ -0,0 +1,202 @@
+"""Relations between bibitems of a corpus referred by ids
+
+`DocumentRelation` embeds the related bibitem, so queries over a corpus
+like "all items obsoleted by X" scan relations of every item. The graph
+indexes relations by ids of their items in both directions once::
+
+    graph = RelationGraph(items)
+    graph.related("ISO 19115-1", "obsoletes")  # ids obsoleted by it
+    graph.closure("ISO 19115-2", "partOf")  # transitive partOf
+
+A relation stated by one item is also seen from the other one with the
+inverse type (`INVERSE_TYPES`), so "X obsoletes Y" and "Y obsoletedBy X"
+answer the same queries. Ids are resolved to bibitems on request: added
+items go first, then `index` (e.g. `BibliographyStore`), then bibitems
+embedded in relations of added items, the one of the latest added item if
+several items embed it.
+"""
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .bibliographic_item import BibliographicItem
+
+_PAIRS = [
+    ("includes", "includedIn"), ("hasPart", "partOf"),
+    ("merges", "mergedInto"), ("splits", "splitInto"),
+    ("instance", "hasInstance"), ("exemplarOf", "hasExemplar"),
+    ("manifestationOf", "hasManifestation"),
+    ("reproductionOf", "hasReproduction"), ("reprintOf", "hasReprint"),
+    ("expressionOf", "hasExpression"), ("translatedFrom", "hasTranslation"),
+    ("arrangementOf", "hasArrangement"), ("abridgementOf", "hasAbridgement"),
+    ("annotationOf", "hasAnnotation"), ("draftOf", "hasDraft"),
+    ("editionOf", "hasEdition"), ("updates", "updatedBy"),
+    ("derivedFrom", "derives"), ("describes", "describedBy"),
+    ("catalogues", "cataloguedBy"), ("hasSuccessor", "successorOf"),
+    ("adaptedFrom", "hasAdaptation"), ("adoptedFrom", "adoptedAs"),
+    ("reviewOf", "hasReview"), ("commentaryOf", "hasCommentary"),
+    ("complements", "complementOf"), ("obsoletes", "obsoletedBy"),
+    ("cited", "isCitedIn"), ("related", "related"),
+]
+
+# relation type seen from the related item
+INVERSE_TYPES: Dict[str, str] = dict(_PAIRS + [(b, a) for a, b in _PAIRS])
+
+
+class RelationGraph:
+    """Index of relations between bibitems by their ids
+
+    Keyword arguments:
+    items -- bibitems to add
+    index -- mapping of ids to bibitems to resolve ids of items which
+             aren't added
+    """
+
+    def __init__(self, items: Iterable[BibliographicItem] = (),
+                 index: Optional[Mapping[str, BibliographicItem]] = None):
+        self.index = index
+        self._items: Dict[str, BibliographicItem] = {}
+        # relations stated by items, {id: [(type, id)]}
+        self._stated: Dict[str, List[Tuple[str, str]]] = {}
+        # both directions, {id: {type: {id: number of statements}}}
+        self._edges: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # bibitems embedded in relations, {id: {id of item: bibitem}}
+        self._embedded: Dict[str, Dict[str, BibliographicItem]] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: BibliographicItem):
+        """Add item and its relations, replacing item with the same id
+
+        Raises ValueError if item has no id, since items are indexed by it
+        """
+        if not item.id:
+            raise ValueError("can't add bibitem without id to RelationGraph")
+        if item.id in self._items:
+            self.remove(item.id)
+        self._items[item.id] = item
+        stated = self._stated[item.id] = []
+        for rel in item.relation:
+            bibitem = rel.bibitem
+            if bibitem is None or not bibitem.id:
+                continue
+            stated.append((rel.type, bibitem.id))
+            self._link(item.id, rel.type, bibitem.id, 1)
+            embedded = self._embedded.setdefault(bibitem.id, {})
+            embedded.setdefault(item.id, bibitem)
+
+    def remove(self, id: str):
+        """Remove item and relations it states, raise KeyError if it isn't
+        added
+        """
+        del self._items[id]
+        for type, target in self._stated.pop(id):
+            self._link(id, type, target, -1)
+            embedded = self._embedded.get(target)
+            if embedded and embedded.pop(id, None) is not None \
+                    and not embedded:
+                del self._embedded[target]
+
+    def _link(self, source: str, type: str, target: str, count: int):
+        self._count(source, type, target, count)
+        inverse = INVERSE_TYPES.get(type)
+        if inverse:
+            self._count(target, inverse, source, count)
+
+    def _count(self, source: str, type: str, target: str, count: int):
+        edges = self._edges.setdefault(source, {})
+        targets = edges.setdefault(type, {})
+        count += targets.get(target, 0)
+        if count:
+            targets[target] = count
+            return
+        del targets[target]
+        if not targets:
+            del edges[type]
+            if not edges:
+                del self._edges[source]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, id) -> bool:
+        return id in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def resolve(self, id: str) -> Optional[BibliographicItem]:
+        """Bibitem with id, None if it's unknown"""
+        item = self._items.get(id)
+        if item is None and self.index is not None:
+            item = self.index.get(id)
+        if item is None:
+            embedded = self._embedded.get(id)
+            if embedded:
+                item = next(reversed(embedded.values()))
+        return item
+
+    def related(self, id: str, *types: str) -> List[str]:
+        """Ids of items related to item with id by relations of any of types,
+        or by all the relations if no types are given
+
+        Keyword arguments:
+        id -- item id, the item doesn't have to be added
+        types -- relation types as seen from the item
+        """
+        edges = self._edges.get(id)
+        if not edges:
+            return []
+        if len(types) == 1:
+            return list(edges.get(types[0], ()))
+        result: Dict[str, None] = {}
+        for type in types or edges:
+            result.update(edges.get(type, ()))
+        return list(result)
+
+    def closure(self, id: str, *types: str) -> List[str]:
+        """Ids of items reachable from item with id by relations of types,
+        in breadth-first order, without the item itself
+
+        Cycles are followed once.
+        """
+        seen = {id: None}
+        queue = [id]
+        for node in queue:
+            for target in self.related(node, *types):
+                if target not in seen:
+                    seen[target] = None
+                    queue.append(target)
+        del seen[id]
+        return list(seen)
+
+    def find_cycle(self, *types: str) -> Optional[List[str]]:
+        """Ids of a cycle of relations of types as `[a, b, ..., a]`, None if
+        there are no cycles
+
+        Relations are followed only as they are stated, so a relation and
+        its inverse don't make a cycle.
+        """
+        done = set()
+        for start in list(self._stated):
+            if start in done:
+                continue
+            path = [start]
+            on_path = {start: 0}
+            stack = [iter(self._stated_targets(start, types))]
+            while stack:
+                target = next(stack[-1], None)
+                if target is None:
+                    stack.pop()
+                    node = path.pop()
+                    del on_path[node]
+                    done.add(node)
+                elif target in on_path:
+                    return path[on_path[target]:] + [target]
+                elif target not in done:
+                    on_path[target] = len(path)
+                    path.append(target)
+                    stack.append(iter(self._stated_targets(target, types)))
+        return None
+
+    def _stated_targets(self, id: str, types: Tuple[str, ...]) -> List[str]:
+        return [target for type, target in self._stated.get(id, ())
+                if not types or type in types]
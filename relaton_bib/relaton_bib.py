@@ -1,8 +1,20 @@
+import contextlib
+import contextvars
 import datetime
 import dataclasses
+import functools
+import json
 import re
 
-from typing import Dict, Union, Type, Callable, TYPE_CHECKING
+from typing import Dict, Iterator, TypeVar, Union, Type, Callable, \
+    TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .interning import CODE_FIELDS, intern_field
 
 if TYPE_CHECKING:
     from .localized_string import LocalizedString
@@ -12,28 +24,52 @@ class RequestError(Exception):
     pass
 
 
+# max number of cached results of date parsing
+DATE_CACHE_SIZE = 4096
+
+_DATE_CASES = [
+    # February 2012
+    (re.compile(r"(?P<date>\w+\s\d{4})"), "%B %Y", "%Y-%m"),
+    # February 11, 2012
+    (re.compile(r"(?P<date>\w+\s\d{1,2},\s\d{4})"), "%B %d, %Y", "%Y-%m-%d"),
+    # 2012-02-11
+    (re.compile(r"(?P<date>\d{4}-\d{2}-\d{2})"), "%Y-%m-%d", None),
+    # 2012-02
+    (re.compile(r"(?P<date>\d{4}-\d{2})"), "%Y-%m", None),
+    # 2012
+    (re.compile(r"(?P<date>\d{4})"), "%Y", None),
+]
+
+# 2012-02-11 or 2012-02, names of months never start with digits so
+# the cases above can't match such strings
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})(?:-(\d{2}))?")
+
+
 def parse_date(date, str_res=True):
     """Convert date from string to date or string
+
+    Results are cached by string representation of `date`.
     """
 
     if date is datetime.datetime:
         return date
 
-    cases = [
-        # February 2012
-        (r"(?P<date>\w+\s\d{4})", "%B %Y", "%Y-%m"),
-        # February 11, 2012
-        (r"(?P<date>\w+\s\d{1,2},\s\d{4})", "%B %d, %Y", "%Y-%m-%d"),
-        # 2012-02-11
-        (r"(?P<date>\d{4}-\d{2}-\d{2})", "%Y-%m-%d", None),
-        # 2012-02
-        (r"(?P<date>\d{4}-\d{2})", "%Y-%m", None),
-        # 2012
-        (r"(?P<date>\d{4})", "%Y", None),
-    ]
-
-    for regexp, strp, strf in cases:
-        m = re.match(regexp, str(date))
+    return _parse_date(str(date), str_res)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(date: str, str_res: bool):
+    m = _ISO_DATE.match(date)
+    if m:
+        # validate with constructor which is much faster than strptime
+        year, month, day = m.groups()
+        d = datetime.datetime(int(year), int(month), int(day or 1))
+        if str_res:
+            return m.group(0)
+        return d.strftime("%Y-%m-%d" if day else "%Y-%m")
+
+    for regexp, strp, strf in _DATE_CASES:
+        m = regexp.match(date)
         if m:
             value = m.group("date")
             d = datetime.datetime.strptime(value, strp)
@@ -43,14 +79,25 @@ def parse_date(date, str_res=True):
                 return value if str_res else d.strftime(strp)
 
 
-# TODO we don't need this for python probably
 # @param array [Array]
-# @return [Array<String>, String]
+# @return [Array, Object] element of one-element array or the array itself
 def single_element_array(array):
-    if len(array) > 1:
-        return map(lambda x: x if x is str else dataclasses.asdict(x), array)
-    else:
-        return array[0] if array[0] is str else dataclasses.asdict(array[0])
+    result = [x.to_dict() if hasattr(x, "to_dict") else x for x in array]
+    return result[0] if len(result) == 1 else result
+
+
+def json_dumps(obj) -> str:
+    """Serialize to JSON with `orjson` if it's installed"""
+    if orjson:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def json_loads(data: Union[str, bytes]):
+    """Deserialize JSON with `orjson` if it's installed"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def lang_filter(target, opts={}):
@@ -91,6 +138,206 @@ def delegate(to, *methods):
     return dec
 
 
+def slotted(klass):
+    """Recreate dataclass with `__slots__` for its fields
+
+    Like `dataclass(slots=True)` of Python 3.10 but also rebinds `__class__`
+    cells so zero-argument `super()` works, sets defaults of fields with
+    init=False in `__new__`, and adds `__getstate__` and `__setstate__` so
+    pickle and copy work for frozen classes. Slots are
+    created only for fields which aren't slots of base classes, so bases
+    should be slotted too, otherwise instances still get `__dict__`.
+    Names in `__slots__` of the class itself are kept as extra slots which
+    aren't fields, e.g. for caches not compared, copied or serialized as
+    fields are.
+    """
+    inherited = {name for base in klass.__mro__[1:]
+                 for name in base.__dict__.get("__slots__", ())}
+    extra = tuple(klass.__dict__.get("__slots__", ()))
+    names = [f.name for f in dataclasses.fields(klass)]
+    ns = {k: v for k, v in klass.__dict__.items()
+          if k not in names and k not in extra
+          and k not in ("__dict__", "__weakref__")}
+    ns["__slots__"] = tuple(n for n in names if n not in inherited) + extra
+    ns.setdefault("__getstate__", _slots_getstate)
+    ns.setdefault("__setstate__", _slots_setstate)
+    result = type(klass)(klass.__name__, klass.__bases__, ns)
+    result.__qualname__ = klass.__qualname__
+
+    # dataclass doesn't set fields with init=False and default in __init__,
+    # they are read from class attributes which can't coexist with slots
+    defaults = {f.name: f.default for f in dataclasses.fields(klass)
+                if not f.init and f.default is not dataclasses.MISSING}
+    if defaults:
+        def __new__(cls, *args, **kwargs):
+            self = super(result, cls).__new__(cls)
+            for name, value in defaults.items():
+                object.__setattr__(self, name, value)
+            return self
+        result.__new__ = staticmethod(__new__)
+
+    for value in ns.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            value = value.__func__
+        elif isinstance(value, property):
+            value = value.fget
+        for cell in getattr(value, "__closure__", None) or ():
+            if cell.cell_contents is klass:
+                cell.cell_contents = result
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _slots(klass) -> Dict:
+    return {name: base.__dict__[name] for base in reversed(klass.__mro__)
+            for name in base.__dict__.get("__slots__", ())}
+
+
+def _slots_getstate(self):
+    values = {}
+    for name, slot in _slots(type(self)).items():
+        try:
+            values[name] = slot.__get__(self)
+        except AttributeError:
+            pass  # not set
+    return values, getattr(self, "__dict__", None)
+
+
+def _slots_setstate(self, state):
+    values, attrs = state
+    slots = _slots(type(self))
+    for name, value in values.items():
+        slots[name].__set__(self, value)
+    if attrs:
+        self.__dict__.update(attrs)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(klass: type) -> Union[tuple, None]:
+    """Names of fields of dataclass, None if `klass` isn't a dataclass"""
+    if dataclasses.is_dataclass(klass):
+        return tuple(f.name for f in dataclasses.fields(klass))
+    return None
+
+
+def pack_dataclass(obj):
+    """Flatten dataclass graph into nested tuples `(class, *field_values)`
+
+    The result is cheaper to pickle than the objects themselves because
+    field names aren't stored with every instance.
+    """
+    klass = type(obj)
+    names = _field_names(klass)
+    if names is not None:
+        return (klass,) + tuple([pack_dataclass(getattr(obj, name))
+                                 for name in names])
+    elif isinstance(obj, list):
+        return [pack_dataclass(o) for o in obj]
+    elif isinstance(obj, tuple):
+        return tuple([pack_dataclass(o) for o in obj])
+    return obj
+
+
+def unpack_dataclass(obj):
+    """Restore objects packed with `pack_dataclass`
+
+    Instances are rebuilt without calling `__init__`/`__post_init__`
+    because packed values are already validated and normalized. Codes
+    (`CODE_FIELDS`) are interned again, unpickled strings are new copies.
+    """
+    if isinstance(obj, list):
+        return [unpack_dataclass(o) for o in obj]
+    elif isinstance(obj, tuple):
+        klass = obj[0] if obj else None
+        names = _field_names(klass) if isinstance(klass, type) else None
+        if names is not None:
+            result = klass.__new__(klass)
+            setattr_ = object.__setattr__
+            for name, value in zip(names, obj[1:]):
+                value = unpack_dataclass(value)
+                if name in CODE_FIELDS:
+                    value = intern_field(value)
+                setattr_(result, name, value)
+            return result
+        return tuple([unpack_dataclass(o) for o in obj])
+    return obj
+
+
+T = TypeVar("T")
+
+
+def construct(klass: Type[T], **values) -> T:
+    """Create dataclass instance from trusted values
+
+    Neither `__init__` nor `__post_init__` are called, so values are neither
+    validated nor converted and should already be of the types
+    `__post_init__` makes. Missing fields get their defaults.
+
+    Keyword arguments:
+    klass -- dataclass
+    values -- field values
+    """
+    return _constructor(klass)(**values)
+
+
+@functools.lru_cache(maxsize=None)
+def _constructor(klass: type) -> Callable:
+    """Function made for `klass` like dataclass `__init__` is, but without
+    `__post_init__` call, assigning attributes in generated code is a few
+    times faster than `setattr` in a loop
+    """
+    missing = dataclasses.MISSING
+    ns = {"klass": klass, "MISSING": missing, "setattr": object.__setattr__}
+    params, lines = [], ["    self = klass.__new__(klass)"]
+    for i, f in enumerate(dataclasses.fields(klass)):
+        value = f.name
+        if f.default is not missing:
+            ns[f"_default{i}"] = f.default
+            params.append(f"{f.name}=_default{i}")
+        else:
+            params.append(f"{f.name}=MISSING")
+            if f.default_factory is not missing:
+                ns[f"_factory{i}"] = f.default_factory
+                value = f"_factory{i}() if {f.name} is MISSING else {f.name}"
+            else:
+                lines.append(f"    if {f.name} is MISSING: raise TypeError("
+                             f"'{klass.__name__} missing field: {f.name}')")
+        lines.append(f"    setattr(self, {f.name!r}, {value})"
+                     if klass.__dataclass_params__.frozen
+                     else f"    self.{f.name} = {value}")
+    lines.append("    return self")
+    exec(f"def construct(*, {', '.join(params)}):\n" + "\n".join(lines), ns)
+    return ns["construct"]
+
+
+_TRUSTED = contextvars.ContextVar("relaton_bib_trusted", default=False)
+
+# True inside `trusted_input` context, model classes skip their checks then
+is_trusted = _TRUSTED.get
+
+
+@contextlib.contextmanager
+def trusted_input(trusted: bool = True) -> Iterator[None]:
+    """Context in which parsed data is trusted to be valid
+
+    Parsers build items with `construct` and model classes skip validation
+    which doesn't change values (type checks, warnings about unknown
+    types). Conversions of raw values are still done.
+
+    Keyword arguments:
+    trusted -- if False the context doesn't change anything, so callers
+               can pass their option as is
+    """
+    if not trusted or _TRUSTED.get():
+        yield
+        return
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
 def dict_replace_key(d: Dict, keys_to_replace: Dict) -> Dict:
     for (old_key, new_key) in keys_to_replace.items():
         if old_key in d:
@@ -0,0 +1,498 @@
+"""Full-text index of titles, abstracts and keywords of bibitems
+
+Every localized string of an item (title, abstract or keyword, or a
+variant of it) is indexed as a text of its language::
+
+    index = SearchIndex(items)
+    index.search('"geographic information" metadat*', lang="en")
+    # [("ISO19115-1", 7.1), ...] ids of items with scores, best first
+
+A query is words and `"quoted phrases"`, a word ending with `*` is a
+prefix. Items having all of them, in any of their texts, are ranked with
+BM25 weighted by `FIELD_WEIGHTS`. Results can be limited to texts of a
+language and to some fields.
+
+Texts are tokenized by the tokenizer of their first language in
+`TOKENIZERS`, or by `tokenize`; tokenizers should be registered before
+items are indexed. Postings are positional and kept per term as flat
+arrays of `text number, number of positions, positions...`, so adding an
+item only appends to them. Removed items are skipped by queries until the
+index is compacted, which is done when they make more than half of texts,
+by `compact` and on `dumps`.
+
+`dumps` makes bytes starting with `MAGIC` and a version byte, then a
+length-prefixed `binary.encode`d dict of item ids, languages and terms and
+a zlib-compressed body of the arrays of texts and postings.
+"""
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, \
+    Sequence, Tuple
+
+import heapq
+import html
+import math
+import re
+import struct
+import sys
+import unicodedata
+import zlib
+
+from . import binary
+from .bibliographic_item import BibliographicItem
+from .localized_string import LocalizedString
+
+MAGIC = b"RBSI"
+VERSION = 1
+
+FIELDS = ("title", "abstract", "keyword")
+FIELD_WEIGHTS = {"title": 2.0, "abstract": 1.0, "keyword": 1.5}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+_HEADER = struct.Struct("<I")
+_SWAP = sys.byteorder == "big"
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+# ideographs and kana are tokens by themselves, so words of languages
+# written without spaces are found by phrases of their characters
+_TOKEN = re.compile(f"[{_CJK}]|[^\\W{_CJK}]+")
+_MARKS = re.compile("[\u0300-\u036f\u3099\u309a]")
+_TAG = re.compile("<[^>]*>")
+_CLAUSE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> List[str]:
+    """Casefolded words without diacritics, characters of CJK words"""
+    text = _MARKS.sub("", unicodedata.normalize("NFKD", text.casefold()))
+    return _TOKEN.findall(text)
+
+
+def tokenize_cjk(text: str) -> List[str]:
+    """Like `tokenize` but keeps diacritics, e.g. voicing marks of kana"""
+    return _TOKEN.findall(unicodedata.normalize("NFKC", text.casefold()))
+
+
+# tokenizers by language code
+TOKENIZERS: Dict[str, Callable[[str], List[str]]] = {
+    "ja": tokenize_cjk,
+    "ko": tokenize_cjk,
+    "zh": tokenize_cjk,
+}
+
+
+class SearchIndex:
+    """Inverted index of texts of bibitems
+
+    Keyword arguments:
+    items -- bibitems to add
+    """
+
+    def __init__(self, items: Iterable[BibliographicItem] = ()):
+        # item ids by item numbers, None for removed items
+        self._ids: List[Optional[str]] = []
+        self._docs: Dict[str, int] = {}
+        # texts of item n are `_doc_first[n]` to `_doc_first[n + 1]`
+        self._doc_first = array("I", [0])
+        # item, number of tokens, field and language of texts
+        self._text_doc = array("I")
+        self._text_len = array("I")
+        self._text_field = array("B")
+        self._text_lang = array("H")
+        self._langs: List[Tuple[str, ...]] = []
+        self._lang_index: Dict[Tuple[str, ...], int] = {}
+        self._postings: Dict[str, array] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._live_texts = 0
+        self._live_length = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item: BibliographicItem):
+        """Index item, replacing item with the same id"""
+        if item.id in self._docs:
+            self.remove(item.id)
+        doc = len(self._ids)
+        self._ids.append(item.id)
+        self._docs[item.id] = doc
+        for field, string in _item_texts(item):
+            self._add_text(doc, field, string)
+        self._doc_first.append(len(self._text_doc))
+
+    def _add_text(self, doc: int, field: int, string: LocalizedString):
+        text = string.content
+        if getattr(string, "format", None) not in (None, "text/plain"):
+            text = html.unescape(_TAG.sub(" ", text))
+        lang = self._lang(string.language)
+        tokens = _tokenizer(self._langs[lang])(text)
+        if not tokens:
+            return
+
+        number = len(self._text_doc)
+        self._text_doc.append(doc)
+        self._text_len.append(len(tokens))
+        self._text_field.append(field)
+        self._text_lang.append(lang)
+        self._live_texts += 1
+        self._live_length += len(tokens)
+
+        # entries of runs, `[text, number of positions, positions...]`
+        entries: Dict[str, List[int]] = {}
+        for position, token in enumerate(tokens):
+            entry = entries.get(token)
+            if entry is None:
+                entries[token] = [number, 1, position]
+            else:
+                entry[1] += 1
+                entry.append(position)
+        postings = self._postings
+        for token, entry in entries.items():
+            run = postings.get(token)
+            if run is None:
+                run = postings[token] = array("I")
+                self._sorted_terms = None
+            run.extend(entry)
+
+    def _lang(self, language: Sequence[str]) -> int:
+        language = tuple(filter(None, language))
+        lang = self._lang_index.get(language)
+        if lang is None:
+            lang = self._lang_index[language] = len(self._langs)
+            self._langs.append(language)
+        return lang
+
+    def remove(self, id: str):
+        """Remove item with id, raise KeyError if it isn't added"""
+        doc = self._docs.pop(id)
+        self._ids[doc] = None
+        for text in range(self._doc_first[doc], self._doc_first[doc + 1]):
+            self._live_texts -= 1
+            self._live_length -= self._text_len[text]
+        if len(self._text_doc) > 2 * self._live_texts + 1024:
+            self.compact()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, id) -> bool:
+        return id in self._docs
+
+    def __iter__(self) -> Iterator[str]:
+        return (id for id in self._ids if id is not None)
+
+    def search(self, query: str, lang: str = None,
+               fields: Sequence[str] = None,
+               limit: int = None) -> List[Tuple[str, float]]:
+        """Ids of items matching query with their scores, best first
+
+        Keyword arguments:
+        query -- words, `"quoted phrases"` and prefixes like `geo*`
+        lang -- language code, only texts of the language are searched
+        fields -- names of `FIELDS` to search, all if None
+        limit -- max number of results
+        """
+        if fields is None:
+            fields = FIELDS
+        field_codes = {FIELDS.index(f) for f in fields}
+        langs = [i for i, language in enumerate(self._langs)
+                 if lang is None or lang in language]
+
+        scores: Dict[int, float] = {}
+        for clause, prefix in _clauses(query):
+            found: Dict[int, float] = {}
+            for tokens, group in self._variants(clause, langs):
+                for text, tf in self._match(tokens, prefix).items():
+                    if self._text_lang[text] in group and \
+                            self._text_field[text] in field_codes and \
+                            self._ids[self._text_doc[text]] is not None:
+                        found[text] = tf
+            if not found:
+                return []
+            clause_scores = self._scores(found)
+            scores = clause_scores if not scores else {
+                doc: score + clause_scores[doc]
+                for doc, score in scores.items() if doc in clause_scores}
+            if not scores:
+                return []
+
+        ranked = scores.items()
+        ranked = heapq.nsmallest(limit, ranked, key=_rank) \
+            if limit is not None else sorted(ranked, key=_rank)
+        return [(self._ids[doc], score) for doc, score in ranked]
+
+    def _variants(self, clause: str, langs: List[int]
+                  ) -> List[Tuple[List[str], set]]:
+        """Tokens of clause by tokenizers of languages, with languages they
+        are for
+        """
+        variants: Dict[Tuple[str, ...], set] = {}
+        for lang in langs:
+            tokens = tuple(_tokenizer(self._langs[lang])(clause))
+            if tokens:
+                variants.setdefault(tokens, set()).add(lang)
+        return [(list(tokens), group) for tokens, group in variants.items()]
+
+    def _match(self, tokens: List[str], prefix: bool) -> Dict[int, int]:
+        """Number of occurrences of tokens one after another in texts"""
+        if len(tokens) == 1:
+            # positions aren't needed
+            result: Dict[int, int] = {}
+            terms = self._prefix_terms(tokens[0]) if prefix else tokens
+            for term in terms:
+                for text, start, end in _entries(self._postings.get(term,
+                                                                    ())):
+                    result[text] = result.get(text, 0) + end - start
+            return result
+
+        postings = []
+        for i, token in enumerate(tokens):
+            if prefix and i == len(tokens) - 1:
+                found = self._prefix_postings(token)
+            else:
+                found = _decode(self._postings.get(token, ()))
+            if not found:
+                return {}
+            postings.append(found)
+
+        first, rest = postings[0], postings[1:]
+        result = {}
+        for text in min(postings, key=len):
+            if not all(text in p for p in postings):
+                continue
+            following = [set(p[text]) for p in rest]
+            tf = sum(1 for position in first[text]
+                     if all(position + i in s
+                            for i, s in enumerate(following, 1)))
+            if tf:
+                result[text] = tf
+        return result
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        start = end = bisect_left(terms, prefix)
+        while end < len(terms) and terms[end].startswith(prefix):
+            end += 1
+        return terms[start:end]
+
+    def _prefix_postings(self, prefix: str) -> Dict[int, List[int]]:
+        result: Dict[int, List[int]] = {}
+        for term in self._prefix_terms(prefix):
+            for text, positions in _decode(self._postings[term]).items():
+                result.setdefault(text, []).extend(positions)
+        for positions in result.values():
+            positions.sort()
+        return result
+
+    def _scores(self, found: Dict[int, int]) -> Dict[int, float]:
+        """BM25 scores of items by numbers of occurrences of clause in
+        texts
+        """
+        count = self._live_texts
+        avg = self._live_length / count
+        idf = math.log(1 + (count - len(found) + 0.5) / (len(found) + 0.5))
+        scores: Dict[int, float] = {}
+        for text, tf in found.items():
+            norm = K1 * (1 - B + B * self._text_len[text] / avg)
+            score = FIELD_WEIGHTS[FIELDS[self._text_field[text]]] * idf * \
+                tf * (K1 + 1) / (tf + norm)
+            doc = self._text_doc[text]
+            scores[doc] = scores.get(doc, 0) + score
+        return scores
+
+    def compact(self):
+        """Drop postings of removed items and renumber items and texts"""
+        text_map = array("i", [-1]) * len(self._text_doc)
+        ids: List[str] = []
+        doc_first = array("I", [0])
+        text_doc, text_len = array("I"), array("I")
+        text_field, text_lang = array("B"), array("H")
+        for doc, id in enumerate(self._ids):
+            if id is None:
+                continue
+            for text in range(self._doc_first[doc],
+                              self._doc_first[doc + 1]):
+                text_map[text] = len(text_doc)
+                text_doc.append(len(ids))
+                text_len.append(self._text_len[text])
+                text_field.append(self._text_field[text])
+                text_lang.append(self._text_lang[text])
+            ids.append(id)
+            doc_first.append(len(text_doc))
+
+        postings: Dict[str, array] = {}
+        for term, run in self._postings.items():
+            compacted = array("I")
+            for text, start, end in _entries(run):
+                if text_map[text] >= 0:
+                    compacted.append(text_map[text])
+                    compacted.append(end - start)
+                    compacted.extend(run[start:end])
+            if compacted:
+                postings[term] = compacted
+
+        self._ids = ids
+        self._docs = {id: doc for doc, id in enumerate(ids)}
+        self._doc_first = doc_first
+        self._text_doc, self._text_len = text_doc, text_len
+        self._text_field, self._text_lang = text_field, text_lang
+        self._postings = postings
+        self._sorted_terms = None
+
+    def dumps(self) -> bytes:
+        """Compacted index as bytes"""
+        if len(self._text_doc) != self._live_texts or \
+                len(self._docs) != len(self._ids):
+            self.compact()
+        terms = list(self._postings)
+        runs = [self._postings[term] for term in terms]
+        meta = binary.encode({"ids": self._ids,
+                              "texts": len(self._text_doc),
+                              "langs": [list(lang) for lang in self._langs],
+                              "terms": terms})
+        arrays = [self._text_doc, self._text_len, self._text_field,
+                  self._text_lang, self._doc_first,
+                  array("I", map(len, runs))] + runs
+        if _SWAP:  # pragma: no cover
+            arrays = [_swapped(a) for a in arrays]
+        body = zlib.compress(b"".join(a.tobytes() for a in arrays))
+        return b"".join([MAGIC, bytes([VERSION]), _HEADER.pack(len(meta)),
+                         meta, body])
+
+    @classmethod
+    def loads(cls, data: bytes) -> "SearchIndex":
+        """Index from bytes made by `dumps`"""
+        data = memoryview(data)
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a relaton-bib search index")
+        pos = len(MAGIC)
+        if len(data) <= pos or data[pos] != VERSION:
+            version = data[pos] if len(data) > pos else None
+            raise ValueError(f"unsupported search index version: {version}")
+        pos += 1
+
+        try:
+            size, = _HEADER.unpack_from(data, pos)
+            pos += _HEADER.size
+            meta = binary.decode(data[pos:pos + size])
+            body = memoryview(zlib.decompress(data[pos + size:]))
+        except (struct.error, zlib.error):
+            raise ValueError("truncated search index") from None
+
+        index = cls()
+        reader = _ArrayReader(body)
+        try:
+            count = meta["texts"]
+            for name, typecode in [("_text_doc", "I"), ("_text_len", "I"),
+                                   ("_text_field", "B"),
+                                   ("_text_lang", "H")]:
+                setattr(index, name, reader.read(typecode, count))
+            index._ids = meta["ids"]
+            index._doc_first = reader.read("I", len(index._ids) + 1)
+            terms = meta["terms"]
+            lengths = reader.read("I", len(terms))
+            index._postings = {term: reader.read("I", length)
+                               for term, length in zip(terms, lengths)}
+            langs = meta["langs"]
+        except (KeyError, TypeError):
+            raise ValueError("invalid search index data") from None
+        if not reader.done():
+            raise ValueError("trailing data in search index")
+        index._docs = {id: doc for doc, id in enumerate(index._ids)}
+        index._langs = [tuple(lang) for lang in langs]
+        index._lang_index = {lang: i for i, lang in enumerate(index._langs)}
+        index._live_texts = count
+        index._live_length = sum(index._text_len)
+        return index
+
+    def save(self, path: str):
+        """Write the index to file"""
+        with open(path, "wb") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "SearchIndex":
+        """Read index written by `save`"""
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+
+class _ArrayReader:
+    def __init__(self, data: memoryview):
+        self._data = data
+        self._pos = 0
+
+    def read(self, typecode: str, count: int) -> array:
+        result = array(typecode)
+        end = self._pos + count * result.itemsize
+        if end > len(self._data):
+            raise ValueError("truncated search index")
+        result.frombytes(self._data[self._pos:end])
+        if _SWAP:  # pragma: no cover
+            result.byteswap()
+        self._pos = end
+        return result
+
+    def done(self) -> bool:
+        return self._pos == len(self._data)
+
+
+def _swapped(a: array) -> array:  # pragma: no cover
+    a = array(a.typecode, a)
+    a.byteswap()
+    return a
+
+
+def _tokenizer(language: Tuple[str, ...]) -> Callable[[str], List[str]]:
+    return TOKENIZERS.get(language[0], tokenize) if language else tokenize
+
+
+def _item_texts(item: BibliographicItem
+                ) -> Iterator[Tuple[int, LocalizedString]]:
+    title, abstract, keyword = range(len(FIELDS))
+    for t in item.title:
+        if t.title is not None:
+            yield from _strings(title, t.title)
+    for a in item.abstract:
+        yield from _strings(abstract, a)
+    for k in item.keyword:
+        yield from _strings(keyword, k)
+
+
+def _strings(field: int, string: LocalizedString
+             ) -> Iterator[Tuple[int, LocalizedString]]:
+    if isinstance(string.content, list):
+        for variant in string.content:
+            yield from _strings(field, variant)
+    elif string.content:
+        yield field, string
+
+
+def _clauses(query: str) -> Iterator[Tuple[str, bool]]:
+    """Words and phrases of query, and if they end with prefixes"""
+    for phrase, word in _CLAUSE.findall(query):
+        clause = phrase or word
+        if tokenize(clause):
+            yield clause, clause.endswith("*")
+
+
+def _rank(entry: Tuple[int, float]) -> Tuple[float, int]:
+    doc, score = entry
+    return -score, doc
+
+
+def _entries(run: array) -> Iterator[Tuple[int, int, int]]:
+    """Text number, start and end of positions of every entry of run"""
+    i, size = 0, len(run)
+    while i < size:
+        start = i + 2
+        end = start + run[i + 1]
+        yield run[i], start, end
+        i = end
+
+
+def _decode(run: array) -> Dict[int, array]:
+    return {text: run[start:end] for text, start, end in _entries(run)}
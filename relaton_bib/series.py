@@ -2,11 +2,12 @@ from dataclasses import dataclass
 from enum import Enum
 
 import logging
-import xml.etree.ElementTree as ET
 
 from .formatted_ref import FormattedRef
 from .localized_string import LocalizedString
 from .typed_title_string import TypedTitleString
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
 class SeriesType(str, Enum):
@@ -19,6 +20,7 @@ class SeriesType(str, Enum):
         return value in cls._value2member_map_
 
 
+@slotted
 @dataclass(frozen=True)
 class Series:
     type: str = None
@@ -40,32 +42,47 @@ class Series:
             logging.warning(
                 f"[relaton-bib] Series type is invalid: {self.type}")
 
-    # to_hash -> dataclasses.asdict
+    def to_dict(self):
+        result = {}
+        if self.type:
+            result["type"] = self.type
+        if self.formattedref:
+            result["formattedref"] = self.formattedref.to_dict()
+        if self.title:
+            result["title"] = self.title.to_dict()
+        if self.abbreviation:
+            result["abbreviation"] = self.abbreviation.to_dict()
+        for attr in ["place", "organization", "from", "to", "number",
+                     "partnumber"]:
+            value = getattr(self, attr if attr != "from" else "from_")
+            if value:
+                result[attr] = value
+        return result
 
     def to_xml(self, parent, opts={}):
         name = "series"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
 
         if self.formattedref:
             self.formattedref.to_xml(node)
         else:
             if self.title:
-                self.title.to_xml(ET.SubElement(node, "title"))
+                self.title.to_xml(SubElement(node, "title"))
             if self.place:
-                ET.SubElement(node, "place").text = self.place
+                SubElement(node, "place").text = self.place
             if self.organization:
-                ET.SubElement(node, "organization").text = self.organization
+                SubElement(node, "organization").text = self.organization
             if self.abbreviation:
-                self.abbreviation.to_xml(ET.SubElement(node, "abbreviation"))
+                self.abbreviation.to_xml(SubElement(node, "abbreviation"))
             if self.from_:
-                ET.SubElement(node, "from").text = self.from_
+                SubElement(node, "from").text = self.from_
             if self.to:
-                ET.SubElement(node, "to").text = self.to
+                SubElement(node, "to").text = self.to
             if self.number:
-                ET.SubElement(node, "number").text = self.number
+                SubElement(node, "number").text = self.number
             if self.partnumber:
-                ET.SubElement(node, "partnumber").text = self.partnumber
+                SubElement(node, "partnumber").text = self.partnumber
 
         if self.type:
             node.attrib["type"] = self.type
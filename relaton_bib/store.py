@@ -0,0 +1,167 @@
+"""Read-only on-disk store of bibitems with random access by id
+
+File layout, all numbers are little-endian::
+
+    header | records | keys | index
+
+- header -- `MAGIC`, version byte, number of records and keys, offsets of
+  keys and index
+- records -- length and bibitem encoded with `binary.dumps`, one after
+  another
+- keys -- UTF-8 keys one after another
+- index -- entries of key offset, key length and record offset sorted by
+  key bytes
+
+The store is opened with `mmap`, so opening doesn't depend on the size of
+the corpus and a lookup is a binary search in the index followed by
+decoding of only that record. Pages are shared with the OS cache, forked
+workers use the same mapping without copying.
+"""
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import mmap
+import struct
+
+from . import binary
+from .bibliographic_item import BibliographicItem
+
+MAGIC = b"RBST"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sB3xIIQQ")
+_ENTRY = struct.Struct("<QIQ")
+_LENGTH = struct.Struct("<I")
+
+
+def write_store(items: Iterable[BibliographicItem], path: str) -> int:
+    """Write bibitems to store file
+
+    Records are written as they come, only keys are kept in memory. Every
+    item is indexed by its `id` and ids of its document identifiers, a key
+    of a later item replaces the same key of an earlier one.
+
+    Keyword arguments:
+    items -- iterable of bibitems
+    path -- name of file to write
+
+    Returns number of written records.
+    """
+    keys: Dict[bytes, int] = {}
+    count = 0
+    with open(path, "wb") as f:
+        f.write(bytes(_HEADER.size))
+        offset = _HEADER.size
+        for item in items:
+            data = binary.dumps(item)
+            f.write(_LENGTH.pack(len(data)))
+            f.write(data)
+            for key in _item_keys(item):
+                keys[key.encode("utf-8")] = offset
+            offset += _LENGTH.size + len(data)
+            count += 1
+
+        keys_offset = offset
+        index: List[bytes] = []
+        for key in sorted(keys):
+            f.write(key)
+            index.append(_ENTRY.pack(offset, len(key), keys[key]))
+            offset += len(key)
+        f.write(b"".join(index))
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, count, len(keys), keys_offset,
+                             offset))
+    return count
+
+
+def _item_keys(item: BibliographicItem) -> Iterator[str]:
+    if item.id:
+        yield item.id
+    for docid in item.docidentifier:
+        if docid.id:
+            yield docid.id
+
+
+class BibliographyStore(Mapping):
+    """Read-only mapping of keys to bibitems in file made by `write_store`
+
+    Keyword arguments:
+    path -- name of store file
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.record_count, self._size, _, \
+                self._index_offset = _HEADER.unpack_from(self._mm)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"not a relaton-bib store: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"unsupported store version: {version}")
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._size):
+            yield self._key(i).decode("utf-8")
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __getitem__(self, key: str) -> BibliographicItem:
+        entry = self._find(key) if isinstance(key, str) else None
+        if entry is None:
+            raise KeyError(key)
+        return self._record(entry[2])
+
+    def records(self) -> Iterator[BibliographicItem]:
+        """Decode all the records in order they were written"""
+        offset = _HEADER.size
+        for _ in range(self.record_count):
+            yield self._record(offset)
+            offset += _LENGTH.size + _LENGTH.unpack_from(self._mm, offset)[0]
+
+    def _record(self, offset: int) -> BibliographicItem:
+        length, = _LENGTH.unpack_from(self._mm, offset)
+        offset += _LENGTH.size
+        return binary.loads(memoryview(self._mm)[offset:offset + length])
+
+    def _entry(self, i: int) -> Tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._mm,
+                                  self._index_offset + i * _ENTRY.size)
+
+    def _key(self, i: int) -> bytes:
+        offset, length, _ = self._entry(i)
+        return self._mm[offset:offset + length]
+
+    def _find(self, key: str) -> Tuple[int, int, int]:
+        key = key.encode("utf-8")
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry(mid)
+            found = self._mm[entry[0]:entry[0] + entry[1]]
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return entry
+        return None
@@ -3,12 +3,13 @@ from dataclasses import dataclass, field
 from typing import List
 
 import re
-import xml.etree.ElementTree as ET
 
-from .relaton_bib import delegate
+from .relaton_bib import delegate, slotted
 from .document_identifier import DocumentIdType
+from .xml_backend import Element, SubElement
 
 
+@slotted
 @dataclass
 @delegate("collection", "__getitem__", "__len__", "__iter__",
           "__reversed__", "__contains__")
@@ -19,6 +20,9 @@ class StructuredIdentifierCollection:
         for si in self.collection:
             si.to_xml(parent)
 
+    def to_dict(self):
+        return [si.to_dict() for si in self.collection]
+
     def to_asciibib(self, prefix=""):
         pref = f"{prefix}." if prefix else prefix
         pref += "structured_identifier"
@@ -42,6 +46,7 @@ class StructuredIdentifierCollection:
             si.all_parts()
 
 
+@slotted
 @dataclass
 class StructuredIdentifier:
     docnumber: str
@@ -60,27 +65,39 @@ class StructuredIdentifier:
 
     def to_xml(self, parent):
         name = "structuredidentifier"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
 
         for a in self.agency:
-            ET.SubElement(result, "agency").text = a
+            SubElement(result, "agency").text = a
 
         if self.class_:
-            ET.SubElement(result, "class").text = self.class_
+            SubElement(result, "class").text = self.class_
 
-        ET.SubElement(result, "docnumber").text = self.docnumber
+        SubElement(result, "docnumber").text = self.docnumber
 
         for opt_attr in ["partnumber", "edition", "version", "supplementtype",
                          "supplementnumber", "language", "year"]:
             value = getattr(self, opt_attr)
             if value:
-                ET.SubElement(result, opt_attr).text = value
+                SubElement(result, opt_attr).text = value
         if self.type:
             result.attrib["type"] = self.type
 
         return result
 
+    def to_dict(self):
+        result = {"docnumber": self.docnumber}
+        if self.agency:
+            result["agency"] = self.agency
+        for attr in ["type", "class", "partnumber", "edition", "version",
+                     "supplementtype", "supplementnumber", "language",
+                     "year"]:
+            value = getattr(self, attr if attr != "class" else "class_")
+            if value:
+                result[attr] = value
+        return result
+
     def to_asciibib(self, prefix="", count=1):
         pref = f"{prefix}." if prefix else prefix
         out = [f"{pref}docnumber:: {self.docnumber}"]
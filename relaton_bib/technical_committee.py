@@ -1,20 +1,22 @@
 from dataclasses import dataclass
 
-import xml.etree.ElementTree as ET
-
 from .workgroup import WorkGroup
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
 
 
+@slotted
 @dataclass
 class TechnicalCommittee:
     workgroup: WorkGroup
 
-    # to_hash -> dataclasses.asdict - different
+    def to_dict(self):
+        return self.workgroup.to_dict()
 
     def to_xml(self, parent=None):
         name = "technical-committee"
-        node = ET.Element(name)if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name)if parent is None \
+            else SubElement(parent, name)
         self.workgroup.to_xml(node)
         return node
 
@@ -7,10 +7,13 @@ import re
 import xml.etree.ElementTree as ET
 
 from .formatted_string import FormattedString, FormattedStringFormat
+from .interning import intern_str
 from .localized_string import LocalizedString
-from .relaton_bib import delegate, to_ds_instance
+from .relaton_bib import delegate, to_ds_instance, slotted
+from .xml_backend import SubElement
 
 
+@slotted
 @dataclass
 class TypedTitleString:
     class Type(str, Enum):
@@ -31,6 +34,8 @@ class TypedTitleString:
         if self.title is None and content is None:
             raise ValueError("Argument title or content should be passed")
 
+        self.type = intern_str(self.type)
+
         if not self.title:
             self.title = FormattedString(
                 content=content,
@@ -85,6 +90,14 @@ class TypedTitleString:
         self.title.to_xml(parent)
         return parent
 
+    def to_dict(self):
+        result = self.title.to_dict()
+        if not isinstance(result, dict):
+            result = {"content": result}
+        if self.type:
+            result["type"] = self.type
+        return result
+
     def to_asciibib(self, prefix="", count=1) -> str:
         pref = f"{prefix}." if prefix else prefix
         out = [f"{pref}title::"] if count > 1 else []
@@ -94,6 +107,7 @@ class TypedTitleString:
         return "\n".join(out)
 
 
+@slotted
 @dataclass
 @delegate("titles", "append", "extend", "insert", "remove", "pop", "clear",
           "__getitem__", "__len__", "__iter__", "__reversed__",
@@ -133,6 +147,9 @@ class TypedTitleStringCollection():
     #   TypedTitleStringCollection.new titles + tcoll.titles
     # end
 
+    def to_dict(self):
+        return [t.to_dict() for t in self.titles]
+
     # @param opts [Hash]
     # @option opts [Nokogiri::XML::Builder] XML builder
     # @option opts [String, Symbol] :lang language
@@ -143,6 +160,6 @@ class TypedTitleStringCollection():
             self.titles))
         titles = filtered if any(filtered) else self.titles
         for t in titles:
-            t.to_xml(ET.SubElement(parent, "title"))
+            t.to_xml(SubElement(parent, "title"))
 
         return parent
@@ -1,24 +1,30 @@
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
-import xml.etree.ElementTree as ET
+from .xml_backend import Element, SubElement
+from .relaton_bib import is_trusted, slotted
 
 
+@slotted
 @dataclass()
 class TypedUri:
     content: str
     type: str = None
 
     def __post_init__(self):
-        if not self._valid_uri:
+        if not (is_trusted() or self._valid_uri):
             raise ValueError(f"Invalid content: {self.content}")
 
-    # to_hash -> dataclasses.asdict
+    def to_dict(self):
+        result = {"content": self.content}
+        if self.type:
+            result["type"] = self.type
+        return result
 
     def to_xml(self, parent=None, opts={}):
         name = "uri"
-        node = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        node = Element(name) if parent is None \
+            else SubElement(parent, name)
         node.text = self.content
 
         if self.type:
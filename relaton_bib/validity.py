@@ -1,11 +1,13 @@
 import datetime
 import typing
 
-import xml.etree.ElementTree as ET
-
 from dataclasses import dataclass
 
+from .xml_backend import Element, SubElement
+from .relaton_bib import slotted
+
 
+@slotted
 @dataclass(frozen=True)
 class Validity:
     FORMAT: typing.ClassVar[str] = "%Y-%m-%d %H:%M"
@@ -14,19 +16,25 @@ class Validity:
     ends: datetime.datetime = None
     revision: datetime.datetime = None
 
-    # to_hash -> dataclasses.asdict TODO original convert datetime -> str
+    def to_dict(self):
+        result = {}
+        for attr in ["begins", "ends", "revision"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = value.isoformat()
+        return result
 
     def to_xml(self, parent):
         name = "validity"
-        result = ET.Element(name) if parent is None \
-            else ET.SubElement(parent, name)
+        result = Element(name) if parent is None \
+            else SubElement(parent, name)
 
         if self.begins:
-            ET.SubElement(result, "validityBegins").text = self.begins.strftime(self.FORMAT)
+            SubElement(result, "validityBegins").text = self.begins.strftime(self.FORMAT)
         if self.ends:
-            ET.SubElement(result, "validityEnds").text = self.ends.strftime(self.FORMAT)
+            SubElement(result, "validityEnds").text = self.ends.strftime(self.FORMAT)
         if self.revision:
-            ET.SubElement(result, "revision").text = self.revision.strftime(self.FORMAT)
+            SubElement(result, "revision").text = self.revision.strftime(self.FORMAT)
 
         return result
 
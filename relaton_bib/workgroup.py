@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
+from .relaton_bib import slotted
 
+
+@slotted
 @dataclass(frozen=True)
 class WorkGroup:
     name: str
@@ -9,7 +12,13 @@ class WorkGroup:
     identifier: str = None
     prefix: str = None
 
-    # to_hash -> dataclasses.asdict
+    def to_dict(self):
+        result = {"name": self.name}
+        for attr in ["number", "type", "identifier", "prefix"]:
+            value = getattr(self, attr)
+            if value:
+                result[attr] = value
+        return result
 
     def to_xml(self, parent):
         parent.text = self.name
@@ -0,0 +1,140 @@
+"""Pluggable XML backend
+
+`xml.etree.ElementTree` is used by default, even when `lxml` is installed.
+`lxml` is used only when it's chosen with `RELATON_BIB_XML_BACKEND`
+environment variable set to "lxml" or with `use_backend`. It isn't picked
+automatically on import because `to_xml` without parent would then return
+lxml nodes, and callers working on them with `xml.etree.ElementTree` API
+(e.g. `ET.SubElement` in `opts["lambda"]`) would break just because lxml
+appears in the environment. `validate` needs lxml with either backend.
+
+Sub-elements are always created with the implementation of their parent so
+callers may keep passing their own `xml.etree.ElementTree` or `lxml` nodes
+to `to_xml` methods. Callbacks like `opts["lambda"]` of
+`BibliographicItem.to_xml` get nodes of the active backend, so with lxml
+they should use `SubElement` of this module or lxml API.
+
+For text both backends accept, `tostring` gives the same bytes. lxml
+rejects text with control characters (e.g. "\\x0b") with ValueError, while
+`xml.etree.ElementTree` serializes it as is.
+"""
+from functools import lru_cache
+
+import os
+import re
+import xml.etree.ElementTree as _etree
+
+try:
+    from lxml import etree as _lxml
+except ImportError:  # pragma: no cover
+    _lxml = None
+
+LXML = "lxml"
+ETREE = "etree"
+
+_backend = None
+
+# lxml -> ElementTree serialization differences
+_EMPTY_TAG = {bytes: (b"/>", b" />"), str: ("/>", " />")}
+_TAB = {bytes: (b"&#9;", b"&#09;"), str: ("&#9;", "&#09;")}
+_CR = {bytes: (b"&#13;", b"\r"), str: ("&#13;", "\r")}
+_TEXT_CR = {bytes: re.compile(rb">[^<]*&#13;[^<]*<"),
+            str: re.compile(r">[^<]*&#13;[^<]*<")}
+
+
+def use_backend(name: str = None) -> str:
+    """Switch XML backend
+
+    Keyword arguments:
+    name -- "lxml", "etree" or None for the default "etree"
+    """
+    global _backend
+    if name is None:
+        name = ETREE
+    elif name not in (LXML, ETREE):
+        raise ValueError(f"unknown XML backend: {name}")
+    elif name == LXML and _lxml is None:
+        raise ImportError("lxml is not installed")
+    _backend = _lxml if name == LXML else _etree
+    return name
+
+
+def backend() -> str:
+    return LXML if _backend is _lxml else ETREE
+
+
+def is_lxml(element) -> bool:
+    return _lxml is not None and isinstance(element, _lxml._Element)
+
+
+def Element(tag: str, attrib={}, **extra):
+    return _backend.Element(tag, attrib, **extra)
+
+
+def SubElement(parent, tag: str, attrib={}, **extra):
+    impl = _lxml if is_lxml(parent) else _etree
+    return impl.SubElement(parent, tag, attrib, **extra)
+
+
+def fromstring(text):
+    return _backend.fromstring(text)
+
+
+def parse(source):
+    return _backend.parse(source)
+
+
+def iterparse(source, events=("end",)):
+    return _backend.iterparse(source, events=events)
+
+
+def is_tree(xml) -> bool:
+    """Check if `xml` is an ElementTree (not an Element) of any backend"""
+    return isinstance(xml, _etree.ElementTree) \
+        or (_lxml is not None and isinstance(xml, _lxml._ElementTree))
+
+
+def tostring(element, encoding="us-ascii"):
+    """Serialize element the way `xml.etree.ElementTree.tostring` does
+
+    Keyword arguments:
+    element -- XML element of any backend
+    encoding -- "unicode" or ASCII compatible encoding
+    """
+    if not is_lxml(element):
+        return _etree.tostring(element, encoding=encoding)
+
+    return _normalize(_lxml.tostring(
+        element, encoding=str if encoding == "unicode" else encoding))
+
+
+def _normalize(data):
+    kind = type(data)
+    data = data.replace(*_EMPTY_TAG[kind]).replace(*_TAB[kind])
+    cr = _CR[kind]
+    if cr[0] in data:
+        # ElementTree escapes \r in attributes only
+        data = _TEXT_CR[kind].sub(lambda m: m.group(0).replace(*cr), data)
+    return data
+
+
+def validate(element, grammar: str) -> bool:
+    """Validate element against RELAX NG grammar, requires lxml
+
+    Keyword arguments:
+    element -- XML element of any backend
+    grammar -- path to RELAX NG grammar, e.g. `grammars/biblio.rng`
+    """
+    if _lxml is None:
+        raise ImportError("lxml is required for validation")
+    if not is_lxml(element):
+        element = _lxml.fromstring(_etree.tostring(element))
+    return _relaxng(os.path.abspath(grammar)).validate(element)
+
+
+@lru_cache(maxsize=None)
+def _relaxng(grammar: str):
+    return _lxml.RelaxNG(_lxml.parse(grammar))
+
+
+use_backend(os.environ.get("RELATON_BIB_XML_BACKEND"))
@@ -1,7 +1,7 @@
+import datetime
 import logging
 import xml.etree.ElementTree as ET
-import dateutil.parser as DU
-from typing import List, Union
+from typing import IO, Dict, Iterator, List, Union
 
 from .address import Address
 from .affiliation import Affiliation
@@ -17,11 +17,13 @@ from .contribution_info import ContributionInfo, ContributorRole
 from .copyright_association import CopyrightAssociation
 from .document_identifier import DocumentIdentifier
 from .document_relation import DocumentRelation
+from .document_relation_collection import DocRelationCollection
 from .document_status import DocumentStatus
 from .editorial_group import EditorialGroup
 from .formatted_ref import FormattedRef
 from .formatted_string import FormattedString, FormattedStringFormat
 from .ics import ICS
+from .lazy_bibliographic_item import LazyBibliographicItem
 from .localized_string import LocalizedString
 from .person import Person, FullName, PersonIdentifier
 from .place import Place
@@ -35,253 +37,333 @@ from .organization import Organization, OrgIdentifier
 from .medium import Medium
 from .validity import Validity
 from .workgroup import WorkGroup
-
-
-def from_xml(xml: Union[ET.ElementTree, ET.Element]) -> BibliographicItem:
-    bibitem = xml.getroot() if isinstance(xml, ET.ElementTree) else xml
+from .interning import intern_str
+from .relaton_bib import is_trusted, trusted_input
+from .xml_backend import fromstring, is_tree, iterparse, tostring
+
+
+def from_xml(xml: Union[ET.ElementTree, ET.Element],
+             lazy: bool = False, trusted: bool = False) -> BibliographicItem:
+    """Build bibitem from bibitem or bibdata element
+
+    Keyword arguments:
+    xml -- element or tree with the element as root
+    lazy -- return `LazyBibliographicItem` keeping the element serialized
+            and building every field on first access
+    trusted -- element is made from valid bibitem (e.g. read from own
+               cache), build it with `BibliographicItem.construct` and skip
+               validation of nested values, see `trusted_input`
+    """
+    bibitem = xml.getroot() if is_tree(xml) else xml
     if bibitem.tag in ["bibitem", "bibdata"]:
-        return _fetch_bibliographic_item(bibitem)
+        if lazy:
+            return LazyBibliographicItem(
+                tostring(bibitem),
+                _load_trusted_field if trusted else _load_field)
+        with trusted_input(trusted):
+            return _fetch_bibliographic_item(bibitem)
     else:
         logging.warning(
             "[relaton-bib] WARNING: "
             "can't find bibitem or bibdata element in the XML")
 
 
+def iter_from_xml(source: Union[str, IO]) -> Iterator[BibliographicItem]:
+    """Lazily parse every top-level bibitem/bibdata element of an XML source
+
+    Items are yielded as soon as their end tag is read and the processed
+    elements are detached from the tree, so memory use does not depend on
+    the size of the collection (e.g. a `<documents>` dump).
+
+    Keyword arguments:
+    source -- file name or file object with XML content
+    """
+    stack = []
+    for event, elem in iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem.tag not in ["bibitem", "bibdata"] \
+                or any(e.tag == "relation" for e in stack):
+            continue
+
+        yield _fetch_bibliographic_item(elem)
+
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
 def _fetch_bibliographic_item(bibitem: ET.Element):
-    fetched = bibitem.find("./fetched")
-    if fetched is not None:
-        fetched = DU.parse(fetched.text)
-    docnumber = bibitem.find("./docnumber")
-    if docnumber is not None:
-        docnumber = docnumber.text
-    edition = bibitem.find("./edition")
-    if edition is not None:
-        edition = edition.text
-    ext = bibitem.find("./ext")
-    doctype = None
-    subdoctype = None
-    if ext is not None:
-        doctype = ext.find("doctype")
-        if doctype is not None:
-            doctype = doctype.text
-
-        subdoctype = ext.find("subdoctype")
-        if subdoctype is not None:
-            subdoctype = subdoctype.text
-
-    return BibliographicItem(
+    props = {
+        "title": [],
+        "link": [],
+        "docidentifier": [],
+        "date": [],
+        "contributor": [],
+        "biblionote": [],
+        "language": [],
+        "script": [],
+        "abstract": [],
+        "copyright": [],
+        "relation": [],
+        "series": [],
+        "place": [],
+        "extent": [],
+        "accesslocation": [],
+        "classification": [],
+        "keyword": [],
+        "license": [],
+        "ics": [],
+    }
+    _dispatch(bibitem, _BIBITEM_BUILDERS, props)
+    props.update(props.pop("ext", None) or {})
+    for prop in ["date", "series", "title", "biblionote", "relation",
+                 "keyword"]:
+        props[prop] = _FIELD_FINISHERS[prop](props[prop])
+
+    make = BibliographicItem.construct if is_trusted() else BibliographicItem
+    return make(
         id=bibitem.get("id", None),
         type=bibitem.get("type", None),
-        fetched=fetched,
-        title=_fetch_titles(bibitem),
-        formattedref=_fref(bibitem),
-        link=_fetch_link(bibitem),
-        docidentifier=_fetch_docid(bibitem),
-        docnumber=docnumber,
-        date=_fetch_dates(bibitem),
-        contributor=_fetch_contributors(bibitem),
-        edition=edition,
-        version=_fetch_version(bibitem),
-        biblionote=_fetch_note(bibitem),
-        language=_fetch_list(bibitem, "./language"),
-        script=_fetch_list(bibitem, "./script"),
-        abstract=_fetch_abstract(bibitem),
-        status=_fetch_status(bibitem),
-        copyright=_fetch_copyright(bibitem),
-        relation=_fetch_relations(bibitem),
-        series=_fetch_series(bibitem),
-        medium=_fetch_medium(bibitem),
-        place=_fetch_place(bibitem),
-        extent=_fetch_extent(bibitem),
-        accesslocation=_fetch_list(bibitem, "./accesslocation"),
-        classification=_fetch_classification(bibitem),
-        keyword=_fetch_list(bibitem, "./keyword"),
-        license=_fetch_list(bibitem, "./license"),
-        validity=_fetch_validity(bibitem),
-        doctype=doctype,
-        subdoctype=subdoctype,
-        editorialgroup=_fetch_editorialgroup(ext),
-        ics=_fetch_ics(ext),
-        structuredidentifier=_fetch_structuredidentifier(ext),
-    )
+        **props)
 
 
-def _fetch_titles(item: ET.Element) -> TypedTitleStringCollection:
-    return TypedTitleStringCollection(list(map(
-        lambda t: _ttitle(t), item.findall("./title"))))
+def _load_field(source: bytes, name: str):
+    """Build field of `LazyBibliographicItem` from serialized element
 
+    The element is parsed on every call and dropped after it, so nothing
+    is shared between items or threads.
+    """
+    bibitem = fromstring(source)
+    if name is None:
+        return _fetch_bibliographic_item(bibitem)
+    return _fetch_field(bibitem, name)
 
-def _fetch_version(item: ET.Element) -> BibliographicItemVersion:
-    version = item.find("./version")
-    if not version:
-        return
 
-    rev_date = version.find("revision-date")
-    if rev_date is not None:
-        rev_date = rev_date.text
-    draft = _fetch_list(version, "draft")
+def _load_trusted_field(source: bytes, name: str):
+    """`_load_field` of trusted source"""
+    with trusted_input():
+        return _load_field(source, name)
 
-    return BibliographicItemVersion(revision_date=rev_date, draft=draft)
 
+def _fetch_field(bibitem: ET.Element, name: str):
+    """Build one field of bibitem the same way `_fetch_bibliographic_item`
+    does, used by `LazyBibliographicItem`
+    """
+    if name in ["id", "type"]:
+        return bibitem.get(name)
 
-def _fetch_place(item: ET.Element) -> List[Place]:
-    return list(map(
-        lambda pl: Place(name=pl.text,
-                         uri=pl.get("uri"),
-                         region=pl.get("region")),
-        item.findall("./place")))
+    if name in _FIELD_BUILDERS:
+        node, prop, builders = bibitem, name, _FIELD_BUILDERS[name]
+    else:
+        node = bibitem.find("ext")
+        prop = "sids" if name == "structuredidentifier" else name
+        builders = _EXT_FIELD_BUILDERS[prop]
+        if node is None:
+            return [] if name == "ics" else None
+
+    repeatable = next(iter(builders.values()))[2]
+    value = _dispatch(node, builders, {prop: []} if repeatable else {}) \
+        .get(prop)
+    finish = _FIELD_FINISHERS.get(name)
+    return finish(value) if finish else value
+
+
+def _dispatch(node: ET.Element, builders: Dict, props: Dict) -> Dict:
+    """Walk over children once and route them by tag to the builders
+
+    Keyword arguments:
+    node -- element which children should be processed
+    builders -- {tag: (property, builder, repeatable)}, a repeatable
+                property collects all elements, other properties are built
+                from a first element
+    props -- dict to store results, should contain lists for repeatable
+             properties
+    """
+    for child in node:
+        spec = builders.get(child.tag)
+        if spec is None:
+            continue
+        prop, build, repeatable = spec
+        if repeatable:
+            props[prop].append(build(child))
+        elif prop not in props:
+            props[prop] = build(child)
+    return props
+
+
+def _children(node: ET.Element) -> Dict[str, List[ET.Element]]:
+    """Group child elements by tag in one pass"""
+    result = {}
+    for child in node:
+        result.setdefault(child.tag, []).append(child)
+    return result
 
 
-def _fetch_note(item: ET.Element) -> BiblioNoteCollection:
-    return BiblioNoteCollection(list(map(
-        lambda n: BiblioNote(content=n.text, **n.attrib),
-        item.findall("./note"))))
+def _first(children: Dict[str, List[ET.Element]], tag: str) -> ET.Element:
+    nodes = children.get(tag)
+    return nodes[0] if nodes else None
 
 
-def _fetch_list(item: ET.Element, xpath: str) -> List[str]:
-    if item is None:
-        return []
-    return list(map(
-        lambda l: l.text,
-        item.findall(xpath)))
+def _texts(children: Dict[str, List[ET.Element]], tags: List[str]) \
+        -> Dict[str, str]:
+    """Texts of first elements with given tags"""
+    return {t: nodes[0].text for t in tags if (nodes := children.get(t))}
 
 
-def _fetch_series(item: ET.Element) -> List[Series]:
-    result = []
-    for sr in item.findall("./series"):
-        abbr = sr.find("abbreviation")
-        if abbr is not None:
-            abbr = _localized_str(abbr)
+def _text_list(children: Dict[str, List[ET.Element]], tag: str) -> List[str]:
+    return [n.text for n in children.get(tag, [])]
 
-        formattedref = _fref(sr)
-        title = _ttitle(sr.find("title"))
-        if not (formattedref or title):
-            continue
 
-        props = {p: n.text
-                 for p in ["place",
-                           "organization",
-                           "from",
-                           "to",
-                           "number",
-                           "partnumber"] if (n := sr.find(p)) is not None}
-
-        result.append(Series(
-            type=sr.get("type"),
-            formattedref=formattedref,
-            title=title,
-            place=props.get("place"),
-            organization=props.get("organization"),
-            abbreviation=abbr,
-            from_=props.get("from"),
-            to=props.get("to"),
-            number=props.get("number"),
-            partnumber=props.get("partnumber")))
-    return result
+def _text(node: ET.Element) -> str:
+    return node.text
+
+
+def _code(node: ET.Element) -> str:
+    """Interned text of language or script element"""
+    return intern_str(node.text)
+
+
+def _datetime(text: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        import dateutil.parser as DU
+        return DU.parse(text)
+
 
+def _fetch_fetched(node: ET.Element) -> datetime.datetime:
+    return _datetime(node.text)
 
-def _fetch_medium(item: ET.Element) -> Medium:
-    medium = item.find("./medium")
-    if not medium:
+
+def _fetch_ext(ext: ET.Element) -> Dict:
+    props = _dispatch(ext, _EXT_BUILDERS, {"ics": [], "sids": []})
+    props["structuredidentifier"] = \
+        StructuredIdentifierCollection(props.pop("sids"))
+    return props
+
+
+def _fetch_version(version: ET.Element) -> BibliographicItemVersion:
+    if len(version) == 0:
         return
 
-    props = {p: n.text
-             for p in ["form", "size", "scale"]
-             if (n := medium.find(p)) is not None}
+    children = _children(version)
+    rev_date = _first(children, "revision-date")
+    if rev_date is not None:
+        rev_date = rev_date.text
 
-    return Medium(**props)
+    return BibliographicItemVersion(revision_date=rev_date,
+                                    draft=_text_list(children, "draft"))
 
 
-def _fetch_extent(item: ET.Element) -> List[BibItemLocality]:
-    result = []
+def _fetch_place(pl: ET.Element) -> Place:
+    return Place(name=pl.text, uri=pl.get("uri"), region=pl.get("region"))
 
-    for ext in item.findall("./extent"):
-        type = ext.get("type")
-        reference_from = ext.find("referenceFrom")
-        if reference_from is not None:
-            reference_from = reference_from.text
-        reference_to = ext.find("referenceTo")
-        if reference_to is not None:
-            reference_to = reference_to.text
-        result.append(BibItemLocality(
-            type=type,
-            reference_from=reference_from,
-            reference_to=reference_to))
 
-    return result
+def _fetch_note(n: ET.Element) -> BiblioNote:
+    return BiblioNote(content=n.text, **n.attrib)
 
 
-def _fetch_classification(item: ET.Element) -> List[Classification]:
-    return list(map(
-        lambda cls: Classification(type=cls.get("type"),
-                                   value=cls.text),
-        item.findall("./classification")))
+def _fetch_series(sr: ET.Element) -> Series:
+    children = _children(sr)
+    abbr = _first(children, "abbreviation")
+    if abbr is not None:
+        abbr = _localized_str(abbr)
 
+    formattedref = _fref(sr, children)
+    title = _first(children, "title")
+    if title is not None:
+        title = _ttitle(title)
+    if not (formattedref or title):
+        return
 
-def _fetch_validity(item: ET.Element) -> Validity:
-    validity = item.find("./validity")
-    if validity is None:
+    props = _texts(children, ["place",
+                              "organization",
+                              "from",
+                              "to",
+                              "number",
+                              "partnumber"])
+
+    return Series(
+        type=sr.get("type"),
+        formattedref=formattedref,
+        title=title,
+        place=props.get("place"),
+        organization=props.get("organization"),
+        abbreviation=abbr,
+        from_=props.get("from"),
+        to=props.get("to"),
+        number=props.get("number"),
+        partnumber=props.get("partnumber"))
+
+
+def _fetch_medium(medium: ET.Element) -> Medium:
+    if len(medium) == 0:
         return
 
-    begins = validity.find("validityBegins")
-    if begins is not None:
-        begins = DU.parse(begins.text)
-    ends = validity.find("validityEnds")
-    if ends is not None:
-        ends = DU.parse(ends.text)
-    revision = validity.find("revision")
-    if revision is not None:
-        revision = DU.parse(revision.text)
-
-    props = {p: DU.parse(n.text)
+    return Medium(**_texts(_children(medium), ["form", "size", "scale"]))
+
+
+def _fetch_extent(ext: ET.Element) -> BibItemLocality:
+    props = _texts(_children(ext), ["referenceFrom", "referenceTo"])
+    return BibItemLocality(
+        type=ext.get("type"),
+        reference_from=props.get("referenceFrom"),
+        reference_to=props.get("referenceTo"))
+
+
+def _fetch_classification(cls: ET.Element) -> Classification:
+    return Classification(type=cls.get("type"), value=cls.text)
+
+
+def _fetch_validity(validity: ET.Element) -> Validity:
+    texts = _texts(_children(validity),
+                   ["validityBegins", "validityEnds", "revision"])
+    props = {p: _datetime(texts[t])
              for t, p in {"validityBegins": "begins",
                           "validityEnds": "ends",
                           "revision": "revision"}.items()
-             if (n := validity.find(t)) is not None}
+             if t in texts}
 
     return Validity(**props)
 
 
-def _fetch_docid(item: ET.Element) -> List[DocumentIdentifier]:
-    return list(map(
-        lambda did: DocumentIdentifier(id=did.text,
-                                       type=did.get("type"),
-                                       scope=did.get("scope")),
-        item.findall("./docidentifier")))
+def _fetch_docid(did: ET.Element) -> DocumentIdentifier:
+    return DocumentIdentifier(id=did.text,
+                              type=did.get("type"),
+                              scope=did.get("scope"))
 
 
 def _ttitle(title: ET.Element) -> TypedTitleString:
     if title is None:
         return []
 
-    content = _localized_strs(title, "./variant")
+    content = [_localized_str(v) for v in title if v.tag == "variant"]
     if not any(content):
         content = title.text
 
-    props = title.attrib.copy()
+    props = dict(title.attrib)
     props["content"] = content
 
     return TypedTitleString(**props)
 
 
-def _localized_strs(node: ET.Element, xpath: str) -> List[LocalizedString]:
-    return list(map(
-        lambda v: _localized_str(v),
-        node.findall(xpath)))
+def _localized_strs(nodes: List[ET.Element]) -> List[LocalizedString]:
+    return [_localized_str(n) for n in nodes]
 
 
-def _fetch_status(item: ET.Element) -> DocumentStatus:
-    status = item.find("./status")
-    if status is None:
-        return
-
-    stg = status.find("stage")
-    iter = status.find("iteration")
+def _fetch_status(status: ET.Element) -> DocumentStatus:
+    children = _children(status)
+    stg = _first(children, "stage")
+    iter = _first(children, "iteration")
     if iter is not None:
         iter = iter.text
     return DocumentStatus(
         stage=status.text if stg is None else _stage(stg),
-        substage=_stage(status.find("substage")),
+        substage=_stage(_first(children, "substage")),
         iteration=iter,
     )
 
@@ -295,157 +377,132 @@ def _stage(node: ET.Element) -> DocumentStatus.Stage:
         abbreviation=node.get("abbreviation"))
 
 
-def _fetch_dates(item: ET.Element) -> List[BibliographicDate]:
-    result = []
-    for d in item.findall("./date"):
-        props = {p: n.text
-                 for p in ["on", "from", "to"]
-                 if (n := d.find(p)) is not None}
-        props["type"] = d.get("type", BibliographicDateType.PUBLISHED)
-        if "from" in props:
-            props["from_"] = props.pop("from")
-        elif "on" not in props:
-            continue
-
-        result.append(BibliographicDate(**props))
+def _fetch_date(d: ET.Element) -> BibliographicDate:
+    props = _texts(_children(d), ["on", "from", "to"])
+    props["type"] = d.get("type", BibliographicDateType.PUBLISHED)
+    if "from" in props:
+        props["from_"] = props.pop("from")
+    elif "on" not in props:
+        return
 
-    return result
+    return BibliographicDate(**props)
 
 
 def _get_org(org: ET.Element) -> Organization:
-    props = {p: n.text
-             for p in ["abbreviation", "uri"]
-             if (n := org.find(p)) is not None}
-    props["name"] = list(map(
-        lambda n: _localized_str(n),
-        org.findall(f"./name")))
-    props["identifier"] = list(map(
-        lambda i: OrgIdentifier(value=i.text,
-                                type=i.get("type")),
-        org.findall(f"./identifier")))
-
-    props["subdivision"] = _fetch_list(org, "subdivision")
+    children = _children(org)
+    props = _texts(children, ["abbreviation", "uri"])
+    props["name"] = _localized_strs(children.get("name", []))
+    props["identifier"] = [OrgIdentifier(value=i.text, type=i.get("type"))
+                           for i in children.get("identifier", [])]
+    props["subdivision"] = _text_list(children, "subdivision")
     return Organization(**props)
 
 
 def _get_person(person: ET.Element) -> Person:
     affiliations = []
-    for a in person.findall("./affiliation"):
-        desc = list(map(
-            lambda d: _formatted_str(d), a.findall("./description")))
-        affiliations.append(
-            Affiliation(
-                organization=_get_org(a.find("./organization")),
-                description=desc
-            )
-        )
-
     contact = []
-    for c in list(person):
-        if c.tag == ContactType.ADDRESS:
-            props = {p: n.text
-                     for p in ["city", "state", "country", "postcode"]
-                     if (n := c.find(p)) is not None}
-            props["street"] = _fetch_list(c, "./street")
+    identifier = []
+    name = None
+    for c in person:
+        if c.tag == "affiliation":
+            affiliations.append(_get_affiliation(c))
+        elif c.tag == ContactType.ADDRESS:
+            children = _children(c)
+            props = _texts(children, ["city", "state", "country", "postcode"])
+            props["street"] = _text_list(children, "street")
             contact.append(Address(**props))
         elif c.tag in [ContactType.PHONE,
                        ContactType.EMAIL,
                        ContactType.URI]:
             contact.append(Contact(type=c.tag, value=c.text))
-
-    identifier = list(map(
-        lambda pi: PersonIdentifier(type=pi.get("type"), value=pi.text),
-        person.findall("./identifier")))
-
-    fullname_props = dict(
-        initial=_name_part(person, "initial"),
-        forename=_name_part(person, "forename"),
-        addition=_name_part(person, "addition"),
-        prefix=_name_part(person, "prefix"))
-
-    if (cname := person.find("./name/completename")) is not None:
-        fullname_props["completename"] = _localized_str(cname)
-    if (sname := person.find("./name/surname")) is not None:
-        fullname_props["surname"] = _localized_str(sname)
-
-    name = FullName(**fullname_props)
+        elif c.tag == "identifier":
+            identifier.append(
+                PersonIdentifier(type=c.get("type"), value=c.text))
+        elif c.tag == "name" and name is None:
+            name = _get_fullname(c)
 
     return Person(
-        name=name,
+        name=FullName() if name is None else name,
         affiliation=affiliations,
         contact=contact,
         identifier=identifier)
 
 
-def _name_part(person: ET.Element, part: str) -> List[LocalizedString]:
-    return list(map(
-        lambda v: _localized_str(v),
-        person.findall(f"./name/{part}")))
-
-
-def _fetch_contributors(item: ET.Element) -> List[ContributionInfo]:
-    result = []
-    for c in item.findall("./contributor"):
-        entity = None
-        if (org := c.find("./organization")) is not None:
-            entity = _get_org(org)
-        elif (person := c.find("./person")) is not None:
-            entity = _get_person(person)
-
-        role = list(map(
-            lambda r: ContributorRole(
-                type=r.get("type"),
-                description=_localized_strs(r, "./description")),
-            c.findall("./role")))
-        result.append(ContributionInfo(entity=entity, role=role))
-    return result
+def _get_affiliation(affiliation: ET.Element) -> Affiliation:
+    children = _children(affiliation)
+    return Affiliation(
+        organization=_get_org(_first(children, "organization")),
+        description=[_formatted_str(d)
+                     for d in children.get("description", [])])
 
 
-def _fetch_abstract(item: ET.Element) -> List[FormattedString]:
-    return list(map(lambda a: _formatted_str(a), item.findall("./abstract")))
+def _get_fullname(name: ET.Element) -> FullName:
+    children = _children(name)
+    props = {part: _localized_strs(children.get(part, []))
+             for part in ["initial", "forename", "addition", "prefix"]}
 
+    if (cname := _first(children, "completename")) is not None:
+        props["completename"] = _localized_str(cname)
+    if (sname := _first(children, "surname")) is not None:
+        props["surname"] = _localized_str(sname)
 
-def _fetch_copyright(item: ET.Element) -> List[TypedUri]:
-    result = []
-    for cp in item.findall("./copyright"):
-        props = {p: n.text
-                 for p in ["from", "to", "scope"]
-                 if (n := cp.find(p)) is not None}
-        props["from_"] = props.pop("from")
-        props["owner"] = list(map(
-            lambda o: ContributionInfo(
-                entity=_get_org(o.find("organization"))),
-            cp.findall("owner")))
-
-        result.append(CopyrightAssociation(**props))
-    return result
+    return FullName(**props)
 
 
-def _fetch_link(item: ET.Element) -> List[TypedUri]:
-    return list(map(
-        lambda l: TypedUri(type=l.get("type"), content=l.text),
-        item.findall("./uri")))
+def _fetch_contributor(c: ET.Element) -> ContributionInfo:
+    children = _children(c)
+    entity = None
+    if (org := _first(children, "organization")) is not None:
+        entity = _get_org(org)
+    elif (person := _first(children, "person")) is not None:
+        entity = _get_person(person)
 
+    role = [ContributorRole(
+                type=r.get("type"),
+                description=_localized_strs(
+                    [d for d in r if d.tag == "description"]))
+            for r in children.get("role", [])]
+    return ContributionInfo(entity=entity, role=role)
+
+
+def _fetch_copyright(cp: ET.Element) -> CopyrightAssociation:
+    children = _children(cp)
+    props = _texts(children, ["from", "to", "scope"])
+    props["from_"] = props.pop("from")
+    props["owner"] = [ContributionInfo(
+                          entity=_get_org(o.find("organization")))
+                      for o in children.get("owner", [])]
+
+    return CopyrightAssociation(**props)
+
+
+def _fetch_link(lnk: ET.Element) -> TypedUri:
+    return TypedUri(type=lnk.get("type"), content=lnk.text)
+
+
+def _fetch_relation(rel: ET.Element, klass=DocumentRelation):
+    description = None
+    bibitem = None
+    locality = []
+    source_locality = []
+    for c in rel:
+        if c.tag == "description" and description is None:
+            description = _formatted_str(c)
+        elif c.tag == "bibitem" and bibitem is None:
+            bibitem = c
+        elif c.tag in ["locality", "localityStack"]:
+            locality.append(_locality_stack(c, "locality", Locality))
+        elif c.tag in ["sourceLocality", "sourceLocalityStack"]:
+            source_locality.append(_locality_stack(
+                c, "sourceLocality", SourceLocality, SourceLocalityStack))
 
-def _fetch_relations(item: ET.Element, klass=DocumentRelation):
-    result = []
-    for rel in item.findall("./relation"):
-        result.append(klass(
-            type=rel.get("type"),
-            description=_relation_description(rel),
-            bibitem=_fetch_bibliographic_item(rel.find("./bibitem")),
-            locality=_localities(rel),
-            source_locality=_source_localities(rel),
-        ))
-    return result
-
-
-def _relation_description(rel: ET.Element) -> FormattedString:
-    d = rel.find("./description")
-    if d is None:
-        return
-
-    return _formatted_str(d)
+    return klass(
+        type=rel.get("type"),
+        description=description,
+        bibitem=_fetch_bibliographic_item(bibitem),
+        locality=locality,
+        source_locality=source_locality,
+    )
 
 
 def _formatted_str(node: ET.Element) -> FormattedString:
@@ -462,28 +519,22 @@ def _localized_str(node: ET.Element) -> LocalizedString:
                            script=node.get("script", []))
 
 
-def _localities(loc: ET.Element) -> List[LocalityStack]:
-    result = []
-    for lc in list(loc):
-        if lc.tag not in ["locality", "localityStack"]:
-            continue
-        lcs = None
-        if lc.get("type"):
-            lcs = [_locality(lc)]
-        else:
-            lcs = list(filter(None, map(
-                lambda l: _locality(l), lc.findall("./locality"))))
-        result.append(LocalityStack(lcs))
-    return result
+def _locality_stack(lc: ET.Element, tag: str, klass=Locality,
+                    stack_klass=LocalityStack) -> LocalityStack:
+    if lc.get("type"):
+        return stack_klass([_locality(lc, klass)])
+
+    return stack_klass([_locality(loc, klass) for loc in lc if loc.tag == tag])
 
 
 def _locality(loc: ET.Element, klass=Locality):
+    props = _texts(_children(loc), ["referenceFrom", "referenceTo"])
     to = None
-    if (rt := loc.find("./referenceTo")) is not None:
-        to = LocalizedString(rt.text)
+    if "referenceTo" in props:
+        to = LocalizedString(props["referenceTo"])
     fr0m = None
-    if (rf := loc.find("./referenceFrom")) is not None:
-        fr0m = LocalizedString(rf.text)
+    if "referenceFrom" in props:
+        fr0m = LocalizedString(props["referenceFrom"])
 
     return klass(
         type=loc.get("type"),
@@ -492,29 +543,18 @@ def _locality(loc: ET.Element, klass=Locality):
     )
 
 
-def _source_localities(rel: ET.Element) -> List[SourceLocalityStack]:
-    result = []
-    for lc in list(rel):
-        if lc.tag not in ["sourceLocality", "sourceLocalityStack"]:
-            continue
-        sls = None
-        if lc.get("type"):
-            sls = [_locality(lc, SourceLocality)]
-        else:
-            sls = list(filter(None, map(
-                lambda l: _locality(l, SourceLocality),
-                lc.findall("./sourceLocality"))))
-        result.append(SourceLocalityStack(sls))
-    return result
-
-
-def _fref(item: ET.Element) -> FormattedRef:
-    if not item:
+def _fref(item: ET.Element, children: Dict = None) -> FormattedRef:
+    if len(item) == 0:
         return
-    ident = item.find("./formattedref")
+    ident = _first(children, "formattedref") if children is not None \
+        else item.find("./formattedref")
     if ident is None:
         return
 
+    return _fetch_formattedref(ident)
+
+
+def _fetch_formattedref(ident: ET.Element) -> FormattedRef:
     return FormattedRef(
         content=ident.text,
         format=ident.get("format", FormattedStringFormat.TEXT_PLAIN),
@@ -522,65 +562,105 @@ def _fref(item: ET.Element) -> FormattedRef:
         script=ident.get("script", []))
 
 
-def _fetch_editorialgroup(ext: ET.Element) -> EditorialGroup:
-    if ext is None:
-        return
-    eg = ext.find("editorialgroup")
-    if eg is None:
-        return
-
-    return EditorialGroup(list(map(
-        lambda tc: TechnicalCommittee(
+def _fetch_editorialgroup(eg: ET.Element) -> EditorialGroup:
+    return EditorialGroup([
+        TechnicalCommittee(
             WorkGroup(name=tc.text,
                       number=int(tc.get("number")),
                       type=tc.get("type"),
                       identifier=tc.get("identifier"),
-                      prefix=tc.get("prefix"))),
-        eg.findall("./technical-committee"))))
-
-
-def _fetch_ics(ext: ET.Element) -> List[ICS]:
-    if ext is None:
-        return []
-
-    result = []
-    for ics in ext.findall("ics"):
-        props = {p: n.text
-                 for p in ["code", "text"]
-                 if (n := ics.find(p)) is not None}
-        result.append(ICS(**props))
+                      prefix=tc.get("prefix")))
+        for tc in eg if tc.tag == "technical-committee"])
+
+
+def _fetch_ics(ics: ET.Element) -> ICS:
+    return ICS(**_texts(_children(ics), ["code", "text"]))
+
+
+def _fetch_structuredidentifier(si: ET.Element) -> StructuredIdentifier:
+    children = _children(si)
+    props = _texts(children, ["class",
+                              "docnumber",
+                              "partnumber",
+                              "edition",
+                              "version",
+                              "supplementtype",
+                              "supplementnumber",
+                              "language",
+                              "year"])
+    return StructuredIdentifier(
+        type=si.get("type"),
+        agency=_text_list(children, "agency"),
+        class_=props.get("class"),
+        docnumber=props.get("docnumber"),
+        partnumber=props.get("partnumber"),
+        edition=props.get("edition"),
+        version=props.get("version"),
+        supplementtype=props.get("supplementtype"),
+        supplementnumber=props.get("supplementnumber"),
+        language=props.get("language"),
+        year=props.get("year"))
+
+
+_EXT_BUILDERS = {
+    "doctype": ("doctype", _text, False),
+    "subdoctype": ("subdoctype", _text, False),
+    "editorialgroup": ("editorialgroup", _fetch_editorialgroup, False),
+    "ics": ("ics", _fetch_ics, True),
+    "structuredidentifier": ("sids", _fetch_structuredidentifier, True),
+}
+
+_BIBITEM_BUILDERS = {
+    "fetched": ("fetched", _fetch_fetched, False),
+    "title": ("title", _ttitle, True),
+    "formattedref": ("formattedref", _fetch_formattedref, False),
+    "uri": ("link", _fetch_link, True),
+    "docidentifier": ("docidentifier", _fetch_docid, True),
+    "docnumber": ("docnumber", _text, False),
+    "date": ("date", _fetch_date, True),
+    "contributor": ("contributor", _fetch_contributor, True),
+    "edition": ("edition", _text, False),
+    "version": ("version", _fetch_version, False),
+    "note": ("biblionote", _fetch_note, True),
+    "language": ("language", _code, True),
+    "script": ("script", _code, True),
+    "abstract": ("abstract", _formatted_str, True),
+    "status": ("status", _fetch_status, False),
+    "copyright": ("copyright", _fetch_copyright, True),
+    "relation": ("relation", _fetch_relation, True),
+    "series": ("series", _fetch_series, True),
+    "medium": ("medium", _fetch_medium, False),
+    "place": ("place", _fetch_place, True),
+    "extent": ("extent", _fetch_extent, True),
+    "accesslocation": ("accesslocation", _text, True),
+    "classification": ("classification", _fetch_classification, True),
+    "keyword": ("keyword", _text, True),
+    "license": ("license", _text, True),
+    "validity": ("validity", _fetch_validity, False),
+    "ext": ("ext", _fetch_ext, False),
+}
+
+
+def _by_property(builders: Dict) -> Dict[str, Dict]:
+    """Split builders by property, {property: {tag: spec}}"""
+    result = {}
+    for tag, spec in builders.items():
+        result.setdefault(spec[0], {})[tag] = spec
     return result
 
 
-def _fetch_structuredidentifier(ext: ET.Element) -> StructuredIdentifier:
-    if ext is None:
-        return
-
-    sids = []
-    for si in ext.findall("structuredidentifier"):
-        agency = _fetch_list(si, "agency")
-        class_ = si.find("class")
-        if class_ is not None:
-            class_ = class_.text
-        props = {p: n.text
-                 for p in ["docnumber",
-                           "partnumber",
-                           "edition",
-                           "version",
-                           "supplementtype",
-                           "supplementnumber",
-                           "language",
-                           "year"] if (n := si.find(p)) is not None}
-        sids.append(StructuredIdentifier(
-            type=si.get("type"),
-            agency=agency,
-            class_=class_,
-            docnumber=props.get("docnumber"),
-            partnumber=props.get("partnumber"),
-            edition=props.get("edition"),
-            version=props.get("version"),
-            supplementtype=props.get("supplementtype"),
-            supplementnumber=props.get("supplementnumber"),
-            language=props.get("language"),
-            year=props.get("year")))
-    return StructuredIdentifierCollection(sids)
+_FIELD_BUILDERS = _by_property(_BIBITEM_BUILDERS)
+_FIELD_BUILDERS.pop("ext")
+_EXT_FIELD_BUILDERS = _by_property(_EXT_BUILDERS)
+
+# conversions of built properties done by `_fetch_bibliographic_item`, so
+# values can be passed to `BibliographicItem.construct` as they are
+_FIELD_FINISHERS = {
+    "date": lambda v: list(filter(None, v)),
+    "series": lambda v: list(filter(None, v)),
+    "title": TypedTitleStringCollection,
+    "biblionote": BiblioNoteCollection,
+    "relation": DocRelationCollection,
+    "keyword": lambda v: [LocalizedString(k) for k in v],
+    "structuredidentifier": StructuredIdentifierCollection,
+}
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from typing import IO, Iterable
+
+import io
+
+from .xml_backend import tostring
+
+ROOT = "documents"
+
+
+def write_xml(items: Iterable, fileobj: IO, opts: dict = {},
+              root: str = ROOT) -> int:
+    """Serialize items to stream one by one inside of `<documents>` element
+
+    Only one item is rendered at a time, so memory doesn't grow with the
+    number of items. Output is the same as `tostring` of the `<documents>`
+    element with all the items rendered in it.
+
+    Keyword arguments:
+    items -- iterable of objects with `to_xml` method, e.g. bibitems
+    fileobj -- text or binary stream, binary one gets ASCII bytes
+    opts -- rendering options passed to `to_xml` of every item
+    root -- name of wrapping element
+
+    Returns number of written items.
+    """
+    text = isinstance(fileobj, io.TextIOBase)
+    encoding = "unicode" if text else "us-ascii"
+    start, end, empty = f"<{root}>", f"</{root}>", f"<{root} />"
+    if not text:
+        start, end, empty = start.encode(), end.encode(), empty.encode()
+
+    count = 0
+    for item in items:
+        if not count:
+            fileobj.write(start)
+        fileobj.write(tostring(item.to_xml(None, opts), encoding))
+        count += 1
+    fileobj.write(end if count else empty)
+    return count
@@ -0,0 +1,123 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import ParseResult, from_xml, parse_many
+from relaton_bib.batch_parser import _split_tasks
+from relaton_bib.relaton_bib import pack_dataclass, unpack_dataclass
+
+ITEM = """<bibitem id="{0}">
+  <title type="main">Title {0}</title>
+  <relation type="updates">
+    <bibitem><formattedref format="text/plain">ISO {0}</formattedref></bibitem>
+  </relation>
+</bibitem>"""
+
+
+@pytest.fixture
+def files(tmp_path):
+    documents = tmp_path / "documents.xml"
+    documents.write_text("<documents>%s%s</documents>" % (
+        ITEM.format("doc1"), ITEM.format("doc2")))
+    single = tmp_path / "single.xml"
+    single.write_text(ITEM.format("single"))
+    broken = tmp_path / "broken.xml"
+    broken.write_text("<bibitem>")
+    return [str(documents), str(broken), str(single)]
+
+
+def test_pack_unpack_item():
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    item = from_xml(ET.parse(file))
+
+    assert unpack_dataclass(pack_dataclass(item)) == item
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_in_order(files, workers):
+    results = list(parse_many(files, workers=workers))
+
+    assert all(isinstance(r, ParseResult) for r in results)
+    assert [(os.path.basename(r.path), r.item and r.item.id)
+            for r in results] == [("documents.xml", "doc1"),
+                                  ("documents.xml", "doc2"),
+                                  ("broken.xml", None),
+                                  ("single.xml", "single")]
+    assert results[1].error is None
+    assert results[2].error.startswith(("ParseError", "XMLSyntaxError"))
+    assert results[3].item.relation[0].bibitem.formattedref.content \
+        == "ISO single"
+
+
+def test_parse_many_split_file(files):
+    results = list(parse_many(files[:1], workers=2, split_size=0,
+                              ordered=False))
+
+    assert sorted(r.item.id for r in results) == ["doc1", "doc2"]
+
+
+def test_parse_many_missing_file(tmp_path):
+    results = list(parse_many([str(tmp_path / "missing.xml")], workers=1))
+
+    assert len(results) == 1
+    assert results[0].item is None
+    assert "FileNotFoundError" in results[0].error
+
+
+def test_parse_many_split_skips_comments(tmp_path):
+    documents = tmp_path / "documents.xml"
+    documents.write_text("<documents><!-- <bibitem> --><![CDATA[<bibitem>]]>"
+                         "%s<?pi <bibitem>?>%s</documents>" % (
+                             ITEM.format("doc1"), ITEM.format("doc2")))
+    results = list(parse_many([str(documents)], workers=1, split_size=0))
+
+    assert [r.item.id for r in results] == ["doc1", "doc2"]
+
+
+def test_parse_many_split_declared_encoding(tmp_path):
+    documents = tmp_path / "documents.xml"
+    documents.write_bytes((
+        '<?xml version="1.0" encoding="ISO-8859-1"?><documents>%s'
+        '</documents>' % ITEM.format("doc1").replace("Title", "Titré")
+    ).encode("latin-1"))
+    results = list(parse_many([str(documents)], workers=1, split_size=0))
+
+    assert [r.error for r in results] == [None]
+    assert results[0].item.title[0].title.content == "Titré doc1"
+
+
+def test_split_tasks_batches(tmp_path):
+    path = tmp_path / "documents.xml"
+    path.write_text("<documents>%s</documents>" % "".join(
+        ITEM.format(f"doc{i}") for i in range(5)))
+    size = len(ITEM.format("doc0"))
+
+    tasks = list(_split_tasks(str(path), 2 * size))
+
+    assert [len(ranges) for _, ranges, _, _ in tasks] == [2, 2, 1]
+    results = list(parse_many([str(path)], workers=2, split_size=2 * size))
+    assert [r.item.id for r in results] == [f"doc{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("documents,skip,ids", [
+    ('<!DOCTYPE documents><documents>%s</documents>', 0, ["doc1"]),
+    ('<documents xmlns:x="urn:x">%s</documents>', 0, ["doc1"]),
+    # the second item is in other namespace
+    ('<documents>%s<x xmlns="urn:x">%s</x></documents>', 1, ["doc1"]),
+    ('<documents>%s%s', 2, ["doc1", "doc2", None]),
+])
+def test_parse_many_not_split(tmp_path, documents, skip, ids):
+    path = tmp_path / "documents.xml"
+    items = [ITEM.format("doc1"), ITEM.format("doc2")]
+    path.write_text(documents % tuple(items[:documents.count("%s")]))
+
+    tasks = list(_split_tasks(str(path), 0))
+
+    # items before the unsafe place are parsed apart, the rest in whole file
+    assert len(tasks) == skip + 1
+    assert tasks[-1] == (str(path), None, b"", skip)
+    results = list(parse_many([str(path)], workers=1, split_size=0))
+    assert [r.item and r.item.id for r in results] == ids
@@ -1,4 +1,11 @@
+import dataclasses
+import datetime
+
+import pytest
+
 from relaton_bib import BibliographicDate, BibliographicDateType
+from relaton_bib.relaton_bib import construct, pack_dataclass, \
+    unpack_dataclass
 
 
 def test_nov_2014():
@@ -63,3 +70,112 @@ def test_on_format_year_only():
 #     date = BibliographicDate(type=BibliographicDateType.ACCESSED.value, on="")
 #     item.instance_variable_set :@on, "Nov 2020"
 #     expect(item.on(:month)).to eq "Nov 2020"
+
+
+@pytest.mark.parametrize("on,year,month,day", [
+    ("2014-11-05", 2014, 11, 5),
+    ("2014-11", 2014, 11, 1),
+    ("2014", 2014, 1, 1),
+])
+def test_part(on, year, month, day):
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on=on)
+
+    assert date.part() == year
+    assert date.part("month") == month
+    assert date.value("on", "day") == day
+    assert date.date_format(on, "full") == f"{year}-{month:02}-{day:02}"
+
+
+def test_part_invalid():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on="2014")
+
+    with pytest.raises(ValueError):
+        date.date_format("2014-11-05T10:00", "full")
+    assert date.date_format("Unknown", "full") == "Unknown"
+
+
+def test_components():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on="2014-11", from_="2014", to="2015-01-02")
+
+    assert date.components() == (2014, 11, None, "month")
+    assert date.components("from_") == (2014, None, None, "year")
+    assert date.components("to") == (2015, 1, 2, "day")
+    assert date.components() is date.components()
+
+    date.on = "2016-03-04"
+
+    assert date.components() == (2016, 3, 4, "day")
+    assert date.value("on", "month") == 3
+
+
+def test_components_cache_is_not_field():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on="2014-11")
+    date.components()
+
+    assert [f.name for f in dataclasses.fields(date)] == \
+        ["type", "on", "from_", "to"]
+    assert dataclasses.asdict(date) == {
+        "type": "published", "on": "2014-11", "from_": None, "to": None}
+    assert unpack_dataclass(pack_dataclass(date)) == date
+    assert construct(BibliographicDate, type="published",
+                     on="2014-11").components() == date.components()
+
+
+def test_date_object_stored_as_iso_string():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on=datetime.date(2014, 11, 5),
+                             from_=datetime.datetime(2014, 11, 5, 10, 30))
+
+    assert date.on == "2014-11-05"
+    assert date.from_ == "2014-11-05"
+    assert date.to_xml(None).find("on").text == "2014-11-05"
+    assert date.to_dict() == {"type": "published", "value": "2014-11-05",
+                              "from": "2014-11-05"}
+
+
+def test_components_of_date_object():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on=datetime.date(2014, 11, 5))
+
+    assert date.components() == (2014, 11, 5, "day")
+    assert date.part("day") == 5
+
+
+def test_part_from():
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             from_="2014-11")
+
+    assert date.part() == 2014
+    assert date.value("from", "month") == 11
+
+
+@pytest.mark.parametrize("on", ["2014-00", "2014-11-00", "2014-13"])
+def test_invalid_components(on):
+    date = BibliographicDate(type=BibliographicDateType.PUBLISHED.value,
+                             on="2014")
+    date.on = on
+
+    with pytest.raises(ValueError):
+        date.components()
+
+
+def test_sort():
+    def date(on):
+        return BibliographicDate(
+            type=BibliographicDateType.PUBLISHED.value, on=on)
+
+    unknown = date("2014")
+    unknown.on = "Unknown"
+    dates = [date("2014-11-05"), date("2014"), unknown, date("2013-12"),
+             date("2014-11")]
+
+    assert [d.on for d in sorted(dates)] == \
+        ["Unknown", "2013-12", "2014", "2014-11", "2014-11-05"]
+    assert sorted(dates, key=BibliographicDate.sort_key) == sorted(dates)
+    assert date("2014") < date("2014-01")
+    assert date("2015") >= date("2014-01")
+    assert date("2014") == date("2014")
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import dataclasses
 import datetime
 import logging
 import pytest
@@ -33,6 +34,7 @@ from relaton_bib import Validity
 from relaton_bib import BibItemLocality, Locality, BibItemLocalityType, \
     SourceLocalityStack, SourceLocality, LocalityStack
 from relaton_bib import BiblioNote, BiblioNoteCollection
+from relaton_bib import DocRelationCollection
 from relaton_bib import BibliographicItemVersion
 from relaton_bib import Place
 from relaton_bib import Person, FullName, PersonIdentifier
@@ -43,6 +45,7 @@ from relaton_bib import DocRelationCollection
 from relaton_bib import DocumentRelation
 from relaton_bib import WorkGroup
 from relaton_bib import StructuredIdentifier
+from relaton_bib import from_dict, from_json
 
 
 @pytest.fixture
@@ -632,3 +635,75 @@ def test_iconvert_item_to_BibXML_RFC(subject: BibliographicItem):
     bibxml = subject.to_bibxml()
 
     assert elements_equal(reference, bibxml)
+
+
+def test_to_dict_round_trip(subject: BibliographicItem):
+    subject.fetched = datetime.datetime(2021, 8, 30)
+    hash = subject.to_dict()
+
+    assert hash["id"] == subject.id
+    assert hash["fetched"] == "2021-08-30T00:00:00"
+    assert from_dict(hash) == subject
+
+
+def test_to_json_round_trip(subject: BibliographicItem):
+    assert from_json(subject.to_json()) == subject
+
+
+def test_construct(subject: BibliographicItem):
+    fields = {f.name: getattr(subject, f.name)
+              for f in dataclasses.fields(subject) if f.init}
+    item = BibliographicItem.construct(**fields)
+
+    assert item == subject
+    assert BibliographicItem.construct(
+        docidentifier=subject.docidentifier).id == "TC211"
+    assert BibliographicItem.construct(type="invalid").type == "invalid"
+    # values are taken as they are, only lists are wrapped to collections
+    item = BibliographicItem.construct(relation=[], keyword=["Keyword"])
+    assert isinstance(item.relation, DocRelationCollection)
+    assert item.keyword == ["Keyword"]
+
+
+def test_relation_list_to_asciibib():
+    relation = [DocumentRelation(
+        type="updates", bibitem=BibliographicItem(id="B",
+                                                  formattedref="ISO 1"))]
+    item = BibliographicItem(id="A", relation=relation)
+
+    # plain list is wrapped, relations are prefixed as items from XML
+    assert isinstance(item.relation, DocRelationCollection)
+    assert item.to_asciibib().splitlines()[3:] == [
+        "relation.type:: updates",
+        "relation.bibitem.id:: B",
+        "relation.bibitem.formattedref:: ISO 1"]
+
+
+@pytest.mark.parametrize("method", ["to_all_parts",
+                                    "to_most_recent_reference"])
+def test_derived_item_keeps_source(subject: BibliographicItem, method):
+    data = subject.to_dict()
+    relations = len(subject.relation)
+
+    item = getattr(subject, method)()
+
+    assert subject.to_dict() == data
+    assert len(subject.relation) == relations
+    assert subject._id_attribute
+    assert len(item.relation) == relations + 1
+    assert item.contributor is subject.contributor
+    assert item.relation[0] is subject.relation[0]
+
+
+def test_to_all_parts_title_lang(subject: BibliographicItem):
+    subject.title = TypedTitleString.from_string(
+        "Geographic information - Intro - Main - Part 1", lang=["en"])
+    subject.language = ["en"]
+
+    item = subject.to_all_parts()
+
+    assert [str(t) for t in item.title] == [
+        "Geographic information", "Intro", "Geographic information - Intro"]
+    assert len(subject.title) == 4
+    assert str(subject.title[3]) == \
+        "Geographic information - Intro - Main -- Part 1"
@@ -0,0 +1,106 @@
+import pytest
+
+from relaton_bib import BibliographicItem, BibliographicItemType, \
+    BibliographyIndex, DocumentIdentifier, EditorialGroup, ICS, \
+    RelationGraph, StructuredIdentifier, StructuredIdentifierCollection, \
+    TechnicalCommittee, WorkGroup
+
+
+def _item(id, docnumber, partnumber=None, ics="35.240", tc=211):
+    return BibliographicItem(
+        id=id,
+        type=BibliographicItemType.STANDARD.value,
+        docidentifier=[DocumentIdentifier(id=id.replace("-", " "),
+                                          type="ISO"),
+                       DocumentIdentifier(id=f"urn:{id}", type="URN")],
+        docnumber=docnumber,
+        structuredidentifier=StructuredIdentifierCollection([
+            StructuredIdentifier(docnumber=docnumber, agency=["ISO", "IEC"],
+                                 partnumber=partnumber),
+            StructuredIdentifier(docnumber=f"{docnumber}0", agency=["JIS"],
+                                 partnumber="9")]),
+        ics=[ICS(code=ics, text="Applications")],
+        editorialgroup=EditorialGroup([TechnicalCommittee(
+            WorkGroup(name="Geographic information", number=tc))]))
+
+
+@pytest.fixture
+def items():
+    return [_item("ISO-19115-1", "19115", "1"),
+            _item("ISO-19115-2", "19115", "2", ics="35.240.70"),
+            _item("ISO-639", "639", tc=37)]
+
+
+@pytest.fixture
+def index(items):
+    return BibliographyIndex(items)
+
+
+def test_mapping(index, items):
+    assert len(index) == 3
+    assert list(index) == ["ISO-19115-1", "ISO-19115-2", "ISO-639"]
+    assert "ISO-639" in index
+    assert index["ISO-639"] is items[2]
+    assert index.get("ISO-1") is None
+
+
+def test_by_docidentifier(index, items):
+    assert index.by_docidentifier("ISO 639") == [items[2]]
+    assert index.by_docidentifier("ISO 639", "ISO") == [items[2]]
+    assert index.by_docidentifier("ISO 639", "URN") == []
+    assert index.by_docidentifier("urn:ISO-639", "URN") == [items[2]]
+
+
+def test_by_docnumber(index, items):
+    assert index.by_docnumber("19115") == items[:2]
+    assert index.by_docnumber("1") == []
+
+
+def test_by_structuredidentifier(index, items):
+    assert index.by_structuredidentifier(docnumber="19115") == items[:2]
+    assert index.by_structuredidentifier(docnumber="19115",
+                                         partnumber="2") == [items[1]]
+    assert index.by_structuredidentifier(agency="IEC",
+                                         docnumber="639") == [items[2]]
+    # fields of different structured identifiers don't match together
+    assert index.by_structuredidentifier(docnumber="19115",
+                                         agency="JIS") == []
+    assert index.by_structuredidentifier() == []
+    with pytest.raises(TypeError):
+        index.by_structuredidentifier(number="1")
+
+
+def test_by_ics(index, items):
+    assert index.by_ics("35.240") == [items[0], items[2]]
+    assert index.by_ics("35.240.70") == [items[1]]
+
+
+def test_by_technical_committee(index, items):
+    assert index.by_technical_committee("Geographic information") == items
+    assert index.by_technical_committee("Geographic information",
+                                        211) == items[:2]
+    assert index.by_technical_committee("Terminology") == []
+
+
+def test_add_and_remove(index, items):
+    index.remove("ISO-19115-1")
+    assert index.by_docnumber("19115") == [items[1]]
+    assert index.by_ics("35.240") == [items[2]]
+    with pytest.raises(KeyError):
+        index.remove("ISO-19115-1")
+
+    index.add(items[0])
+    assert index.by_docnumber("19115") == [items[1], items[0]]
+
+
+def test_add_replaces(index, items):
+    item = _item("ISO-639", "639", ics="01.140")
+    index.add(item)
+    assert len(index) == 3
+    assert index["ISO-639"] is item
+    assert index.by_ics("35.240") == [items[0]]
+    assert index.by_ics("01.140") == [item]
+
+
+def test_relation_graph_index(index, items):
+    assert RelationGraph(index=index).resolve("ISO-639") is items[2]
@@ -1,6 +1,36 @@
+import glob
 import inspect
+import io
+import os
 
-from relaton_bib import from_bibtex, BibliographicItem
+import bibtexparser
+import pytest
+from bibtexparser.bparser import BibTexParser
+
+from relaton_bib import from_bibtex, from_dict, iter_from_bibtex, \
+    BibliographicItem, BibliographyStore, Organization, binary, write_store
+from relaton_bib.bibtex_parser import iter_bibtex_entries
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples")
+
+TRICKY = inspect.cleandoc(
+    '''\ufeff@string{foo = "F" # "oo"}
+    junk text @misc{x, a={b}}
+    @misc{a, title = Foo, note={{}}, n2 = {}, n3="", n4 = "a
+       b
+       c
+    ", m = may # " " # {1st}, Title = {dup}}
+    @Article(b, title = "with ) paren", x = {y})
+    @comment{ whatever @misc{c, a = {b}} }
+    @unknown{d, a = {1}}
+    @misc{e, title = {x} junk}
+    @misc{f, title = {ok},}
+    @preamble{"x"}
+    @misc{g,
+      abstract = {mail
+    @ here}, year = 2005}
+      @misc{h, a = "ü"}@misc{i, a = "{"}"}''')
 
 
 def test_parse_BibTex():
@@ -78,3 +108,105 @@ def test_parse_BibTex():
     # xml = items["mrx05"].to_xml
     # File.write(file, xml, encoding: "utf-8") unless File.exist? file
     # expect(xml).to be_equivalent_to File.read(file, encoding: "utf-8")
+
+
+@pytest.mark.parametrize("text", [TRICKY] + [
+    open(f, encoding="utf-8").read()
+    for f in sorted(glob.glob(os.path.join(EXAMPLES, "*.bib")))])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_entries_same_as_bibtexparser(text, chunk_size):
+    parser = BibTexParser(common_strings=True)
+    expected = bibtexparser.loads(text, parser).entries
+
+    assert list(iter_bibtex_entries(io.StringIO(text), True,
+                                    chunk_size)) == expected
+    assert list(iter_bibtex_entries(io.BytesIO(text.encode("utf-8")), True,
+                                    chunk_size)) == expected
+
+
+def test_entries_without_common_strings():
+    text = "@misc{a, month = may # {~1st}}"
+
+    assert list(iter_bibtex_entries(io.StringIO(text), False)) == [
+        {"month": "~1st", "ENTRYTYPE": "misc", "ID": "a"}]
+
+
+def test_iter_from_bibtex(tmp_path):
+    text = inspect.cleandoc(
+        """@book{a, author = {X, Mr.}, title = {A}, year = 2005}
+        @article{b, title = {B}, month = may, year = 2005}
+        @book{a, title = {A2}, pages = {1-2}}""")
+    file = tmp_path / "items.bib"
+    file.write_text(text, encoding="utf-8")
+
+    items = iter_from_bibtex(str(file))
+
+    assert not isinstance(items, (list, dict))
+    assert dict(items) == from_bibtex(text)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2])
+def test_from_bibtex_workers(workers):
+    text = inspect.cleandoc(
+        """@string{pub = {Publisher}}
+        @book{a, author = {X, Mr.}, title = {A}, publisher = pub}
+        @article{b, title = {B}, month = may, year = 2005,
+                 keywords = {Keyword, Key Word}}
+        @string{pub = {Other} # " " # pub}
+        @book{a, title = {A2}, publisher = pub, pages = {1-2}}
+        @book{c, title = {C}, publisher = pub}""")
+
+    items = from_bibtex(text, workers=workers, split_entries=1)
+
+    assert list(items.items()) == list(from_bibtex(text).items())
+    assert list(items) == ["a", "b", "c"]
+    assert items["a"].title.titles[0].title.content == "A2"
+    assert items["c"].contributor[0].entity.name[0].content == \
+        "Other Publisher"
+
+
+INCOLLECTION = inspect.cleandoc(
+    """@incollection{x,
+      author = {X, Mr.},
+      title = {Chapter},
+      booktitle = {Book title},
+      publisher = {Publisher},
+      year = 2005,
+      pages = {10-20},
+      urldate = {2019-12-11},
+      timestamp = {2019-12-05 13:52:43}
+    }""")
+
+
+@pytest.fixture(params=[INCOLLECTION] + [
+    open(f, encoding="utf-8").read()
+    for f in sorted(glob.glob(os.path.join(EXAMPLES, "*.bib")))])
+def bibtex_item(request):
+    item, = from_bibtex(request.param).values()
+    return item
+
+
+def test_bibtex_shapes():
+    item = from_bibtex(INCOLLECTION)["x"]
+
+    publisher, = (c.entity for c in item.contributor
+                  if c.role[0].type == "publisher")
+    assert isinstance(publisher, Organization)
+    assert item.relation[0].bibitem.title.titles[0].title.content == \
+        "Book title"
+    assert [d.on for d in item.date] == ["2005-01-01", "2019-12-11"]
+
+
+def test_bibtex_dict_round_trip(bibtex_item):
+    assert from_dict(bibtex_item.to_dict()) == bibtex_item
+
+
+def test_bibtex_binary_round_trip(bibtex_item):
+    assert binary.loads(binary.dumps(bibtex_item)) == bibtex_item
+
+
+def test_bibtex_store_round_trip(bibtex_item, tmp_path):
+    path = str(tmp_path / "items.rbst")
+    write_store([bibtex_item], path)
+    with BibliographyStore(path) as store:
+        assert store[bibtex_item.id] == bibtex_item
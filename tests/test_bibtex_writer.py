@@ -0,0 +1,85 @@
+import copy
+import io
+import os
+import xml.etree.ElementTree as ET
+
+import bibtexparser
+import pytest
+from bibtexparser.bibdatabase import BibDatabase
+
+from relaton_bib import from_xml, to_bibtex_many
+from relaton_bib.bibtex_writer import entry_to_bibtex, make_bibtex_writer
+
+
+def _items():
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    item = from_xml(ET.parse(file))
+    items = []
+    for i, type in enumerate(["misc", "techreport", "manual", "phdthesis"]):
+        item = copy.deepcopy(item)
+        item.type = type
+        item.id = f"Z{9 - i}"
+        items.append(item)
+    return items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_write_text(chunk_size):
+    items = _items()
+    out = io.StringIO()
+
+    assert to_bibtex_many(iter(items), out, chunk_size) == 4
+    # order of items is kept, not sorted by ID
+    assert out.getvalue() == "".join(i.to_bibtex() for i in items)
+
+
+def test_write_binary():
+    items = _items()
+    out = io.BytesIO()
+    to_bibtex_many(items, out)
+
+    assert out.getvalue() == \
+        "".join(i.to_bibtex() for i in items).encode("utf-8")
+
+
+def test_write_empty():
+    out = io.StringIO()
+
+    assert to_bibtex_many([], out) == 0
+    assert out.getvalue() == ""
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        to_bibtex_many([], io.StringIO(), 0)
+
+
+def _dumps(entry):
+    bibtex = BibDatabase()
+    bibtex.entries.append(entry)
+    return bibtexparser.dumps(bibtex, make_bibtex_writer())
+
+
+@pytest.mark.parametrize("item", _items(), ids=lambda i: i.type)
+def test_entry_same_as_writer(item):
+    entry = item.to_bibtex_entry()
+
+    assert entry_to_bibtex(entry) == _dumps(entry)
+
+
+def test_entry_fields_order():
+    entry = {"ENTRYTYPE": "misc", "ID": "X", "zzz": "1", "aaa": "2",
+             "month_numeric": "3", "tile": "4", "author": "5"}
+
+    assert entry_to_bibtex(entry) == _dumps(entry)
+    assert entry_to_bibtex(entry) == ("@misc{X,\n  tile = {4},\n"
+                                      "  author = {5},\n"
+                                      "  month_numeric = {3},\n"
+                                      "  aaa = {2},\n  zzz = {1}\n}\n\n")
+
+
+def test_entry_not_string_value():
+    with pytest.raises(TypeError):
+        entry_to_bibtex({"ENTRYTYPE": "misc", "ID": "X", "year": 2014})
@@ -0,0 +1,76 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import binary, from_xml
+
+
+@pytest.fixture
+def item():
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    return from_xml(ET.parse(file))
+
+
+def test_round_trip(item):
+    data = binary.dumps(item)
+
+    assert data.startswith(binary.MAGIC + bytes([binary.VERSION]))
+    assert binary.loads(data) == item
+    assert binary.loads(memoryview(data)) == item
+    assert len(data) < len(item.to_json().encode("utf-8"))
+
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, 63, -64, 2 ** 70, -2 ** 40, 1.5, "", "ü",
+    ["a", "a", "a"], {"content": "text/plain", "x": {"x": []}},
+])
+def test_values(value):
+    assert binary.decode(binary.encode(value)) == value
+
+
+def test_strings_interned():
+    data = binary.encode(["Rare string"] * 10)
+
+    assert data.count(b"Rare string") == 1
+
+
+def test_static_strings_not_written(item):
+    assert b"text/plain" not in binary.dumps(item)
+
+
+def test_unknown_keys_ignored(item):
+    hash = item.to_dict()
+    hash["added_in_next_version"] = {"value": 1}
+
+    assert binary.loads(binary.encode(hash)) == item
+
+
+@pytest.mark.parametrize("data,error", [
+    (b"", "not a relaton-bib binary data"),
+    (b"<bibitem/>", "not a relaton-bib binary data"),
+    (binary.MAGIC + b"\xff\x00", "unsupported binary format version"),
+    (binary.MAGIC + b"\x01\x02", "truncated binary data"),
+    (binary.MAGIC + b"\x01\x02" + bytes(8) + b"\x09\x00",
+     "truncated binary data"),
+    (binary.MAGIC + b"\x01\x02" + bytes(8) + b"\x03\x00\x03\x00",
+     "trailing data after value"),
+])
+def test_invalid_data(data, error):
+    with pytest.raises(ValueError) as excinfo:
+        binary.decode(data)
+    assert error in str(excinfo.value)
+
+
+def test_wide_tokens():
+    data = binary.encode([str(i) for i in range(10000)])
+
+    assert data[len(binary.MAGIC) + 1] == 4
+    assert binary.decode(data) == [str(i) for i in range(10000)]
+
+
+def test_unsupported_type():
+    with pytest.raises(TypeError):
+        binary.encode({"fetched": object()})
@@ -0,0 +1,133 @@
+import copy
+import os
+import threading
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import BibliographicItem, DerivedCache, DocumentIdentifier, \
+    from_xml
+
+
+@pytest.fixture
+def cache():
+    BibliographicItem.derived_cache = DerivedCache(maxsize=4)
+    yield BibliographicItem.derived_cache
+    BibliographicItem.derived_cache = None
+
+
+@pytest.fixture
+def item() -> BibliographicItem:
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bibdata_item.xml")
+    return from_xml(ET.parse(file))
+
+
+def test_disabled_by_default(item):
+    assert BibliographicItem.derived_cache is None
+    assert item.to_all_parts() is not item.to_all_parts()
+
+
+def test_cached_views(cache, item):
+    parts = item.to_all_parts()
+    recent = item.to_most_recent_reference()
+
+    assert item.to_all_parts() is parts
+    assert item.to_most_recent_reference() is recent
+    assert cache.cache_info() == (2, 2, 4, 2)
+
+
+def test_cached_view_equals_uncached(cache, item):
+    parts = item.to_all_parts()
+    BibliographicItem.derived_cache = None
+
+    assert parts == item.to_all_parts()
+
+
+def test_invalidate_on_identifier_change(cache, item):
+    parts = item.to_all_parts()
+    item.docidentifier[0].id = "ISO 1234-1:2020"
+
+    assert item.to_all_parts() is not parts
+    assert item.to_all_parts().docidentifier[0].id == "ISO 1234 (all parts)"
+
+    parts = item.to_all_parts()
+    item.docidentifier = [DocumentIdentifier("ISO 1", "ISO")]
+    assert item.to_all_parts() is not parts
+
+
+def test_invalidate_on_relation_change(cache, item):
+    parts = item.to_all_parts()
+    item.relation.append(item.relation[0])
+
+    assert item.to_all_parts() is not parts
+
+
+def test_views_of_different_items(cache, item):
+    other = copy.deepcopy(item)
+
+    assert item.to_all_parts() is not other.to_all_parts()
+    assert item.to_all_parts() == other.to_all_parts()
+
+
+def test_lru_eviction(cache, item):
+    items = [copy.deepcopy(item) for _ in range(4)]
+    parts = item.to_all_parts()
+    for i in items:
+        i.to_all_parts()
+    assert cache.cache_info().currsize == 4
+    assert item.to_all_parts() is not parts
+
+    parts = item.to_all_parts()
+    items[-1].to_all_parts()
+    assert item.to_all_parts() is parts
+
+
+def test_unhashable_view(cache):
+    assert cache.get(1, ["view"], None, lambda: "value") == "value"
+    assert cache.cache_info().currsize == 0
+
+
+def test_cache_clear(cache, item):
+    item.to_all_parts()
+    item.to_all_parts()
+    cache.cache_clear()
+
+    assert cache.cache_info() == (0, 0, 4, 0)
+
+
+def test_threads(cache, item):
+    results = []
+
+    def work():
+        for _ in range(50):
+            results.append(item.to_most_recent_reference())
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = cache.cache_info()
+    assert info.hits + info.misses == 200
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.parametrize("name,value", [
+    ("docnumber", "7890"),
+    ("edition", "5"),
+    ("date", []),
+    ("abstract", []),
+])
+def test_invalidate_on_field_change(cache, item, name, value):
+    parts = item.to_all_parts()
+    recent = item.to_most_recent_reference()
+    setattr(item, name, value)
+
+    assert item.to_all_parts() is not parts
+    assert item.to_most_recent_reference() is not recent
+    assert getattr(item.to_all_parts(), name) == (
+        [] if name == "abstract" else value)
+    assert item.to_all_parts() is item.to_all_parts()
@@ -1,8 +1,11 @@
 import os
 import json
+import xml.etree.ElementTree as ET
+
+import pytest
 import yaml
 
-from relaton_bib import from_dict
+from relaton_bib import from_dict, from_json, from_xml
 
 
 def test_create_bibitem_from_dict():
@@ -33,3 +36,64 @@ def test_create_bibitem_from_dict_yaml():
         assert item is not None
         assert item.id == "ISOTC211"
         assert item.structuredidentifier is not None
+
+
+@pytest.mark.parametrize("name", ["bib_item.xml", "bibdata_item.xml",
+                                  "from_bibtex.xml"])
+def test_round_trip_xml_item(name):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        name)
+    item = from_xml(ET.parse(file))
+
+    assert from_dict(item.to_dict()) == item
+    assert from_dict(json.loads(json.dumps(item.to_dict()))) == item
+
+
+@pytest.mark.parametrize("name", ["bib_item.yml", "hash.yml"])
+def test_round_trip_dict_item(name):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        name)
+
+    with open(file) as yaml_file:
+        item = from_dict(yaml.safe_load(yaml_file))
+
+    assert from_dict(item.to_dict()) == item
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(mocker, use_orjson):
+    if not use_orjson:
+        mocker.patch("relaton_bib.relaton_bib.orjson", None)
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    item = from_xml(ET.parse(file))
+    data = item.to_json()
+
+    assert json.loads(data) == item.to_dict()
+    assert from_json(data) == item
+    assert from_json(data.encode("utf-8")) == item
+
+
+@pytest.mark.parametrize("name", ["bib_item.xml", "bibdata_item.xml",
+                                  "from_bibtex.xml"])
+def test_trusted_round_trip(name):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        name)
+    item = from_xml(ET.parse(file))
+
+    assert from_dict(item.to_dict(), trusted=True) == item
+    assert from_json(item.to_json(), trusted=True) == item
+
+
+def test_trusted_skips_validation():
+    item = {"id": "x", "link": {"content": "not uri"}}
+    with pytest.raises(ValueError):
+        from_dict(item)
+
+    assert from_dict(item, trusted=True).link[0].content == "not uri"
+    with pytest.raises(ValueError):
+        from_dict(item)
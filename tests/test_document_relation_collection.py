@@ -55,3 +55,8 @@ def test_hash(subject):
 
     assert result["array"][0]["type"] == DocumentRelation.Type.replace
     assert result["array"][1]["type"] == DocumentRelation.Type.obsoletes
+
+
+def test_to_dict(subject):
+    assert subject.to_dict() == [r.to_dict() for r in subject]
+    assert subject.to_dict()[1]["type"] == DocumentRelation.Type.obsoletes
@@ -1,3 +1,6 @@
+import io
+import xml.etree.ElementTree as ET
+
 import pytest
 
 from relaton_bib import Hit, HitCollection
@@ -47,6 +50,13 @@ def test_collection_to_xml(subject, mocker, hit, bibitem):
     assert result.tag == "documents"
 
 
+def test_collection_to_dict(subject, hit, bibitem):
+    bibitem.to_dict = lambda: {"id": "ref"}
+
+    assert subject.to_dict() == [{"id": "ref"}]
+    hit.fetch.assert_called_once()
+
+
 @pytest.mark.skip("skippend because there is different appoach for iteration")
 def test_select_hits(subject):
     assert isinstance(filter(subject), HitCollection)
@@ -57,3 +67,12 @@ def test_reduce_collection():
     import functools
     functools.reduce(lambda sum, hit: sum.append(hit), subject)
     isinstance(subject, HitCollection)
+
+
+def test_collection_write_xml(subject, hit, bibitem):
+    bibitem.to_xml.return_value = ET.Element("bibitem")
+    out = io.StringIO()
+
+    assert subject.write_xml(out) == 1
+    hit.fetch.assert_called_once()
+    assert out.getvalue() == "<documents><bibitem /></documents>"
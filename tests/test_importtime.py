@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+import relaton_bib
+
+HEAVY = {"bibtexparser", "pyparsing", "iso639", "dateutil",
+         "xml.sax.saxutils", "urllib.request"}
+
+
+def _imported(code):
+    """Modules imported by code in a fresh interpreter, from -X importtime"""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True,
+                            cwd=relaton_bib.__path__[0] + "/..").stderr
+    return {line.split("|")[-1].strip() for line in stderr.splitlines()
+            if line.startswith("import time:")}
+
+
+def test_import_package():
+    modules = _imported("import relaton_bib")
+
+    assert "relaton_bib" in modules
+    assert not {m for m in modules if m.startswith("relaton_bib.")}
+    assert not modules & HEAVY
+
+
+@pytest.mark.parametrize("name", ["from_xml", "from_dict", "BibliographyStore",
+                                  "to_bibtex_many", "iter_from_bibtex"])
+def test_import_without_heavy_dependencies(name):
+    modules = _imported(f"from relaton_bib import {name}")
+
+    assert not modules & HEAVY
+
+
+def test_import_every_attribute_first():
+    code = f"""
+import importlib, sys
+for name in {relaton_bib.__all__!r}:
+    for module in [m for m in sys.modules if m.startswith("relaton_bib")]:
+        del sys.modules[module]
+    getattr(importlib.import_module("relaton_bib"), name)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=relaton_bib.__path__[0] + "/..")
+
+
+def test_lazy_attributes():
+    for name in relaton_bib.__all__:
+        assert getattr(relaton_bib, name).__name__ == name
+    assert set(relaton_bib.__all__) <= set(dir(relaton_bib))
+    with pytest.raises(AttributeError):
+        relaton_bib.no_such_name
+
+
+@pytest.mark.parametrize("name", ["relaton_bib", "xml_backend", "interning"])
+def test_submodule_attribute(name):
+    code = f"""
+import relaton_bib, sys
+module = getattr(relaton_bib, {name!r})
+assert module is sys.modules["relaton_bib.{name}"], module
+assert relaton_bib.{name} is module
+"""
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=relaton_bib.__path__[0] + "/..")
@@ -0,0 +1,77 @@
+import os
+import pickle
+import xml.etree.ElementTree as ET
+
+from relaton_bib import FormattedString, LocalizedString, from_dict, \
+    from_xml
+from relaton_bib.interning import intern_codes, intern_str
+from relaton_bib.relaton_bib import pack_dataclass, unpack_dataclass
+
+
+def _example():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+
+
+def test_intern_str():
+    value = "".join(["text/", "plain"])
+
+    assert intern_str(value) is intern_str("text/plain")
+    assert intern_str(None) is None
+
+
+def test_intern_codes():
+    assert intern_codes(None) == []
+    assert intern_codes("en") == ["en"]
+    codes = intern_codes(["en", "".join(["f", "r"])])
+    assert codes == ["en", "fr"]
+    assert codes[1] is intern_str("fr")
+    assert codes is not intern_codes(["en", "fr"])
+
+
+def test_localized_string():
+    a = LocalizedString("a", language="en", script=["Latn"])
+    b = FormattedString(content="b", language=["en"], script="Latn",
+                        format="".join(["text/", "html"]))
+
+    assert a.language == ["en"]
+    assert a.language[0] is b.language[0]
+    assert a.script[0] is b.script[0]
+    assert b.format is intern_str("text/html")
+
+
+def test_parsed_items_share_values():
+    a = from_xml(ET.parse(_example()))
+    b = from_dict(a.to_dict())
+
+    assert b == a
+    assert b.abstract[0].language[0] is a.abstract[0].language[0]
+    assert b.date[0].type is a.date[0].type
+    assert b.docidentifier[0].type is a.docidentifier[0].type
+    assert b.contributor[0].role[0].type is a.contributor[0].role[0].type
+
+
+def _codes(item):
+    return [item.abstract[0].language[0], item.abstract[0].script[0],
+            item.language[0], item.abstract[0].format,
+            item.date[0].type, item.docidentifier[0].type,
+            item.contributor[0].role[0].type]
+
+
+def test_trusted_items_share_values():
+    a = from_xml(ET.parse(_example()))
+    for b in [from_xml(ET.parse(_example()), trusted=True),
+              from_dict(a.to_dict(), trusted=True)]:
+        assert b == a
+        assert all(x is y for x, y in zip(_codes(b), _codes(a)))
+
+
+def test_unpacked_items_share_values():
+    a = from_xml(ET.parse(_example()))
+    packed = pickle.loads(pickle.dumps(pack_dataclass(a)))
+    b = unpack_dataclass(packed)
+
+    assert b == a
+    assert isinstance(b.abstract[0].language, list)
+    assert all(x is y for x, y in zip(_codes(b), _codes(a)))
@@ -0,0 +1,42 @@
+import sys
+
+import pytest
+
+from relaton_bib import from_bibtex
+from relaton_bib.languages import language_code
+
+
+@pytest.mark.parametrize("value,code", [
+    ("english", "en"),
+    ("English", "en"),
+    (" FRENCH ", "fr"),
+    ("Ancient Greek (to 1453)", "grc"),
+    ("en", "en"),
+    ("eng", "en"),
+    ("ger", "de"),
+    ("deu", "de"),
+    ("Klingon", "tlh"),
+    ("no such language", None),
+    ("", None),
+])
+def test_language_code(value, code):
+    assert language_code(value) == code
+
+
+def test_bibtex_language(caplog):
+    items = from_bibtex("@misc{a, language = {russian}}\n"
+                        "@misc{b, language = {elvish}}")
+
+    assert items["a"].language == ["ru"]
+    assert items["b"].language == []
+    assert "unknown language: elvish" in caplog.text
+
+
+def test_iso639_imported_on_first_lookup():
+    import subprocess
+
+    code = ("import sys, relaton_bib.languages as l;"
+            "assert 'iso639' not in sys.modules;"
+            "assert l.language_code('english') == 'en';"
+            "assert 'iso639' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,80 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import BibliographicItem, LazyBibliographicItem, from_xml
+
+
+def _tree(name):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        name)
+    return ET.parse(file)
+
+
+@pytest.fixture
+def item():
+    return from_xml(_tree("bib_item.xml"), lazy=True)
+
+
+@pytest.mark.parametrize("name", ["bib_item.xml", "bibdata_item.xml",
+                                  "bibdata_item_fr.xml",
+                                  "bib_item_strict.xml", "from_bibtex.xml"])
+def test_equals_eager_item(name):
+    item = from_xml(_tree(name), lazy=True)
+
+    assert isinstance(item, LazyBibliographicItem)
+    assert isinstance(item, BibliographicItem)
+    assert item == from_xml(_tree(name))
+    assert from_xml(_tree(name)) == item
+    assert item.loaded()
+
+
+def test_builds_field_on_first_access(item):
+    assert not item.__dict__.keys() & {"title", "contributor", "relation"}
+
+    title = item.title
+
+    assert item.title is title
+    assert "title" in item.__dict__
+    assert "contributor" not in item.__dict__
+    assert not item.loaded()
+
+
+def test_assign_field(item):
+    item.edition = "2"
+
+    assert item.edition == "2"
+    assert item.to_dict()["edition"] == "2"
+
+
+def test_render(item):
+    reference = from_xml(_tree("bib_item.xml"))
+
+    assert ET.tostring(item.to_xml()) == ET.tostring(reference.to_xml())
+    assert item.to_dict() == reference.to_dict()
+
+
+def test_copy():
+    item = from_xml(_tree("bibdata_item.xml"), lazy=True)
+    parts = item.to_all_parts()
+
+    assert parts.all_parts
+    assert parts == from_xml(_tree("bibdata_item.xml")).to_all_parts()
+    assert copy.deepcopy(item) == item
+
+
+def test_fields_of_interleaved_items_in_threads():
+    names = ["bib_item.xml", "bibdata_item.xml", "bibdata_item_fr.xml"]
+    items = [from_xml(_tree(n), lazy=True) for n in names * 4]
+
+    def read(item):
+        return item.id, item.title, item.docidentifier, item.date
+
+    with ThreadPoolExecutor(4) as pool:
+        fields = list(pool.map(read, items))
+
+    assert fields == [read(from_xml(_tree(n))) for n in names * 4]
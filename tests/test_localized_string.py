@@ -31,3 +31,13 @@ def test_xml_ampersand_escaped():
     xmlstr = ET.tostring(result, encoding='unicode', method='xml')
 
     assert "content &amp;amp; character to escape" in xmlstr
+
+
+def test_to_dict():
+    assert LocalizedString("content").to_dict() == "content"
+    assert LocalizedString("content", "en", ["Latn", "Cyrl"]).to_dict() \
+        == {"content": "content", "language": "en",
+            "script": ["Latn", "Cyrl"]}
+    assert LocalizedString([{"content": "A", "language": "en"},
+                            "B"]).to_dict() \
+        == [{"content": "A", "language": "en"}, "B"]
@@ -0,0 +1,130 @@
+import pytest
+
+from relaton_bib import BibliographicItem, BibliographicItemType, \
+    DocumentRelation, RelationGraph
+
+
+def _item(id, **relations):
+    return BibliographicItem(
+        id=id,
+        type=BibliographicItemType.STANDARD.value,
+        relation=[DocumentRelation(type=type, bibitem=_item(target))
+                  for type, targets in relations.items()
+                  for target in targets])
+
+
+@pytest.fixture
+def graph():
+    return RelationGraph([
+        _item("A", obsoletes=["B", "C"], partOf=["P"]),
+        _item("B", obsoletes=["D"]),
+        _item("P", partOf=["Q"]),
+    ])
+
+
+def test_related(graph):
+    assert graph.related("A", "obsoletes") == ["B", "C"]
+    assert graph.related("A") == ["B", "C", "P"]
+    assert graph.related("A", "obsoletes", "partOf") == ["B", "C", "P"]
+    assert graph.related("A", "updates") == []
+    assert graph.related("X") == []
+
+
+def test_inverse(graph):
+    assert graph.related("C", "obsoletedBy") == ["A"]
+    assert graph.related("P", "hasPart") == ["A"]
+    assert graph.related("C", "obsoletes") == []
+
+
+def test_closure(graph):
+    assert graph.closure("A", "obsoletes") == ["B", "C", "D"]
+    assert graph.closure("D", "obsoletedBy") == ["B", "A"]
+    assert graph.closure("A", "partOf") == ["P", "Q"]
+    assert graph.closure("Q", "hasPart") == ["P", "A"]
+
+
+def test_closure_with_cycle():
+    graph = RelationGraph([_item("A", updates=["B"]),
+                           _item("B", updates=["C"]),
+                           _item("C", updates=["A"])])
+    assert graph.closure("A", "updates") == ["B", "C"]
+    assert graph.find_cycle("updates") == ["A", "B", "C", "A"]
+    assert graph.find_cycle() == ["A", "B", "C", "A"]
+    assert graph.find_cycle("obsoletes") is None
+
+
+def test_no_cycle(graph):
+    assert graph.find_cycle() is None
+
+
+@pytest.mark.parametrize("id", [None, ""])
+def test_add_without_id(graph, id):
+    with pytest.raises(ValueError, match="without id"):
+        graph.add(_item(id, obsoletes=["B"]))
+    assert len(graph) == 3
+    assert graph.related("B", "obsoletedBy") == ["A"]
+
+
+def test_self_cycle():
+    graph = RelationGraph([_item("A", related=["A"])])
+    assert graph.find_cycle() == ["A", "A"]
+
+
+def test_add_and_remove(graph):
+    assert len(graph) == 3
+    assert "A" in graph
+    assert list(graph) == ["A", "B", "P"]
+
+    graph.remove("A")
+    assert "A" not in graph
+    assert graph.related("C") == []
+    assert graph.related("B", "obsoletedBy") == []
+    assert graph.related("B", "obsoletes") == ["D"]
+    with pytest.raises(KeyError):
+        graph.remove("A")
+
+    graph.add(_item("A", obsoletes=["B"]))
+    assert graph.closure("A", "obsoletes") == ["B", "D"]
+
+
+def test_add_replaces(graph):
+    graph.add(_item("A", updates=["B"]))
+    assert len(graph) == 3
+    assert graph.related("A") == ["B"]
+    assert graph.related("B", "obsoletedBy") == []
+    assert graph.related("B", "updatedBy") == ["A"]
+
+
+def test_relation_stated_twice():
+    graph = RelationGraph([_item("A", obsoletes=["B"]),
+                           _item("B", obsoletedBy=["A"])])
+    assert graph.related("A") == ["B"]
+    graph.remove("B")
+    assert graph.related("A") == ["B"]
+    assert graph.related("B", "obsoletedBy") == ["A"]
+
+
+def test_resolve():
+    a = _item("A")
+    graph = RelationGraph([_item("X", obsoletes=["A", "B"])],
+                          index={"A": a})
+    assert graph.resolve("X").id == "X"
+    assert graph.resolve("A") is a
+    assert graph.resolve("B").id == "B"
+    assert graph.resolve("C") is None
+
+
+def test_resolve_embedded_after_changes():
+    old = _item("X", obsoletes=["A"])
+    graph = RelationGraph([old, _item("Y", updates=["A"])])
+    assert graph.resolve("A") is graph._items["Y"].relation[0].bibitem
+
+    new = _item("X", obsoletes=["A"])
+    graph.add(new)
+    assert graph.resolve("A") is new.relation[0].bibitem
+
+    graph.remove("X")
+    assert graph.resolve("A") is graph._items["Y"].relation[0].bibitem
+    graph.remove("Y")
+    assert graph.resolve("A") is None
+    assert graph._embedded == {}
@@ -0,0 +1,159 @@
+import copy
+import datetime
+import dataclasses
+import os
+import pickle
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import FormattedString, LocalizedString, from_xml
+from relaton_bib.relaton_bib import construct, is_trusted, parse_date, \
+    slotted, trusted_input
+
+
+def _item(lazy=False):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bibdata_item.xml")
+    return from_xml(ET.parse(file), lazy=lazy)
+
+
+def _dataclasses(obj, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    if dataclasses.is_dataclass(obj):
+        yield obj
+        children = [getattr(obj, f.name) for f in dataclasses.fields(obj)]
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    elif hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes)):
+        children = list(obj)
+    else:
+        return
+    for child in children:
+        yield from _dataclasses(child, seen)
+
+
+def test_model_without_dict():
+    objects = list(_dataclasses(_item()))
+
+    assert len(objects) > 50
+    assert not [o for o in objects if hasattr(o, "__dict__")]
+
+
+@pytest.mark.parametrize("clone", [
+    copy.copy, copy.deepcopy, lambda i: pickle.loads(pickle.dumps(i))])
+def test_clone(clone):
+    item = _item()
+
+    assert clone(item) == item
+
+
+def test_clone_lazy():
+    item = _item(lazy=True)
+    item.title
+
+    clone = pickle.loads(pickle.dumps(item))
+
+    assert "title" in clone.__dict__
+    assert "contributor" not in clone.__dict__
+    assert clone == _item()
+
+
+def test_frozen():
+    ls = FormattedString(content="text", language="en")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ls.content = "other"
+    assert copy.deepcopy(ls) == ls
+    assert ls.to_dict()["format"] == "text/plain"
+
+
+def test_slotted():
+    @slotted
+    @dataclasses.dataclass
+    class Base:
+        name: str
+        hidden: bool = dataclasses.field(default=True, init=False)
+
+        def title(self):
+            return self.name.title()
+
+    @slotted
+    @dataclasses.dataclass
+    class Child(Base):
+        number: int = 1
+
+        def title(self):
+            return f"{super().title()} {self.number}"
+
+    child = Child("child", 2)
+
+    assert Child.__slots__ == ("number",)
+    assert not hasattr(child, "__dict__")
+    assert child.hidden
+    assert child.title() == "Child 2"
+    assert isinstance(LocalizedString("a"), LocalizedString)
+
+
+@pytest.mark.parametrize("date,result", [
+    ("February 2012", "2012-02"),
+    ("February 11, 2012", "2012-02-11"),
+    ("2012-02-11", "2012-02-11"),
+    ("2012-02-11T10:00:00", "2012-02-11"),
+    ("2012-02", "2012-02"),
+    ("2012-02-1", "2012-02"),
+    ("2012", "2012"),
+    ("20120211", "2012"),
+    (datetime.date(2012, 2, 11), "2012-02-11"),
+    ("unknown", None),
+])
+def test_parse_date(date, result):
+    assert parse_date(date) == result
+
+
+def test_parse_date_not_str():
+    assert parse_date("February 2012", False) == \
+        datetime.datetime(2012, 2, 1)
+    assert parse_date("2012-02-11", False) == "2012-02-11"
+
+
+@pytest.mark.parametrize("date", ["2012-13-01", "2012-02-30", "Feb 2012"])
+def test_parse_invalid_date(date):
+    with pytest.raises(ValueError):
+        parse_date(date)
+
+
+def test_construct():
+    fs = construct(FormattedString, content="text")
+
+    assert fs == FormattedString("text", format="text/plain")
+    with pytest.raises(TypeError):
+        construct(FormattedString, language=("en",))
+    with pytest.raises(TypeError):
+        construct(FormattedString, content="text", unknown=1)
+
+
+def test_construct_skips_post_init():
+    ls = construct(LocalizedString, content=1, language=["en"])
+
+    assert ls.content == 1
+    assert ls.language == ["en"]
+
+
+def test_trusted_input():
+    assert not is_trusted()
+    with trusted_input(False):
+        assert not is_trusted()
+    with trusted_input():
+        assert is_trusted()
+        LocalizedString([1])
+        with trusted_input():
+            assert is_trusted()
+        assert is_trusted()
+    assert not is_trusted()
+    with pytest.raises(ValueError):
+        LocalizedString([1])
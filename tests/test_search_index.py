@@ -0,0 +1,188 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import BibliographicItem, BibliographicItemType, \
+    FormattedString, LocalizedString, SearchIndex, TypedTitleString, \
+    TypedTitleStringCollection, from_xml
+from relaton_bib import search_index
+from relaton_bib.search_index import tokenize, tokenize_cjk
+
+
+def _item(id, title, abstract=None, keyword=(), lang="en"):
+    return BibliographicItem(
+        id=id,
+        type=BibliographicItemType.STANDARD.value,
+        title=TypedTitleStringCollection([
+            TypedTitleString(type="main", content=title, language=[lang])]),
+        abstract=[FormattedString(content=abstract, language=[lang])]
+        if abstract else [],
+        keyword=[LocalizedString(content=k) for k in keyword])
+
+
+@pytest.fixture
+def items():
+    return [
+        _item("A", "Geographic information — Metadata",
+              "Schema for describing geographic information and services.",
+              ["metadata"]),
+        _item("B", "Information géographique — Métadonnées",
+              "Schéma pour décrire l'information géographique.", lang="fr"),
+        _item("C", "Information technology — Metadata registries",
+              "Metadata of information technology. Geographic data isn't "
+              "covered."),
+        _item("D", "地理情報 — メタデータ", "地理情報のメタデータ", lang="ja"),
+    ]
+
+
+@pytest.fixture
+def index(items):
+    return SearchIndex(items)
+
+
+def _ids(results):
+    return [id for id, _ in results]
+
+
+def test_tokenize():
+    assert tokenize("Métadonnées — ISO 19115-1:2014") == \
+        ["metadonnees", "iso", "19115", "1", "2014"]
+    assert tokenize("ISO地理情報") == ["iso", "地", "理", "情", "報"]
+    assert tokenize("データ") == ["テ", "ー", "タ"]
+    assert tokenize_cjk("データ") == ["デ", "ー", "タ"]
+
+
+def test_words(index):
+    assert set(_ids(index.search("metadata"))) == {"A", "C"}
+    assert _ids(index.search("geographic metadata")) == ["A", "C"]
+    assert index.search("geographic cartography") == []
+    assert index.search("") == []
+
+
+def test_ranking(index):
+    results = index.search("metadata")
+    assert results[0][1] >= results[1][1] > 0
+    # weights of fields
+    assert _ids(index.search("technology")) == ["C"]
+    assert index.search("metadata", fields=["keyword"])[0][0] == "A"
+
+
+def test_phrase(index):
+    assert _ids(index.search('"geographic information"')) == ["A"]
+    assert _ids(index.search('"information geographic"')) == []
+    assert _ids(index.search('"information technology"')) == ["C"]
+
+
+def test_prefix(index):
+    assert set(_ids(index.search("meta*"))) == {"A", "B", "C"}
+    assert _ids(index.search("regist*")) == ["C"]
+    assert _ids(index.search('"geographic inf*"')) == ["A"]
+    assert index.search("zzz*") == []
+
+
+def test_lang(index):
+    assert _ids(index.search("geographique", lang="fr")) == ["B"]
+    assert _ids(index.search("géographique", lang="en")) == []
+    assert _ids(index.search("geographic", lang="en")) == ["A", "C"]
+    assert _ids(index.search("地理", lang="ja")) == ["D"]
+    assert _ids(index.search('"メタデータ"')) == ["D"]
+    assert index.search("metadata", lang="de") == []
+
+
+def test_fields(index):
+    assert _ids(index.search("services", fields=["title"])) == []
+    assert _ids(index.search("services", fields=["abstract"])) == ["A"]
+
+
+def test_limit(index):
+    assert index.search("information", limit=2) == \
+        index.search("information")[:2]
+
+
+def test_formatted(index):
+    index.add(BibliographicItem(
+        id="E", type=BibliographicItemType.STANDARD.value,
+        abstract=[FormattedString(content="<p>Cartography &amp; maps</p>",
+                                  format="text/html")]))
+    assert _ids(index.search("cartography maps")) == ["E"]
+    assert index.search("p") == []
+
+
+def test_add_and_remove(index, items):
+    assert len(index) == 4
+    assert "A" in index
+    assert list(index) == ["A", "B", "C", "D"]
+
+    index.remove("A")
+    assert _ids(index.search("metadata")) == ["C"]
+    assert list(index) == ["B", "C", "D"]
+    with pytest.raises(KeyError):
+        index.remove("A")
+
+    index.add(_item("C", "Cartography"))
+    assert index.search("metadata") == []
+    assert _ids(index.search("cartography")) == ["C"]
+    assert list(index) == ["B", "D", "C"]
+
+    index.add(items[0])
+    assert _ids(index.search("metadata")) == ["A"]
+
+
+def test_compact(index):
+    index.remove("B")
+    results = index.search("information")
+    index.compact()
+    assert index.search("information") == results
+    assert list(index) == ["A", "C", "D"]
+
+
+def test_compacted_on_remove():
+    index = SearchIndex(_item(f"I{i}", f"title {i}") for i in range(3000))
+    for i in range(2500):
+        index.remove(f"I{i}")
+    assert len(index._text_doc) < 1000
+    assert _ids(index.search("title 2800")) == ["I2800"]
+    assert _ids(index.search("title 1500")) == []
+
+
+def test_dumps_and_loads(index):
+    index.remove("C")
+    loaded = SearchIndex.loads(index.dumps())
+    assert list(loaded) == list(index)
+    for query in ["metadata", '"geographic information"', "meta*", "地理"]:
+        assert loaded.search(query) == index.search(query)
+    assert _ids(loaded.search("geographique", lang="fr")) == ["B"]
+
+    loaded.add(_item("E", "Metadata"))
+    assert set(_ids(loaded.search("metadata"))) == {"A", "E"}
+
+
+def test_save_and_load(index, tmp_path):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    index.add(from_xml(ET.parse(file)))
+    path = str(tmp_path / "index.rbsi")
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    assert loaded.search("geographic") == index.search("geographic")
+
+
+@pytest.mark.parametrize("data,error", [
+    (b"", "not a relaton-bib search index"),
+    (search_index.MAGIC + b"\xff", "unsupported search index version"),
+    (search_index.MAGIC + b"\x01\x10", "truncated search index"),
+])
+def test_invalid_data(data, error):
+    with pytest.raises(ValueError) as excinfo:
+        SearchIndex.loads(data)
+    assert error in str(excinfo.value)
+
+
+def test_tokenizers(monkeypatch, items):
+    monkeypatch.setitem(search_index.TOKENIZERS, "en",
+                        lambda text: text.split())
+    index = SearchIndex(items)
+    assert set(_ids(index.search("Metadata", lang="en"))) == {"A", "C"}
+    assert index.search("metadata", lang="en") == []
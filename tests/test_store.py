@@ -0,0 +1,76 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import BibliographyStore, DocumentIdentifier, from_xml, \
+    write_store
+
+
+def _item(id):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+    item = from_xml(ET.parse(file))
+    item.id = id
+    item.docidentifier = [DocumentIdentifier(id=f"DOC {id}", type="ISO")]
+    return item
+
+
+@pytest.fixture
+def items():
+    return [_item(f"ID{i}") for i in range(5)]
+
+
+@pytest.fixture
+def store(tmp_path, items):
+    path = str(tmp_path / "items.rbst")
+    assert write_store(iter(items), path) == 5
+    with BibliographyStore(path) as store:
+        yield store
+
+
+def test_lookup(store, items):
+    assert store["ID3"] == items[3]
+    assert store["DOC ID0"] == items[0]
+    assert "ID4" in store
+    assert "ID5" not in store
+    assert store.get("ID5") is None
+    with pytest.raises(KeyError):
+        store["ID5"]
+
+
+def test_keys_and_records(store, items):
+    assert len(store) == 10
+    assert list(store) == sorted([i.id for i in items] +
+                                 [f"DOC {i.id}" for i in items])
+    assert list(store.records()) == items
+
+
+def test_later_key_wins(tmp_path):
+    first, second = _item("ID"), _item("ID")
+    second.edition = "2"
+    path = str(tmp_path / "items.rbst")
+    write_store([first, second], path)
+
+    with BibliographyStore(path) as store:
+        assert store.record_count == 2
+        assert store["ID"].edition == "2"
+
+
+def test_empty(tmp_path):
+    path = str(tmp_path / "items.rbst")
+    assert write_store([], path) == 0
+
+    with BibliographyStore(path) as store:
+        assert len(store) == 0
+        assert "ID" not in store
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "items.rbst"
+    path.write_bytes(b"<documents/>" * 10)
+
+    with pytest.raises(ValueError) as excinfo:
+        BibliographyStore(str(path))
+    assert "not a relaton-bib store" in str(excinfo.value)
@@ -0,0 +1,97 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+from lxml import etree
+
+from relaton_bib import from_xml
+from relaton_bib import xml_backend
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples")
+GRAMMAR = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "grammars", "biblio.rng")
+
+
+@pytest.fixture
+def backend():
+    current = xml_backend.backend()
+    yield xml_backend.use_backend
+    xml_backend.use_backend(current)
+
+
+def test_etree_is_default(backend):
+    assert backend() == xml_backend.ETREE
+    assert isinstance(xml_backend.Element("bibitem"), ET.Element)
+
+
+def test_control_characters(backend):
+    el = xml_backend.Element("title")
+    el.text = "a\x0bb"
+    assert xml_backend.tostring(el) == b"<title>a\x0bb</title>"
+
+    backend(xml_backend.LXML)
+    with pytest.raises(ValueError):
+        xml_backend.Element("title").text = "a\x0bb"
+
+
+def test_unknown_backend(backend):
+    with pytest.raises(ValueError):
+        backend("libxml3")
+
+
+def test_fallback_to_etree(backend, mocker):
+    mocker.patch.object(xml_backend, "_lxml", None)
+
+    assert backend() == xml_backend.ETREE
+    assert isinstance(xml_backend.Element("bibitem"), ET.Element)
+    with pytest.raises(ImportError):
+        backend(xml_backend.LXML)
+
+
+def test_sub_element_follows_parent(backend):
+    backend(xml_backend.LXML)
+    node = xml_backend.SubElement(ET.Element("bibitem"), "title")
+
+    assert isinstance(node, ET.Element)
+
+
+@pytest.mark.parametrize("name", ["bib_item.xml", "bibdata_item.xml"])
+@pytest.mark.parametrize("encoding", ["us-ascii", "unicode"])
+def test_identical_output(backend, name, encoding):
+    item = from_xml(ET.parse(os.path.join(EXAMPLES, name)))
+    bibdata = name == "bibdata_item.xml"
+
+    backend(xml_backend.ETREE)
+    expected = xml_backend.tostring(item.to_xml(opts={"bibdata": bibdata}),
+                                    encoding)
+    backend(xml_backend.LXML)
+    xml = item.to_xml(opts={"bibdata": bibdata})
+
+    assert xml_backend.is_lxml(xml)
+    assert xml_backend.tostring(xml, encoding) == expected
+
+
+def test_tostring_escapes(backend):
+    backend(xml_backend.LXML)
+    el = xml_backend.Element("note", {"type": "a\tb\r"})
+    el.text = "c\td\re"
+
+    assert xml_backend.tostring(el) == ET.tostring(
+        ET.fromstring(etree.tostring(el)))
+
+
+def test_parse_with_lxml(backend):
+    backend(xml_backend.LXML)
+    tree = xml_backend.parse(os.path.join(EXAMPLES, "bib_item.xml"))
+
+    assert xml_backend.is_tree(tree)
+    assert from_xml(tree) == from_xml(
+        ET.parse(os.path.join(EXAMPLES, "bib_item.xml")))
+
+
+def test_validate():
+    item = from_xml(ET.parse(os.path.join(EXAMPLES, "bib_item.xml")))
+
+    assert xml_backend.validate(item.to_xml(), GRAMMAR)
+    assert not xml_backend.validate(ET.Element("bibitem"), GRAMMAR)
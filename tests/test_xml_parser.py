@@ -1,9 +1,13 @@
+import io
 import os
 import logging
 import xml.etree.ElementTree as ET
 
+import pytest
+
 from . import elements_equal
-from relaton_bib import LocalityStack, SourceLocalityStack, from_xml
+from relaton_bib import LocalityStack, SourceLocalityStack, from_xml, \
+    iter_from_xml
 
 
 def test_creates_item_from_xml():
@@ -90,6 +94,21 @@ def test_ignore_empty_dates():
     assert len(item.date) == 0
 
 
+def test_person_without_name():
+    item_xml = """
+        <bibitem id="id">
+            <contributor>
+                <role type="author"/>
+                <person><email>x@example.com</email></person>
+            </contributor>
+        </bibitem>"""
+
+    # the name is required, the same error as for a name without surname
+    # or completename is raised instead of making a person without name
+    with pytest.raises(ValueError, match="surname or completename"):
+        from_xml(ET.fromstring(item_xml))
+
+
 def test_warn_if_XML_empty(caplog):
     item = None
     with caplog.at_level(logging.WARNING):
@@ -97,3 +116,46 @@ def test_warn_if_XML_empty(caplog):
 
     assert "can't find bibitem" in caplog.text
     assert item is None
+
+
+def test_iter_items_from_documents_collection():
+    xml = b"""
+        <documents>
+          <bibitem id="first">
+            <title type="main">First</title>
+            <relation type="updates">
+              <bibitem>
+                <formattedref format="text/plain">ISO 19115</formattedref>
+              </bibitem>
+            </relation>
+          </bibitem>
+          <bibdata id="second">
+            <title type="main">Second</title>
+          </bibdata>
+        </documents>"""
+    items = list(iter_from_xml(io.BytesIO(xml)))
+
+    assert [i.id for i in items] == ["first", "second"]
+    assert items[0].relation[0].bibitem.formattedref.content == "ISO 19115"
+
+
+def test_iter_items_from_file():
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bib_item.xml")
+
+    items = list(iter_from_xml(file))
+
+    assert len(items) == 1
+    assert elements_equal(ET.parse(file).getroot(), items[0].to_xml())
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_trusted(lazy):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        "bibdata_item.xml")
+    item = from_xml(ET.parse(file), lazy=lazy, trusted=True)
+
+    assert item == from_xml(ET.parse(file))
+    assert item.keyword[0].content == "Keyword"
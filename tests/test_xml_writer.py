@@ -0,0 +1,53 @@
+import io
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from relaton_bib import from_xml, write_xml
+from relaton_bib import xml_backend
+
+
+def _items(name):
+    file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "examples",
+                        name)
+    return [from_xml(ET.parse(file)) for _ in range(3)]
+
+
+@pytest.fixture
+def items():
+    return _items("bib_item.xml")
+
+
+def _documents(items, opts):
+    root = xml_backend.Element("documents")
+    for item in items:
+        item.to_xml(root, opts)
+    return root
+
+
+@pytest.mark.parametrize("name,bibdata", [("bib_item.xml", False),
+                                          ("bibdata_item.xml", True)])
+def test_write_binary(name, bibdata):
+    items = _items(name)
+    out = io.BytesIO()
+
+    assert write_xml(iter(items), out, {"bibdata": bibdata}) == 3
+    assert out.getvalue() == xml_backend.tostring(
+        _documents(items, {"bibdata": bibdata}))
+
+
+def test_write_text(items):
+    out = io.StringIO()
+    write_xml(items, out)
+
+    assert out.getvalue() == xml_backend.tostring(_documents(items, {}),
+                                                  encoding="unicode")
+
+
+def test_write_empty():
+    out = io.BytesIO()
+
+    assert write_xml([], out) == 0
+    assert out.getvalue() == ET.tostring(ET.Element("documents"))